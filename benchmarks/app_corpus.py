@@ -0,0 +1,194 @@
+"""Synthetic .app bundle corpus for scanning benchmarks on machines without /Applications.
+
+Bundles get XML or binary Info.plist files, real .icns containers (PNG
+payloads, 64-1024 px), a share of them sit in nested folders, and a share are
+deliberately broken the ways real installs are. A corpus.json manifest next
+to the bundles records what was generated.
+
+    python benchmarks/app_corpus.py OUTPUT_DIR [--count 1000] [--seed 1]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import plistlib
+import random
+import struct
+import zlib
+from pathlib import Path
+
+# (OSType, edge in px) of the PNG-based icns entries, smallest first.
+ICNS_TYPES = [
+    ("icp4", 16),
+    ("icp5", 32),
+    ("icp6", 64),
+    ("ic07", 128),
+    ("ic08", 256),
+    ("ic09", 512),
+    ("ic10", 1024),
+]
+# Largest icon edge per bundle and how often it occurs.
+ICON_TIERS = [(64, 0.2), (128, 0.3), (256, 0.3), (512, 0.15), (1024, 0.05)]
+NESTED_DIRS = ["Utilities", "Vendor Suite/Tools", "Games/Classic"]
+BROKEN_KINDS = [
+    "no-plist",
+    "corrupt-plist",
+    "missing-icon",
+    "truncated-icns",
+    "not-a-directory",
+    "dangling-symlink",
+]
+
+_ADJECTIVES = ["Quick", "Smart", "Open", "Pro", "Tiny", "Deep", "Bright", "Swift", "Calm", "Night"]
+_NOUNS = ["Notes", "Mail", "Editor", "Viewer", "Studio", "Sync", "Terminal", "Player", "Paint", "写真"]
+_VARIANTS_PER_SIZE = 3
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def make_png(size: int, rng: random.Random, noise: float = 0.1) -> bytes:
+    """RGBA PNG of flat rows with a `noise` share of random rows, so sizes vary like real art."""
+    flat = bytes(rng.randrange(256) for _ in range(4)) * size
+    raw = bytearray()
+    for _ in range(size):
+        raw.append(0)  # filter: none
+        raw += rng.randbytes(size * 4) if rng.random() < noise else flat
+    header = struct.pack(">IIBBBBB", size, size, 8, 6, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + _png_chunk(b"IHDR", header)
+        + _png_chunk(b"IDAT", zlib.compress(bytes(raw), 6))
+        + _png_chunk(b"IEND", b"")
+    )
+
+
+def make_icns(max_size: int, pngs: dict[int, list[bytes]], rng: random.Random) -> bytes:
+    body = b""
+    for ostype, size in ICNS_TYPES:
+        if size > max_size:
+            break
+        png = rng.choice(pngs[size])
+        body += ostype.encode() + struct.pack(">I", len(png) + 8) + png
+    return b"icns" + struct.pack(">I", len(body) + 8) + body
+
+
+def _info_plist(name: str, index: int, icon_file: str, rng: random.Random) -> dict:
+    plist = {
+        "CFBundleName": name,
+        "CFBundleDisplayName": name,
+        "CFBundleIdentifier": f"com.example.{rng.choice(_NOUNS).lower()}{index}",
+        "CFBundleExecutable": name.replace(" ", ""),
+        "CFBundleIconFile": icon_file,
+        "CFBundlePackageType": "APPL",
+        "CFBundleShortVersionString": f"{rng.randrange(1, 20)}.{rng.randrange(10)}",
+        "LSMinimumSystemVersion": "11.0",
+        "NSHumanReadableCopyright": f"Copyright (c) {name} authors",
+    }
+    # Real plists range from a dozen keys to large document-type tables.
+    plist["CFBundleDocumentTypes"] = [
+        {"CFBundleTypeName": f"Document {i}", "LSItemContentTypes": [f"public.type{i}"]}
+        for i in range(rng.choice([0, 0, 2, 8, 40]))
+    ]
+    return plist
+
+
+def _write_bundle(bundle: Path, plist: dict | None, binary: bool, icns: bytes | None) -> None:
+    contents = bundle / "Contents"
+    resources = contents / "Resources"
+    resources.mkdir(parents=True, exist_ok=True)
+    (contents / "MacOS").mkdir(exist_ok=True)
+    if plist is not None:
+        fmt = plistlib.FMT_BINARY if binary else plistlib.FMT_XML
+        with open(contents / "Info.plist", "wb") as f:
+            plistlib.dump(plist, f, fmt=fmt)
+    if icns is not None:
+        icon_file = plist.get("CFBundleIconFile", "AppIcon") if plist else "AppIcon"
+        if not icon_file.endswith(".icns"):
+            icon_file += ".icns"
+        (resources / icon_file).write_bytes(icns)
+
+
+def generate_corpus(
+    root: Path,
+    count: int,
+    seed: int = 1,
+    nested: float = 0.15,
+    broken: float = 0.05,
+) -> dict:
+    rng = random.Random(seed)
+    pngs = {
+        size: [make_png(size, rng) for _ in range(_VARIANTS_PER_SIZE)]
+        for _, size in ICNS_TYPES
+    }
+    tiers, weights = zip(*ICON_TIERS)
+    root.mkdir(parents=True, exist_ok=True)
+
+    entries = []
+    for index in range(count):
+        name = f"{rng.choice(_ADJECTIVES)} {rng.choice(_NOUNS)} {index}"
+        folder = root / rng.choice(NESTED_DIRS) if rng.random() < nested else root
+        folder.mkdir(parents=True, exist_ok=True)
+        bundle = folder / f"{name}.app"
+        binary = rng.random() < 0.5
+        max_size = rng.choices(tiers, weights)[0]
+        # Half the plists name the icon without its extension, as Xcode writes it.
+        icon_file = "AppIcon" if rng.random() < 0.5 else "AppIcon.icns"
+        plist = _info_plist(name, index, icon_file, rng)
+        kind = rng.choice(BROKEN_KINDS) if rng.random() < broken else "ok"
+
+        if kind == "ok":
+            _write_bundle(bundle, plist, binary, make_icns(max_size, pngs, rng))
+        elif kind == "no-plist":
+            _write_bundle(bundle, None, binary, make_icns(max_size, pngs, rng))
+        elif kind == "corrupt-plist":
+            _write_bundle(bundle, None, binary, make_icns(max_size, pngs, rng))
+            (bundle / "Contents" / "Info.plist").write_bytes(b"bplist00\x00garbage" if binary else b"<?xml <plist")
+        elif kind == "missing-icon":
+            _write_bundle(bundle, {**plist, "CFBundleIconFile": "Gone.icns"}, binary, None)
+        elif kind == "truncated-icns":
+            icns = make_icns(max_size, pngs, rng)
+            _write_bundle(bundle, plist, binary, icns[: len(icns) // 3])
+        elif kind == "not-a-directory":
+            bundle.write_bytes(b"")
+        elif kind == "dangling-symlink":
+            os.symlink(root / ".missing" / f"{index}.app", bundle)
+
+        entries.append(
+            {
+                "path": str(bundle.relative_to(root)),
+                "kind": kind,
+                "plist": "binary" if binary else "xml",
+                "icon_max": max_size,
+                "nested": folder != root,
+            }
+        )
+
+    manifest = {"count": count, "seed": seed, "bundles": entries}
+    (root / "corpus.json").write_text(json.dumps(manifest, indent=1, ensure_ascii=False))
+    return manifest
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--nested", type=float, default=0.15, help="share of bundles in subfolders")
+    parser.add_argument("--broken", type=float, default=0.05, help="share of broken bundles")
+    args = parser.parse_args(argv)
+
+    manifest = generate_corpus(args.output, args.count, args.seed, args.nested, args.broken)
+    kinds: dict[str, int] = {}
+    for entry in manifest["bundles"]:
+        kinds[entry["kind"]] = kinds.get(entry["kind"], 0) + 1
+    size = sum(f.stat().st_size for f in args.output.rglob("*") if f.is_file() and not f.is_symlink())
+    print(f"{args.count} bundles in {args.output} ({size / 1e6:.1f} MB): {kinds}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
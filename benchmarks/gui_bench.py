@@ -0,0 +1,358 @@
+"""GUI benchmarks for the four window variants on the offscreen platform.
+
+For synthetic catalogs of each size, measures building the window, rebuilding
+the ring from scratch (create_circle_buttons), one synchronous repaint,
+opening the favorites dialog and saving it. It also counts the pixels
+repainted per second, once any ring transition is over, while the window
+idles with its animation running and the pointer sweeps over the ring. Everything runs against a throwaway HOME and working
+directory, so the real config is never touched.
+
+    python benchmarks/gui_bench.py [--sizes 10 100 1000 10000] [--output run.json]
+    python benchmarks/gui_bench.py --compare baseline.json [--threshold 1.2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import plistlib
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+DEFAULT_FAVORITES = 12
+DEFAULT_REPEAT = 5
+DEFAULT_REPAINT_SECONDS = 1.0
+# Pointer moves per second during the repaint sweep.
+SWEEP_RATE = 50
+VARIANTS = ["main", "main_modern", "main_safe", "main_original"]
+
+# module, window class, settings dialog class
+_VARIANT_CLASSES = {
+    "main": ("pi_menu.main", "PiMenu", "FavoriteSettings"),
+    "main_modern": ("pi_menu.main_modern", "ModernPiMenu", "ModernFavoriteSettings"),
+    "main_safe": ("pi_menu.main_safe", "SafePiMenu", "SafeFavoriteSettings"),
+    "main_original": ("pi_menu.main_original", "PiMenu", "FavoriteSettings"),
+}
+
+
+def write_icon_bundle(bundle: Path, color) -> None:
+    from PyQt6.QtGui import QColor, QImage
+
+    resources = bundle / "Contents" / "Resources"
+    resources.mkdir(parents=True, exist_ok=True)
+    with open(bundle / "Contents" / "Info.plist", "wb") as f:
+        plistlib.dump({"CFBundleName": bundle.stem, "CFBundleIconFile": "icon.png"}, f)
+    image = QImage(128, 128, QImage.Format.Format_ARGB32)
+    image.fill(QColor(*color))
+    image.save(str(resources / "icon.png"))
+
+
+def write_catalog(config_path: Path, apps_dir: Path, size: int, favorites: int) -> None:
+    apps = []
+    step = max(1, size // max(1, favorites))
+    for i in range(size):
+        bundle = apps_dir / f"App {i:05d}.app"
+        favorite = i % step == 0 and i // step < favorites
+        if favorite:
+            write_icon_bundle(bundle, ((i * 67) % 256, (i * 131) % 256, (i * 29) % 256))
+        apps.append({"name": bundle.stem, "command": f"open {bundle}", "icon": "", "favorite": favorite})
+    config_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(config_path, "w") as f:
+        json.dump({"apps": apps}, f, indent=4, ensure_ascii=False)
+
+
+def measure(fn, repeat: int, between=None) -> dict:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+        if between is not None:
+            between()
+    return {
+        "min_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "repeat": repeat,
+    }
+
+
+def region_pixels(region, size) -> int:
+    # QRegion exposes no rects in PyQt6; rasterize it and count the covered pixels.
+    from PyQt6.QtGui import QColor, QImage, QPainter
+
+    image = QImage(size, QImage.Format.Format_Grayscale8)
+    image.fill(0)
+    painter = QPainter(image)
+    painter.setClipRegion(region)
+    painter.fillRect(image.rect(), QColor(255, 255, 255))
+    painter.end()
+    return image.constBits().asstring(image.sizeInBytes()).count(255)
+
+
+def measure_repaints(app, window, seconds: float) -> dict:
+    import math
+
+    from PyQt6.QtCore import QEvent, QObject, QPoint, QPointF, Qt
+    from PyQt6.QtGui import QMouseEvent
+
+    class PaintCounter(QObject):
+        def __init__(self):
+            super().__init__()
+            self.paints = 0
+            self.pixels = 0
+
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Paint and obj.isWidgetType() and obj.window() is window:
+                self.paints += 1
+                self.pixels += region_pixels(event.region(), obj.size())
+            return False
+
+    def move_pointer(angle: float) -> None:
+        radius = min(window.width(), window.height()) / 3
+        pos = QPoint(
+            int(window.width() / 2 + radius * math.cos(angle)),
+            int(window.height() / 2 + radius * math.sin(angle)),
+        )
+        target = window.childAt(pos) or window
+        local = QPointF(target.mapFrom(window, pos))
+        event = QMouseEvent(
+            QEvent.Type.MouseMove,
+            local,
+            QPointF(target.mapToGlobal(local)),
+            Qt.MouseButton.NoButton,
+            Qt.MouseButton.NoButton,
+            Qt.KeyboardModifier.NoModifier,
+        )
+        app.sendEvent(target, event)
+
+    counter = PaintCounter()
+    app.processEvents()
+    app.installEventFilter(counter)
+    start = time.perf_counter()
+    next_move = start
+    moves = 0
+    while (now := time.perf_counter()) - start < seconds:
+        if now >= next_move:
+            # One lap around the ring per second.
+            move_pointer(2 * math.pi * moves / SWEEP_RATE)
+            moves += 1
+            next_move += 1 / SWEEP_RATE
+        app.processEvents()
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - start
+    app.removeEventFilter(counter)
+
+    area = window.width() * window.height()
+    return {
+        "px_per_s": round(counter.pixels / elapsed),
+        "paints_per_s": round(counter.paints / elapsed, 1),
+        # Average share of the window one paint event covered.
+        "share": round(counter.pixels / (counter.paints * area), 4) if counter.paints else 0.0,
+        "seconds": round(elapsed, 2),
+    }
+
+
+def bench_variant(app, name: str, config_path: Path, repeat: int, repaint_seconds: float) -> dict:
+    import importlib
+
+    module_name, window_name, dialog_name = _VARIANT_CLASSES[name]
+    module = importlib.import_module(module_name)
+    window_cls = getattr(module, window_name)
+    dialog_cls = getattr(module, dialog_name)
+
+    def flush():
+        # Old ring buttons are deleteLater()'d; reap them outside the timing.
+        app.sendPostedEvents(None, 0)
+        app.processEvents()
+
+    def construct():
+        if name == "main":
+            return window_cls(use_snapshot=False)
+        return window_cls()
+
+    windows = []
+    results = {"construct": measure(lambda: windows.append(construct()), repeat, flush)}
+    for extra in windows[1:]:
+        extra.deleteLater()
+    window = windows[0]
+    window.show()
+    flush()
+
+    def forget_ring():
+        # Unchanged favorites would otherwise short-circuit the rebuild: the
+        # legacy variants compare button_keys, main matches the items it has.
+        if name == "main":
+            window.ring_items = []
+        else:
+            window.button_keys = None
+        flush()
+
+    forget_ring()
+    results["create_circle_buttons"] = measure(window.create_circle_buttons, repeat, forget_ring)
+    window.create_circle_buttons()
+    window.repaint()  # first paint builds the cached layers; measure steady state
+    results["paint"] = measure(window.repaint, repeat)
+
+    dialogs = []
+
+    def open_dialog():
+        if name == "main":
+            dialogs.append(dialog_cls(config_path, window, theme=window.theme))
+        else:
+            dialogs.append(dialog_cls(str(config_path), window))
+
+    repaints = None
+    if repaint_seconds > 0:
+        # A ring transition still running would count its full-window frames.
+        if name == "main":
+            window.finish_transition()
+        flush()
+        repaints = measure_repaints(app, window, repaint_seconds)
+
+    results["open_settings"] = measure(open_dialog, repeat, flush)
+    results["save_favorites"] = measure(dialogs[0].save_favorites, repeat)
+    for dialog in dialogs:
+        dialog.deleteLater()
+    window.hide()
+    window.deleteLater()
+    flush()
+    return results, repaints
+
+
+def run(
+    sizes: list[int], variants: list[str], favorites: int, repeat: int, repaint_seconds: float
+) -> tuple[dict, dict]:
+    from PyQt6.QtWidgets import QApplication
+
+    from pi_menu.core.paths import config_file_path
+
+    app = QApplication.instance() or QApplication([sys.argv[0]])
+    results = {}
+    repaints = {}
+    cwd = os.getcwd()
+    home_config = config_file_path()
+    with tempfile.TemporaryDirectory(prefix="pi-menu-bench-") as tmp:
+        root = Path(tmp)
+        os.chdir(root)
+        for size in sizes:
+            apps_dir = root / f"apps-{size}"
+            write_catalog(home_config, apps_dir, size, favorites)
+            # The legacy variants read ./config.json.
+            (root / "config.json").write_bytes(home_config.read_bytes())
+            for variant in variants:
+                config_path = home_config if variant == "main" else root / "config.json"
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    cases, repaint = bench_variant(app, variant, config_path, repeat, repaint_seconds)
+                for case, stats in cases.items():
+                    results[f"{variant}/{size}/{case}"] = stats
+                if repaint is not None:
+                    repaints[f"{variant}/{size}"] = repaint
+                print(
+                    f"{variant:14} {size:6} apps  done in {time.perf_counter() - start:6.2f} s",
+                    file=sys.stderr,
+                )
+        os.chdir(cwd)
+    return results, repaints
+
+
+def compare(
+    baseline: dict, current: dict, threshold: float, metric: str = "median_ms", unit: str = "ms"
+) -> tuple[str, int]:
+    lines = [f"{'case':44} {'base ' + unit:>11} {'now ' + unit:>11} {'ratio':>7}"]
+    regressions = 0
+    for key, stats in current.items():
+        old = baseline.get(key)
+        if old is None or metric not in old:
+            lines.append(f"{key:44} {'-':>11} {stats[metric]:11.2f}")
+            continue
+        if old[metric]:
+            ratio = stats[metric] / old[metric]
+        else:
+            ratio = 1.0 if not stats[metric] else float("inf")
+        flag = ""
+        if ratio > threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        lines.append(f"{key:44} {old[metric]:11.2f} {stats[metric]:11.2f} {ratio:6.2f}x{flag}")
+    return "\n".join(lines), regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--variants", nargs="+", choices=VARIANTS, default=VARIANTS)
+    parser.add_argument("--favorites", type=int, default=DEFAULT_FAVORITES)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument(
+        "--repaint-seconds",
+        type=float,
+        default=DEFAULT_REPAINT_SECONDS,
+        help="how long to count repainted pixels per variant and size (0 skips it)",
+    )
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--compare", type=Path, help="baseline JSON from an earlier --output")
+    parser.add_argument("--threshold", type=float, default=1.2, help="median ratio counted as a regression")
+    args = parser.parse_args(argv)
+
+    # Set up before Qt or pi_menu is imported: no display, and a private HOME
+    # so PiMenu reads the synthetic catalog and writes no snapshot next to the
+    # real one.
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, str(REPO_ROOT))
+
+    with tempfile.TemporaryDirectory(prefix="pi-menu-bench-home-") as home:
+        os.environ["HOME"] = home
+        results, repaints = run(
+            args.sizes, args.variants, args.favorites, args.repeat, args.repaint_seconds
+        )
+
+    document = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "qpa": os.environ.get("QT_QPA_PLATFORM"),
+            "favorites": args.favorites,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+        "repaints": repaints,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(document, indent=2) + "\n")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        report, regressions = compare(baseline["results"], results, args.threshold)
+        print(report)
+        if repaints:
+            report, repaint_regressions = compare(
+                baseline.get("repaints", {}), repaints, args.threshold, "px_per_s", "px/s"
+            )
+            print()
+            print(report)
+            regressions += repaint_regressions
+        return 1 if regressions else 0
+
+    for key, stats in results.items():
+        print(f"{key:44} {stats['median_ms']:9.2f} ms  (min {stats['min_ms']:.2f})")
+    for key, stats in repaints.items():
+        print(
+            f"{key + '/repaint':44} {stats['px_per_s']:11,} px/s  "
+            f"{stats['paints_per_s']:5.1f} paints/s  {stats['share']:.1%} of the window per paint"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,81 @@
+"""Import-time budget for the Qt-free modules.
+
+Fails (exit status 1) when importing pi_menu.core -- or the IPC client
+entry points built on it -- pulls in PyQt6, or takes longer than the budget.
+Each check runs in a fresh interpreter so earlier imports cannot hide costs.
+
+    python benchmarks/import_budget.py [--budget-ms 50]
+
+tests/test_import_budget.py runs the same check under pytest.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BUDGET_MS = 50.0
+
+QT_FREE_MODULES = [
+    "pi_menu.core",
+    "pi_menu.core.paths",
+    "pi_menu.core.catalog",
+    "pi_menu.core.commands",
+    "pi_menu.core.layout",
+    "pi_menu.core.launch",
+    "pi_menu.core.frecency",
+    "pi_menu.ipc",
+    "pi_menu.profiling",
+    "pi_menu.tracing",
+    "pi_menu.quality",
+    "pi_menu.ctl",
+    "pi_menu.app",
+]
+
+_PROBE = """
+import importlib, json, sys, time
+start = time.perf_counter()
+importlib.import_module({module!r})
+elapsed = (time.perf_counter() - start) * 1000
+qt = sorted(m for m in sys.modules if m.split(".")[0] in ("PyQt6", "PyQt5", "PySide6", "sip"))
+print(json.dumps({{"ms": elapsed, "qt": qt}}))
+"""
+
+
+def measure(module: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS)
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for module in QT_FREE_MODULES:
+        probe = measure(module)
+        problems = []
+        if probe["qt"]:
+            problems.append(f"imports Qt: {', '.join(probe['qt'][:3])}")
+        if probe["ms"] > args.budget_ms:
+            problems.append(f"over budget ({args.budget_ms:.0f} ms)")
+        status = "FAIL" if problems else "ok"
+        print(f"{status:4} {module:24} {probe['ms']:7.2f} ms  {'; '.join(problems)}")
+        failures += bool(problems)
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
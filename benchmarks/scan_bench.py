@@ -0,0 +1,142 @@
+"""Catalog-scan throughput over a synthetic .app corpus, cold and warm.
+
+Times get_mac_apps, icon_path_for_app for every bundle found, and a full
+generate_config, reporting bundles/sec. "Cold" runs evict the corpus from the
+page cache with posix_fadvise(POSIX_FADV_DONTNEED) before each timing; the
+dentry/inode caches stay warm, so cold numbers are a lower bound on a real
+first scan. Platforms without posix_fadvise (macOS) report warm runs only.
+
+get_mac_apps, like the app, only looks at the top level of the folder, so the
+bundles the corpus puts in subfolders are not scanned. Throughput is per
+bundle found; the report gives both counts, and --nested 0 makes a flat
+corpus where they match.
+
+    python benchmarks/scan_bench.py [--count 1000] [--nested 0] [--corpus DIR] [--output run.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from app_corpus import generate_corpus
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from pi_menu.core.commands import icon_path_for_app  # noqa: E402
+from pi_menu.generate_configfile import generate_config, get_mac_apps  # noqa: E402
+
+
+def drop_file_cache(root: Path) -> bool:
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    os.sync()  # dirty pages cannot be dropped
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for filename in filenames:
+            try:
+                fd = os.open(os.path.join(dirpath, filename), os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+            finally:
+                os.close(fd)
+    return True
+
+
+def _stages(root: Path, config_path: Path) -> dict:
+    def scan():
+        return get_mac_apps(root)
+
+    def icons():
+        for app in get_mac_apps(root):
+            icon_path_for_app(app["command"])
+
+    def config():
+        config_path.unlink(missing_ok=True)
+        with contextlib.redirect_stdout(io.StringIO()):
+            generate_config(config_path, root)
+
+    return {"get_mac_apps": scan, "icon_path_for_app": icons, "generate_config": config}
+
+
+def run(root: Path, repeat: int) -> dict:
+    manifest = json.loads((root / "corpus.json").read_text())
+    generated = manifest["count"]
+    nested = sum(1 for entry in manifest["bundles"] if entry["nested"])
+    found = len(get_mac_apps(root))
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="pi-menu-scan-") as tmp:
+        stages = _stages(root, Path(tmp) / "config.json")
+        for mode in ("cold", "warm"):
+            if mode == "cold" and not hasattr(os, "posix_fadvise"):
+                continue
+            for name, stage in stages.items():
+                stage()  # warm-up, and fills the cache for the warm runs
+                samples = []
+                for _ in range(repeat):
+                    if mode == "cold":
+                        drop_file_cache(root)
+                    start = time.perf_counter()
+                    stage()
+                    samples.append(time.perf_counter() - start)
+                median = statistics.median(samples)
+                results[f"{mode}/{name}"] = {
+                    "median_ms": round(median * 1000, 3),
+                    "min_ms": round(min(samples) * 1000, 3),
+                    "bundles": found,
+                    "generated": generated,
+                    "nested_skipped": nested,
+                    "bundles_per_s": round(found / median, 1) if median else None,
+                    "repeat": repeat,
+                }
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--nested",
+        type=float,
+        default=0.15,
+        help="share of bundles in subfolders, which are not scanned",
+    )
+    parser.add_argument("--corpus", type=Path, help="reuse (or create) a corpus here instead of a temp dir")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    args = parser.parse_args(argv)
+
+    with contextlib.ExitStack() as stack:
+        root = args.corpus
+        if root is None:
+            root = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="pi-menu-corpus-")))
+        if not (root / "corpus.json").exists():
+            start = time.perf_counter()
+            generate_corpus(root, args.count, args.seed, args.nested)
+            print(f"generated {args.count} bundles in {time.perf_counter() - start:.1f} s", file=sys.stderr)
+        results = run(root, args.repeat)
+
+    if args.output:
+        args.output.write_text(json.dumps({"results": results}, indent=2) + "\n")
+    for key, stats in results.items():
+        print(
+            f"{key:28} {stats['median_ms']:9.2f} ms  {stats['bundles_per_s'] or 0:10.0f} bundles/s"
+            f"  ({stats['bundles']} of {stats['generated']} bundles found,"
+            f" {stats['nested_skipped']} nested ones skipped)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
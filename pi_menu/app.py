@@ -1,26 +1,127 @@
 from __future__ import annotations
 
-from pathlib import Path
+import argparse
+import sys
 
-from . import generate_configfile
-from .main import PiMenu
+from . import generate_configfile, ipc
+from .core.paths import config_file_path, profiles_dir
+from .profiling import startup_profiler
 
-from PyQt6.QtWidgets import QApplication
-import sys
+# PyQt6 and the widget modules are imported lazily: when an instance is
+# already running, this process only forwards a message and exits.
+
+_CLIENT_COMMANDS = ("show", "toggle", "hide", "quit")
 
 
 def _ensure_config_exists() -> None:
-    config_path = Path.home() / "Library" / "Application Support" / "PiMenu" / "config.json"
+    config_path = config_file_path()
     if config_path.exists():
         return
     generate_configfile.generate_config(config_path)
 
 
-def main() -> int:
-    _ensure_config_exists()
-    app = QApplication(sys.argv)
-    ex = PiMenu()
-    ex.show()
+def _parse_args(argv: list[str]) -> tuple[argparse.Namespace, list[str]]:
+    parser = argparse.ArgumentParser(prog="pi-menu")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--show", action="store_true", help="show the running menu (start it if needed)")
+    group.add_argument("--toggle", action="store_true", help="toggle the running menu (start it if needed)")
+    group.add_argument("--hide", action="store_true", help="hide the running menu")
+    group.add_argument("--quit", action="store_true", help="stop the running instance")
+    group.add_argument("--resident", action="store_true", help="start hidden and stay resident")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="write a startup phase timeline (also: PI_MENU_PROFILE_STARTUP=1)",
+    )
+    # Anything unrecognised is passed on to QApplication (e.g. -platform).
+    return parser.parse_known_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    args, qt_args = _parse_args(argv)
+    profiler = startup_profiler
+    if args.profile_startup:
+        profiler.enable()
+
+    command = next((c for c in _CLIENT_COMMANDS if getattr(args, c)), None)
+    with profiler.phase("ipc forward"):
+        forwarded = not args.resident and ipc.send_message(command or "show")
+    if forwarded:
+        profiler.mark("forwarded to running instance")
+        profiler.write(profiles_dir())
+        return 0
+    if command in ("hide", "quit"):
+        # Nothing is running, so there is nothing to hide or stop.
+        return 0
+
+    with profiler.phase("_ensure_config_exists"):
+        _ensure_config_exists()
+
+    with profiler.phase("setup_logging"):
+        from .logconfig import setup_logging
+
+        listener = setup_logging()
+    try:
+        return _run_instance(args, qt_args, command)
+    finally:
+        # Flushes queued records before the interpreter exits.
+        listener.stop()
+
+
+def _run_instance(args: argparse.Namespace, qt_args: list[str], command: str | None) -> int:
+    profiler = startup_profiler
+    with profiler.phase("import PyQt6"):
+        from PyQt6.QtCore import QTimer
+        from PyQt6.QtWidgets import QApplication
+    with profiler.phase("import widgets"):
+        from .control import ControlApi
+        from .main import PiMenu
+        from .resident import ResidentServer
+        from .watchdog import StallWatchdog, stall_log_path
+
+    # --show/--toggle with no running instance start one that stays resident.
+    resident = args.resident or command is not None
+
+    with profiler.phase("QApplication"):
+        app = QApplication([sys.argv[0], *qt_args])
+        app.setQuitOnLastWindowClosed(not resident)
+
+    with profiler.phase("PiMenu()"):
+        ex = PiMenu()
+    ex.resident = resident
+    app.aboutToQuit.connect(ex.save_snapshot)
+    app.aboutToQuit.connect(ex.icon_prefetcher.stop)
+
+    watchdog = None
+    if StallWatchdog.enabled_by_env():
+        watchdog = StallWatchdog(stall_log_path())
+        # Idle until the menu is first shown; a hidden resident costs nothing.
+        watchdog.start(app, active=ex.isVisible())
+        ex.visibility_changed.connect(watchdog.set_active)
+        app.aboutToQuit.connect(watchdog.stop)
+
+    with profiler.phase("ResidentServer.listen"):
+        server = ResidentServer(ipc.socket_path(), ControlApi(ex, watchdog))
+        listening = server.listen()
+    if not listening and ipc.send_message(command or "show"):
+        # Lost a start-up race against another instance; defer to it.
+        return 0
+    app.aboutToQuit.connect(server.close)
+
+    if args.resident:
+        with profiler.phase("warm_caches"):
+            ex.warm_caches()
+        profiler.write(profiles_dir())
+    else:
+        if profiler.enabled:
+            # Let the post-snapshot reconcile run before the report is written.
+            ex.first_frame_shown.connect(
+                lambda: QTimer.singleShot(100, lambda: profiler.write(profiles_dir()))
+            )
+        with profiler.phase("show"):
+            ex.show_menu()
     return app.exec()
 
 
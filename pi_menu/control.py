@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import inspect
+import time
+
+from PyQt6.QtWidgets import QApplication
+
+from .core.catalog import is_folder, profile_apps, profile_names, write_config
+from .core.paths import profiles_dir
+from .ipc import RpcError
+from .main import PiMenu
+from .tracing import tracer
+from .watchdog import StallWatchdog
+
+SEARCH_LIMIT = 20
+
+
+class ControlApi:
+    """JSON-RPC methods served by a running PiMenu, answered from its in-memory state."""
+
+    def __init__(self, menu: PiMenu, watchdog: StallWatchdog | None = None):
+        self.menu = menu
+        self.watchdog = watchdog
+        self.started_at = time.monotonic()
+        self._index_source = None
+        self._index: list[tuple[str, dict]] = []
+        self._methods = {
+            "show": self.show,
+            "toggle": self.toggle,
+            "hide": self.hide,
+            "quit": self.quit,
+            "search": self.search,
+            "launch": self.launch,
+            "list_favorites": self.list_favorites,
+            "set_favorite": self.set_favorite,
+            "reload": self.reload,
+            "stats": self.stats,
+            "trace": self.trace,
+            "hud": self.hud,
+            "profile": self.profile,
+        }
+
+    def __call__(self, method: str, params: dict):
+        handler = self._methods.get(method)
+        if handler is None:
+            raise RpcError(RpcError.METHOD_NOT_FOUND, f"unknown method: {method}")
+        # Check the params against the signature, so a TypeError raised inside
+        # a handler is reported as the bug it is, not as a client error.
+        try:
+            inspect.signature(handler).bind(**params)
+        except TypeError as e:
+            raise RpcError(RpcError.INVALID_PARAMS, str(e)) from None
+        return handler(**params)
+
+    def _search_index(self) -> list[tuple[str, dict]]:
+        # Lowercased names are rebuilt only when the catalog object is replaced.
+        catalog = self.menu.catalog
+        if catalog is not self._index_source:
+            self._index = [(app.get("name", "").lower(), app) for app in catalog]
+            self._index_source = catalog
+        return self._index
+
+    def _find_app(self, name: str | None, command: str | None) -> dict:
+        for app in self.menu.catalog:
+            if (command and app.get("command") == command) or (name and app.get("name") == name):
+                return app
+        raise RpcError(RpcError.APP_ERROR, f"no such app: {name or command}")
+
+    @staticmethod
+    def _summary(app: dict) -> dict:
+        return {
+            "name": app.get("name", ""),
+            "command": app.get("command", ""),
+            "favorite": bool(app.get("favorite", False)),
+        }
+
+    def show(self):
+        self.menu.show_menu()
+        return True
+
+    def toggle(self):
+        self.menu.toggle_menu()
+        return self.menu.isVisible()
+
+    def hide(self):
+        self.menu.hide()
+        return True
+
+    def quit(self):
+        QApplication.quit()
+        return True
+
+    def search(self, query: str, limit: int = SEARCH_LIMIT):
+        needle = query.lower().strip()
+        if not needle:
+            return []
+        ranked = []
+        for position, (name, app) in enumerate(self._search_index()):
+            found = name.find(needle)
+            if found < 0:
+                continue
+            # Prefix matches first, then word-start matches, then the rest.
+            if found == 0:
+                rank = 0
+            elif not name[found - 1].isalnum():
+                rank = 1
+            else:
+                rank = 2
+            ranked.append((rank, position, app))
+        ranked.sort(key=lambda entry: entry[:2])
+        return [self._summary(app) for _, _, app in ranked[:limit]]
+
+    def launch(self, name: str | None = None, command: str | None = None):
+        app = self._find_app(name, command)
+        if is_folder(app):
+            raise RpcError(RpcError.APP_ERROR, f"{app.get('name', '')} is a folder")
+        self.menu.launch_app(app["command"])
+        return self._summary(app)
+
+    def list_favorites(self):
+        return [self._summary(app) for app in self.menu.favorite_apps]
+
+    def set_favorite(self, favorite: bool, name: str | None = None, command: str | None = None):
+        app = self._find_app(name, command)
+        if bool(app.get("favorite", False)) != bool(favorite):
+            app["favorite"] = bool(favorite)
+            write_config(self.menu.config_file, self.menu.config)
+            self.menu.favorite_apps = profile_apps(self.menu.config, self.menu.profile)
+            self.menu.create_circle_buttons()
+        return self._summary(app)
+
+    def reload(self):
+        self.menu.theme_watcher.reload()
+        self.menu.load_favorites()
+        self.menu.create_circle_buttons()
+        return {"catalog": len(self.menu.catalog), "favorites": len(self.menu.favorite_apps)}
+
+    def stats(self):
+        menu = self.menu
+        cache = menu.icon_cache
+        lookups = cache.hits + cache.misses
+        return {
+            "uptime_s": round(time.monotonic() - self.started_at, 3),
+            "visible": menu.isVisible(),
+            "catalog": len(menu.catalog),
+            "favorites": len(menu.favorite_apps),
+            "icon_cache": {
+                "hits": cache.hits,
+                "misses": cache.misses,
+                "hit_rate": round(cache.hits / lookups, 4) if lookups else None,
+                "bytes": cache.used_bytes,
+                "budget_bytes": cache.budget_bytes,
+            },
+            "icon_prefetch": menu.icon_prefetcher.stats(),
+            "atlases": {f"{dpr:g}": len(atlas.rects) for dpr, atlas in menu._atlases.items()},
+            "quality": menu.quality.stats(),
+            "profile": {"active": menu.profile, "warm": list(menu._profile_rings)},
+            "selection": menu.frame_stats.selection_summary(),
+            "stalls": (
+                {"count": self.watchdog.count, "worst_ms": self.watchdog.worst_ms}
+                if self.watchdog is not None
+                else None
+            ),
+        }
+
+    def trace(self, action: str = "dump"):
+        if action == "start":
+            tracer.start()
+        elif action == "stop":
+            tracer.stop()
+        elif action == "clear":
+            tracer.clear()
+        elif action == "dump":
+            try:
+                path = tracer.dump(profiles_dir())
+            except OSError as e:
+                raise RpcError(RpcError.APP_ERROR, f"failed to write trace: {e}") from None
+            return {"enabled": tracer.enabled, "events": len(tracer), "path": str(path)}
+        else:
+            raise RpcError(RpcError.INVALID_PARAMS, f"unknown trace action: {action}")
+        return {"enabled": tracer.enabled, "events": len(tracer)}
+
+    def hud(self, visible: bool | None = None):
+        if visible is None or bool(visible) != (self.menu.hud is not None):
+            self.menu.toggle_hud()
+        return self.menu.hud is not None
+
+    def profile(self, name: str | None = None):
+        if name is not None and not self.menu.switch_profile(name):
+            raise RpcError(RpcError.APP_ERROR, f"no such profile: {name}")
+        return {"active": self.menu.profile, "profiles": profile_names(self.menu.config)}
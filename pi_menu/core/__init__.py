@@ -0,0 +1,3 @@
+# Qt-free core of Pi Menu: paths, catalog/config I/O, command parsing, ring
+# layout math, app launching and launch frecency. Nothing under pi_menu.core
+# may import PyQt6; benchmarks/import_budget.py enforces this.
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+# The profile made of the catalog's ``favorite`` flags, edited in the settings dialog.
+DEFAULT_PROFILE = "favorites"
+
+
+def load_config(config_file: Path) -> dict | None:
+    if not config_file.exists():
+        return None
+    with open(config_file, "r") as file:
+        return json.load(file)
+
+
+def write_config(config_file: Path, data: dict) -> None:
+    config_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(config_file, "w") as file:
+        json.dump(data, file, indent=4, ensure_ascii=False)
+
+
+def is_folder(app: dict) -> bool:
+    return isinstance(app.get("folder"), list)
+
+
+def entry_key(app: dict) -> str:
+    """Stable identity of a ring entry: its command, or its name for a folder."""
+    if is_folder(app):
+        return "folder:" + app.get("name", "")
+    return app.get("command", "")
+
+
+def folder_apps(folder: dict, catalog: list[dict]) -> list[dict]:
+    """Children of a folder entry: catalog apps given by command, or inline entries.
+
+        {"name": "Dev", "favorite": true,
+         "folder": ["open /Applications/Xcode.app", {"name": "Logs", "command": "..."}]}
+    """
+    by_command = {app["command"]: app for app in catalog if "command" in app}
+    children = []
+    for entry in folder.get("folder", []):
+        if isinstance(entry, str):
+            app = by_command.get(entry)
+            if app is not None:
+                children.append(app)
+        elif isinstance(entry, dict):
+            children.append(entry)
+    return children
+
+
+def favorite_apps(apps: list[dict]) -> list[dict]:
+    return [app for app in apps if app.get("favorite", False)]
+
+
+def profile_names(data: dict) -> list[str]:
+    return [DEFAULT_PROFILE, *(name for name in data.get("profiles", {}) if name != DEFAULT_PROFILE)]
+
+
+def profile_apps(data: dict, profile: str) -> list[dict]:
+    """Ring entries of a profile, in its order; the default one is the favorites.
+
+        "profiles": {"ops": ["open -a Terminal", "Grafana", "folder:Dashboards"]}
+
+    Entries name catalog apps by command or name, and folders by entry key.
+    """
+    catalog = data.get("apps", [])
+    entries = data.get("profiles", {}).get(profile)
+    if profile == DEFAULT_PROFILE or not isinstance(entries, list):
+        return favorite_apps(catalog)
+    by_key = {entry_key(app): app for app in catalog}
+    by_name = {app.get("name"): app for app in catalog}
+    apps = []
+    for entry in entries:
+        app = by_key.get(entry) or by_name.get(entry)
+        if app is not None:
+            apps.append(app)
+    return apps
+
+
+def apply_favorites(apps: list[dict], favorites_by_name: dict[str, bool]) -> None:
+    for app in apps:
+        if app["name"] in favorites_by_name:
+            app["favorite"] = favorites_by_name[app["name"]]
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import plistlib
+from pathlib import Path
+
+
+def app_bundle_from_command(command: str) -> Path | None:
+    if not command.startswith("open "):
+        return None
+    raw_path = command[5:].strip()
+    if (raw_path.startswith('"') and raw_path.endswith('"')) or (
+        raw_path.startswith("'") and raw_path.endswith("'")
+    ):
+        raw_path = raw_path[1:-1]
+    bundle = Path(raw_path)
+    if bundle.suffix != ".app":
+        return None
+    return bundle
+
+
+def read_info_plist(bundle: Path) -> dict | None:
+    info_plist = bundle / "Contents" / "Info.plist"
+    if not info_plist.exists():
+        return None
+    try:
+        with open(info_plist, "rb") as f:
+            return plistlib.load(f)
+    except Exception:
+        return None
+
+
+def icon_path_for_app(command: str) -> Path | None:
+    bundle = app_bundle_from_command(command)
+    if bundle is None:
+        return None
+    plist = read_info_plist(bundle)
+    if plist is None:
+        return None
+    resources_dir = bundle / "Contents" / "Resources"
+    icon_name = plist.get("CFBundleIconFile")
+    if icon_name:
+        icon_path = resources_dir / icon_name
+        if icon_path.suffix == "":
+            icon_path = icon_path.with_suffix(".icns")
+        if icon_path.exists():
+            return icon_path
+    for candidate in resources_dir.glob("*.icns"):
+        return candidate
+    return None
+
+
+def icon_stamp(command: str) -> str:
+    # Cheap identity for a favorite's icon: the command plus its Info.plist mtime,
+    # so an app update invalidates a persisted atlas without decoding any icon.
+    bundle = app_bundle_from_command(command)
+    if bundle is None:
+        return command
+    try:
+        mtime = (bundle / "Contents" / "Info.plist").stat().st_mtime_ns
+    except OSError:
+        mtime = 0
+    return f"{command}\0{mtime}"
@@ -0,0 +1,65 @@
+"""Launch frecency: a per-command score that grows by one with each launch and
+halves every HALF_LIFE_S, so frequent and recent launches both rank high.
+
+Scores are stored as of their last launch and decayed when read.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+HALF_LIFE_S = 7 * 24 * 3600.0
+MAX_ENTRIES = 500
+
+
+class Frecency:
+    def __init__(self, entries: dict[str, tuple[float, float]] | None = None):
+        # command -> (score at the last launch, wall-clock time of that launch)
+        self._entries = entries if entries is not None else {}
+
+    @classmethod
+    def load(cls, path: Path) -> Frecency:
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return cls()
+        entries = {}
+        for command, value in data.get("launches", {}).items():
+            try:
+                score, at = value
+                entries[command] = (float(score), float(at))
+            except (TypeError, ValueError):
+                continue
+        return cls(entries)
+
+    def save(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        launches = {
+            command: [round(score, 4), round(at, 1)] for command, (score, at) in self._entries.items()
+        }
+        with open(path, "w") as f:
+            json.dump({"launches": launches}, f, ensure_ascii=False)
+
+    def score(self, command: str, now: float | None = None) -> float:
+        entry = self._entries.get(command)
+        if entry is None:
+            return 0.0
+        score, at = entry
+        now = time.time() if now is None else now
+        return score * 0.5 ** (max(0.0, now - at) / HALF_LIFE_S)
+
+    def record(self, command: str, now: float | None = None) -> None:
+        now = time.time() if now is None else now
+        self._entries[command] = (self.score(command, now) + 1.0, now)
+        if len(self._entries) > MAX_ENTRIES:
+            del self._entries[min(self._entries, key=lambda c: self.score(c, now))]
+
+    def ranked(self, now: float | None = None) -> list[str]:
+        now = time.time() if now is None else now
+        return sorted(self._entries, key=lambda c: self.score(c, now), reverse=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+import subprocess
+
+
+def launch_command(command: str) -> subprocess.CompletedProcess:
+    """Run a catalog command; raises subprocess.CalledProcessError on failure."""
+    if command.startswith("open "):
+        # One argv entry is exactly what `open {shlex.quote(path)}` meant, without
+        # paying for a shell.
+        return subprocess.run(["open", command[5:]], check=True, capture_output=True)
+    return subprocess.run(command.split(), check=True, capture_output=True)
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import math
+
+
+def ring_angle(index: int, count: int) -> float:
+    # Item 0 sits at twelve o'clock, the rest follow clockwise.
+    return (2 * math.pi * index / count) - (math.pi / 2)
+
+
+def ring_index(dx: float, dy: float, count: int) -> int:
+    """Index of the item whose sector contains the direction (dx, dy); inverse of ring_angle."""
+    angle = math.atan2(dy, dx) + (math.pi / 2)
+    return round(angle * count / (2 * math.pi)) % count
+
+
+def gesture_index(dx: float, dy: float, count: int, threshold: float) -> int | None:
+    """Item a marking gesture that has travelled (dx, dy) selects; None below the threshold."""
+    if count == 0 or dx * dx + dy * dy < threshold * threshold:
+        return None
+    return ring_index(dx, dy, count)
+
+
+def ring_positions(
+    count: int, center_x: float, center_y: float, radius: float, item_size: int
+) -> list[tuple[float, float]]:
+    """Top-left corners of `count` items of `item_size` evenly spaced on a circle."""
+    positions = []
+    for i in range(count):
+        angle = ring_angle(i, count)
+        x = center_x + (radius * math.cos(angle)) - (item_size // 2)
+        y = center_y + (radius * math.sin(angle)) - (item_size // 2)
+        positions.append((x, y))
+    return positions
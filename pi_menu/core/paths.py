@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+
+def support_dir() -> Path:
+    return Path.home() / "Library" / "Application Support" / "PiMenu"
+
+
+def config_file_path() -> Path:
+    return support_dir() / "config.json"
+
+
+def theme_file_path() -> Path:
+    return support_dir() / "theme.json"
+
+
+def cache_dir() -> Path:
+    return support_dir() / "cache"
+
+
+def socket_path() -> Path:
+    return support_dir() / "pi-menu.sock"
+
+
+def profiles_dir() -> Path:
+    return support_dir() / "profiles"
+
+
+def logs_dir() -> Path:
+    return support_dir() / "logs"
+
+
+def frecency_file_path() -> Path:
+    return support_dir() / "frecency.json"
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+import sys
+
+from .ipc import RpcError, call
+
+# Thin scripting client for a running Pi Menu. Imports no Qt at all.
+
+USAGE = """usage: pi-menu-ctl METHOD [key=value ...]
+
+methods: show, toggle, hide, quit, search, launch, list_favorites,
+         set_favorite, reload, stats, trace, hud, profile
+
+examples:
+  pi-menu-ctl search query=chrome
+  pi-menu-ctl launch name=Safari
+  pi-menu-ctl set_favorite name=Safari favorite=true
+  pi-menu-ctl profile name=ops
+  pi-menu-ctl trace action=start        (then action=dump)
+"""
+
+
+def _parse_value(raw: str):
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return raw
+
+
+def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv or argv[0] in ("-h", "--help"):
+        print(USAGE, end="")
+        return 0 if argv else 2
+
+    method, *pairs = argv
+    params = {}
+    for pair in pairs:
+        key, sep, value = pair.partition("=")
+        if not sep:
+            print(f"expected key=value, got {pair!r}", file=sys.stderr)
+            return 2
+        params[key] = _parse_value(value)
+
+    try:
+        result = call(method, params)
+    except RpcError as e:
+        print(f"error {e.code}: {e.message}", file=sys.stderr)
+        return 1
+    except OSError as e:
+        print(f"Pi Menu is not running ({e})", file=sys.stderr)
+        return 1
+
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
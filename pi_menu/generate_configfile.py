@@ -1,6 +1,12 @@
 import json
 from pathlib import Path
 
+try:
+    from .core.commands import read_info_plist
+except ImportError:
+    # 直接実行時（pi_menu/ が sys.path にある）
+    from core.commands import read_info_plist
+
 
 def get_mac_apps(apps_dir: Path):
     apps = []
@@ -8,11 +14,14 @@ def get_mac_apps(apps_dir: Path):
         if app.name.endswith(".app"):
             app_name = app.name.replace(".app", "")
             app_path = f"open {app}"
+            # 分類用にバンドルIDも控えておく（設定画面を開くたびに読まずに済む）
+            plist = read_info_plist(app)
             apps.append(
                 {
                     "name": app_name,
                     "command": app_path,
                     "icon": "",
+                    "bundle_id": (plist or {}).get("CFBundleIdentifier", ""),
                     "favorite": False,  # デフォルトでは favorite ではない
                 }
             )
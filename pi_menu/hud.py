@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import math
+import statistics
+import time
+from collections import deque
+
+from PyQt6.QtCore import QRect, QRectF, Qt
+from PyQt6.QtGui import QColor, QFont, QFontMetricsF, QPainter, QPixmap
+
+from .icon_cache import IconCache
+from .quality import QualityController
+
+HUD_WINDOW = 120
+HUD_REFRESH_S = 0.25
+HUD_MARGIN = 8
+HUD_PADDING = 6
+
+
+class FrameStats:
+    """Rolling paint and animation-timer counters; a few floats per frame."""
+
+    def __init__(self, window: int = HUD_WINDOW):
+        self.paint_ms: deque[float] = deque(maxlen=window)
+        self.frame_times: deque[float] = deque(maxlen=window)
+        self.jitter_ms: deque[float] = deque(maxlen=window)
+        self.last_launch_ms: float | None = None
+        # Press-to-launch times by how the item was picked; kept across resets.
+        self.selection_ms: dict[str, deque[float]] = {
+            "gesture": deque(maxlen=window),
+            "click": deque(maxlen=window),
+        }
+        self._last_tick: float | None = None
+
+    def record_paint(self, start: float, end: float) -> None:
+        self.paint_ms.append((end - start) * 1000)
+        self.frame_times.append(end)
+
+    def record_selection(self, kind: str, ms: float) -> None:
+        self.selection_ms[kind].append(ms)
+
+    def selection_summary(self) -> dict:
+        return {
+            kind: {
+                "count": len(samples),
+                "median_ms": round(statistics.median(samples), 1) if samples else None,
+            }
+            for kind, samples in self.selection_ms.items()
+        }
+
+    def record_tick(self, now: float, interval_ms: int) -> None:
+        if self._last_tick is not None:
+            self.jitter_ms.append((now - self._last_tick) * 1000 - interval_ms)
+        self._last_tick = now
+
+    def reset(self) -> None:
+        self.paint_ms.clear()
+        self.frame_times.clear()
+        self.jitter_ms.clear()
+        self._last_tick = None
+
+    def reset_ticks(self) -> None:
+        # A hidden window has no timer; the gap is not jitter.
+        self._last_tick = None
+
+    def fps(self) -> float:
+        if len(self.frame_times) < 2:
+            return 0.0
+        latest = self.frame_times[-1]
+        recent = [t for t in self.frame_times if latest - t <= 1.0]
+        span = latest - recent[0]
+        return (len(recent) - 1) / span if span > 0 else 0.0
+
+    def lines(self, cache: IconCache, quality: QualityController | None = None) -> list[str]:
+        lines = []
+        if self.paint_ms:
+            average = sum(self.paint_ms) / len(self.paint_ms)
+            lines.append(f"paint  {average:5.2f} ms  max {max(self.paint_ms):5.2f}")
+        else:
+            lines.append("paint      -")
+        lines.append(f"fps    {self.fps():5.1f}")
+        if self.jitter_ms:
+            average = sum(abs(j) for j in self.jitter_ms) / len(self.jitter_ms)
+            worst = max(self.jitter_ms, key=abs)
+            lines.append(f"jitter {average:5.2f} ms  max {worst:+5.1f}")
+        else:
+            lines.append("jitter     -")
+        lookups = cache.hits + cache.misses
+        if lookups:
+            lines.append(f"icons  {cache.hits / lookups:6.1%} hit  ({lookups})")
+        else:
+            lines.append("icons      -")
+        picks = [
+            f"{kind} {statistics.median(samples):4.0f}" if samples else f"{kind}    -"
+            for kind, samples in self.selection_ms.items()
+        ]
+        lines.append("select " + "  ".join(picks) + " ms")
+        if self.last_launch_ms is not None:
+            lines.append(f"launch {self.last_launch_ms:5.1f} ms")
+        else:
+            lines.append("launch     -")
+        if quality is not None:
+            lines.append(f"tier   {quality.name}")
+        return lines
+
+
+class HudOverlay:
+    """Frame-time panel rendered into a pixmap at most every HUD_REFRESH_S.
+
+    Painting the HUD is one drawPixmap per frame, so it does not show up in
+    the paint times it reports.
+    """
+
+    def __init__(self, stats: FrameStats, cache: IconCache, quality: QualityController | None = None):
+        self.stats = stats
+        self.cache = cache
+        self.quality = quality
+        self.font = QFont("Menlo", 10)
+        self.font.setStyleHint(QFont.StyleHint.Monospace)
+        self._pixmap: QPixmap | None = None
+        # Everything the HUD has covered, so a shrinking HUD leaves no trail.
+        self._bounds = QRect()
+        self._rendered_at = 0.0
+        self._text: list[str] = []
+
+    def pixmap(self, dpr: float) -> QPixmap:
+        now = time.perf_counter()
+        if (
+            self._pixmap is not None
+            and self._pixmap.devicePixelRatio() == dpr
+            and now - self._rendered_at < HUD_REFRESH_S
+        ):
+            return self._pixmap
+        self._rendered_at = now
+
+        lines = self.stats.lines(self.cache, self.quality)
+        if self._pixmap is not None and self._pixmap.devicePixelRatio() == dpr and lines == self._text:
+            return self._pixmap
+        self._text = lines
+
+        metrics = QFontMetricsF(self.font)
+        width = max(metrics.horizontalAdvance(line) for line in lines) + HUD_PADDING * 2
+        height = metrics.lineSpacing() * len(lines) + HUD_PADDING * 2
+        pixmap = QPixmap(round(width * dpr), round(height * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(0, 0, 0, 170))
+        painter.drawRoundedRect(QRectF(0, 0, width, height), 6, 6)
+        painter.setFont(self.font)
+        painter.setPen(QColor(120, 255, 160))
+        y = HUD_PADDING
+        for line in lines:
+            painter.drawText(
+                QRectF(HUD_PADDING, y, width, metrics.lineSpacing()),
+                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                line,
+            )
+            y += metrics.lineSpacing()
+        painter.end()
+
+        self._pixmap = pixmap
+        self._bounds = self._bounds.united(
+            QRect(HUD_MARGIN, HUD_MARGIN, math.ceil(width), math.ceil(height))
+        )
+        return pixmap
+
+    def rect(self) -> QRect:
+        return self._bounds
+
+    def draw(self, painter: QPainter, dpr: float) -> None:
+        painter.drawPixmap(HUD_MARGIN, HUD_MARGIN, self.pixmap(dpr))
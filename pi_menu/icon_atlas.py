@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+from pathlib import Path
+from typing import Iterable
+
+from PyQt6.QtCore import QRect, QRectF, Qt
+from PyQt6.QtGui import QImage, QPainter, QPixmap
+
+ATLAS_FORMAT_VERSION = 1
+
+# Transparent gutter around each cell so smooth scaling never samples a neighbour.
+_PADDING = 2
+
+log = logging.getLogger(__name__)
+
+
+def atlas_signature(stamps: Iterable[str], cell: int) -> str:
+    digest = hashlib.sha1(f"v{ATLAS_FORMAT_VERSION}:{cell}".encode())
+    for stamp in stamps:
+        digest.update(b"\0")
+        digest.update(stamp.encode())
+    return digest.hexdigest()
+
+
+class IconAtlas:
+    """All ring icons packed into one image, addressed by key through source rects."""
+
+    def __init__(self, image: QImage, rects: dict[str, QRect], signature: str, dpr: float):
+        self.image = image
+        self.rects = rects
+        self.signature = signature
+        self.dpr = dpr
+        self._pixmap: QPixmap | None = None
+
+    @classmethod
+    def build(
+        cls,
+        entries: Iterable[tuple[str, QImage | None]],
+        cell: int,
+        dpr: float,
+        signature: str,
+    ) -> IconAtlas:
+        unique: dict[str, QImage] = {}
+        for key, image in entries:
+            if image is not None and not image.isNull() and key not in unique:
+                unique[key] = image
+
+        cell_px = max(1, round(cell * dpr))
+        stride = cell_px + _PADDING * 2
+        columns = max(1, math.ceil(math.sqrt(len(unique))))
+        rows = max(1, math.ceil(len(unique) / columns))
+
+        atlas = QImage(columns * stride, rows * stride, QImage.Format.Format_ARGB32_Premultiplied)
+        atlas.fill(Qt.GlobalColor.transparent)
+        rects: dict[str, QRect] = {}
+
+        painter = QPainter(atlas)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        for i, (key, image) in enumerate(unique.items()):
+            cell_rect = QRect(
+                (i % columns) * stride + _PADDING,
+                (i // columns) * stride + _PADDING,
+                cell_px,
+                cell_px,
+            )
+            # QIcon may hand back a smaller or non-square image; fit it, keeping aspect.
+            scaled = image.size().scaled(cell_rect.size(), Qt.AspectRatioMode.KeepAspectRatio)
+            target = QRect(0, 0, scaled.width(), scaled.height())
+            target.moveCenter(cell_rect.center())
+            painter.drawImage(target, image)
+            rects[key] = cell_rect
+        painter.end()
+
+        return cls(atlas, rects, signature, dpr)
+
+    def pixmap(self) -> QPixmap:
+        if self._pixmap is None:
+            self._pixmap = QPixmap.fromImage(self.image)
+        return self._pixmap
+
+    def draw(self, painter: QPainter, key: str, target: QRectF) -> bool:
+        source = self.rects.get(key)
+        if source is None:
+            return False
+        painter.drawPixmap(target, self.pixmap(), QRectF(source))
+        return True
+
+    @staticmethod
+    def _paths(directory: Path, dpr: float) -> tuple[Path, Path]:
+        stem = f"atlas@{dpr:g}x"
+        return directory / f"{stem}.png", directory / f"{stem}.json"
+
+    def save(self, directory: Path) -> None:
+        image_path, index_path = self._paths(directory, self.dpr)
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            if not self.image.save(str(image_path), "PNG"):
+                return
+            index = {
+                "version": ATLAS_FORMAT_VERSION,
+                "signature": self.signature,
+                "dpr": self.dpr,
+                "rects": {
+                    key: [r.x(), r.y(), r.width(), r.height()] for key, r in self.rects.items()
+                },
+            }
+            with open(index_path, "w") as f:
+                json.dump(index, f, ensure_ascii=False)
+        except OSError as e:
+            log.warning("Failed to save icon atlas: %s", e)
+
+    @classmethod
+    def load(cls, directory: Path, signature: str, dpr: float) -> IconAtlas | None:
+        image_path, index_path = cls._paths(directory, dpr)
+        if not index_path.exists() or not image_path.exists():
+            return None
+        try:
+            with open(index_path, "r") as f:
+                index = json.load(f)
+        except Exception:
+            return None
+        if index.get("version") != ATLAS_FORMAT_VERSION or index.get("signature") != signature:
+            return None
+
+        image = QImage(str(image_path))
+        if image.isNull():
+            return None
+        image = image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+        rects = {key: QRect(*r) for key, r in index.get("rects", {}).items()}
+        return cls(image, rects, signature, dpr)
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable
+
+from PyQt6.QtCore import QSize
+from PyQt6.QtGui import QColor, QIcon, QImage
+
+from .icon_colors import SAMPLE_SIZE, dominant_colors
+from .tracing import tracer
+
+
+class IconCache:
+    """Rasterized app icons keyed by (command, device pixel size), LRU bounded by bytes."""
+
+    def __init__(
+        self,
+        loader: Callable[[str], QIcon | None],
+        budget_bytes: int = 32 * 1024 * 1024,
+    ):
+        self._loader = loader
+        self._images: OrderedDict[tuple[str, int], QImage | None] = OrderedDict()
+        # Tints are a few bytes each and outlive image eviction.
+        self._tints: dict[str, tuple[QColor, QColor] | None] = {}
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @tracer.traced
+    def image(self, command: str, size: int, dpr: float = 1.0) -> QImage | None:
+        key = (command, round(size * dpr))
+        if key in self._images:
+            self._images.move_to_end(key)
+            self.hits += 1
+            return self._images[key]
+
+        self.misses += 1
+        image = self.load(command, size, dpr)
+        self._store(key, image)
+        return image
+
+    def load(self, command: str, size: int, dpr: float = 1.0) -> QImage | None:
+        """Rasterizes an icon without touching the cache."""
+        with tracer.span("IconCache.load", command=command):
+            icon = self._loader(command)
+            if icon is not None:
+                pixmap = icon.pixmap(QSize(size, size), dpr)
+                if not pixmap.isNull():
+                    return pixmap.toImage().convertToFormat(
+                        QImage.Format.Format_ARGB32_Premultiplied
+                    )
+        return None
+
+    def cached(self, command: str, size: int, dpr: float = 1.0) -> bool:
+        return (command, round(size * dpr)) in self._images
+
+    def peek(self, command: str, size: int, dpr: float = 1.0) -> QImage | None:
+        """The cached image, if any; never loads and counts as neither hit nor miss."""
+        return self._images.get((command, round(size * dpr)))
+
+    def put(self, command: str, size: int, dpr: float, image: QImage | None) -> None:
+        """Adds a prefetched image as the least recently used entry."""
+        key = (command, round(size * dpr))
+        if key not in self._images:
+            # Over budget, it is the first to go rather than an icon in use.
+            self._store(key, image, recent=False)
+
+    def _store(self, key: tuple[str, int], image: QImage | None, recent: bool = True) -> None:
+        # Misses are cached as None so a bundle without an icon is not re-parsed.
+        self._images[key] = image
+        if not recent:
+            self._images.move_to_end(key, last=False)
+        if image is not None:
+            self.used_bytes += image.sizeInBytes()
+            self._evict()
+
+    def tint(self, command: str) -> tuple[QColor, QColor] | None:
+        if command in self._tints:
+            return self._tints[command]
+        tint = dominant_colors(self.image(command, SAMPLE_SIZE))
+        self._tints[command] = tint
+        return tint
+
+    def _evict(self) -> None:
+        while self.used_bytes > self.budget_bytes and len(self._images) > 1:
+            _, image = self._images.popitem(last=False)
+            if image is not None:
+                self.used_bytes -= image.sizeInBytes()
+
+    def clear(self) -> None:
+        self._images.clear()
+        self._tints.clear()
+        self.used_bytes = 0
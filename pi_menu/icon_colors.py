@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import sys
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QImage
+
+try:
+    import numpy as np
+except ImportError:  # tinting falls back to a plain average color
+    np = None
+
+# Longest side after strided downsampling; 32x32 samples are plenty for a palette.
+SAMPLE_SIZE = 32
+# 4 bits per channel -> 4096 histogram bins.
+_QUANT_SHIFT = 4
+_MIN_ALPHA = 200
+# Minimum RGB distance between the dominant and the accent color.
+_ACCENT_DISTANCE = 80
+
+_ARGB_FORMATS = (QImage.Format.Format_ARGB32, QImage.Format.Format_ARGB32_Premultiplied)
+
+
+def _rgb_view(image: QImage):
+    if image.format() in _ARGB_FORMATS and sys.byteorder == "little":
+        order = [2, 1, 0, 3]  # BGRA in memory
+    else:
+        image = image.convertToFormat(QImage.Format.Format_RGBA8888)
+        order = [0, 1, 2, 3]
+
+    width, height = image.width(), image.height()
+    bits = image.constBits()
+    bits.setsize(image.sizeInBytes())
+    rows = np.frombuffer(bits, dtype=np.uint8).reshape(height, image.bytesPerLine())
+    pixels = rows[:, : width * 4].reshape(height, width, 4)
+
+    step = max(1, max(width, height) // SAMPLE_SIZE)
+    # Strided slicing keeps this a view over the QImage buffer; only the
+    # masked selection below copies, and only ~SAMPLE_SIZE**2 pixels.
+    sampled = pixels[::step, ::step]
+    opaque = sampled[..., order[3]] >= _MIN_ALPHA
+    return sampled[..., order[:3]][opaque]
+
+
+def _saturation(rgb):
+    high = rgb.max(axis=-1).astype(np.float32)
+    low = rgb.min(axis=-1).astype(np.float32)
+    return np.where(high > 0, (high - low) / np.maximum(high, 1), 0)
+
+
+def dominant_colors(image: QImage) -> tuple[QColor, QColor] | None:
+    if image is None or image.isNull():
+        return None
+
+    if np is None:
+        average = image.scaled(
+            1, 1, Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.SmoothTransformation
+        ).pixelColor(0, 0)
+        average.setAlpha(255)
+        return average, average.lighter(130)
+
+    rgb = _rgb_view(image)
+    if len(rgb) == 0:
+        return None
+
+    quant = (rgb >> _QUANT_SHIFT).astype(np.int32)
+    bins = (quant[:, 0] << 8) | (quant[:, 1] << 4) | quant[:, 2]
+    counts = np.bincount(bins, minlength=4096)
+    sums = np.stack(
+        [np.bincount(bins, weights=rgb[:, c], minlength=4096) for c in range(3)], axis=1
+    )
+
+    used = np.nonzero(counts)[0]
+    means = sums[used] / counts[used, None]
+    # Favour colorful bins so a white or black icon background does not win.
+    scores = counts[used] * (0.35 + _saturation(means))
+    order = np.argsort(scores)[::-1]
+
+    dominant = means[order[0]]
+    distances = np.linalg.norm(means[order] - dominant, axis=1)
+    far = np.nonzero(distances >= _ACCENT_DISTANCE)[0]
+    accent = means[order[far[0]]] if len(far) else dominant * 0.75
+
+    def to_color(values) -> QColor:
+        r, g, b = (int(v) for v in np.clip(values, 0, 255))
+        return QColor(r, g, b)
+
+    return to_color(dominant), to_color(accent)
+
+
+def button_colors(tint: tuple[QColor, QColor]) -> tuple[str, str]:
+    dominant, accent = tint
+
+    def gradient(alpha: float) -> str:
+        return (
+            "qlineargradient(x1: 0, y1: 0, x2: 1, y2: 1, "
+            f"stop: 0 rgba({dominant.red()}, {dominant.green()}, {dominant.blue()}, {alpha}), "
+            f"stop: 1 rgba({accent.red()}, {accent.green()}, {accent.blue()}, {alpha}))"
+        )
+
+    return gradient(0.8), gradient(1.0)
@@ -0,0 +1,248 @@
+"""Background icon prefetch for the whole catalog.
+
+Icons are decoded on a small thread pool -- reading an image file into a
+QImage is safe off the GUI thread -- and handed to the IconCache by a
+GUI-thread timer, in the order they were queued: the caller puts the rings
+one click or switch away first, then the most frecent launches, then the
+rest of the catalog. Nothing new is submitted while the GUI reports itself
+busy or the timer's own ticks run late, and prefetching stops short of the
+cache's byte budget so it never evicts icons in use. Icons only the system
+icon provider can produce are loaded on the GUI thread, one per tick.
+
+A ring being built can jump the queue with prioritize(); those decodes are
+submitted even while the GUI is busy, since the ring is waiting on them.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable
+
+from PyQt6.QtCore import QObject, QSize, Qt, QTimer
+from PyQt6.QtGui import QImage, QImageReader
+
+from .core.commands import icon_path_for_app
+from .icon_cache import IconCache
+
+WORKERS = min(2, os.cpu_count() or 1)
+IN_FLIGHT = 2 * WORKERS
+TICK_MS = 10
+BUSY_TICK_MS = 100
+# A tick this much overdue means the event loop has other work.
+LATE_MS = 20
+# Share of the icon cache budget prefetched icons may fill.
+BUDGET_SHARE = 0.75
+
+log = logging.getLogger(__name__)
+
+
+def decode_icon(command: str, size: int, dpr: float) -> QImage | None:
+    """Reads an app's icon file at the cache's pixel size; None when it has none."""
+    icon_path = icon_path_for_app(command)
+    if icon_path is None:
+        return None
+    pixels = round(size * dpr)
+    reader = QImageReader(str(icon_path))
+    count = reader.imageCount()
+    if count > 1:
+        # An .icns holds several sizes: the smallest one at least as big, else
+        # the biggest there is.
+        widths = []
+        for index in range(count):
+            reader.jumpToImage(index)
+            widths.append(reader.size().width())
+        best = min(range(count), key=lambda i: (widths[i] < pixels, abs(widths[i] - pixels)))
+        reader.jumpToImage(best)
+    image = reader.read()
+    if image.isNull():
+        return None
+    image = image.scaled(
+        QSize(pixels, pixels),
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    ).convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(dpr)
+    return image
+
+
+class IconPrefetcher(QObject):
+    """Fills an IconCache from a priority-ordered command list while the GUI is idle."""
+
+    def __init__(
+        self,
+        cache: IconCache,
+        busy: Callable[[], bool],
+        parent: QObject | None = None,
+        workers: int = WORKERS,
+    ):
+        super().__init__(parent)
+        self.cache = cache
+        self.busy = busy
+        self.workers = workers
+        self.size = 0
+        self.dpr = 1.0
+        self.prefetched = 0
+        self.deferred = 0
+        self.budget_stops = 0
+        self._executor: ThreadPoolExecutor | None = None
+        self._queue: deque[str] = deque()
+        self._fallback: deque[str] = deque()
+        self._pending: list[tuple[str, Future]] = []
+        # Prioritized commands not in the cache yet.
+        self._urgent: set[str] = set()
+        self._last_tick = 0.0
+        self._timer = QTimer(self)
+        self._timer.setInterval(TICK_MS)
+        self._timer.timeout.connect(self._tick)
+
+    def start(self, commands: Iterable[str], size: int, dpr: float) -> None:
+        """Queues commands in priority order, behind those a ring is waiting on.
+
+        Whatever was queued before and is not in the new list stays at the
+        back; duplicates are skipped.
+        """
+        self._set_size(size, dpr)
+        waiting = [command for command in self._queue if command in self._urgent]
+        self._queue = deque(
+            dict.fromkeys([*waiting, *(command for command in commands if command), *self._queue])
+        )
+        self._run()
+
+    def prioritize(self, commands: Iterable[str], size: int, dpr: float) -> None:
+        """Moves the commands a ring is waiting on to the front of the queue."""
+        self._set_size(size, dpr)
+        urgent = [
+            command
+            for command in dict.fromkeys(commands)
+            if command and not self.cache.cached(command, size, dpr)
+        ]
+        if not urgent:
+            return
+        self._urgent.update(urgent)
+        front = set(urgent)
+        self._queue = deque(urgent + [command for command in self._queue if command not in front])
+        if not self._timer.isActive():
+            self._run()
+
+    def _set_size(self, size: int, dpr: float) -> None:
+        if (size, dpr) == (self.size, self.dpr):
+            return
+        # Decodes under way are for the old pixel size; they go back in the queue.
+        self._queue.extendleft(reversed([command for command, _ in self._pending]))
+        self._pending = []
+        self.size = size
+        self.dpr = dpr
+
+    def pending(self, command: str) -> bool:
+        """True while a prioritized command is still queued or decoding."""
+        return command in self._urgent
+
+    def _run(self) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="pi-menu-icons")
+        self._last_tick = time.perf_counter()
+        self._timer.setInterval(TICK_MS)
+        self._timer.start()
+
+    def stop(self) -> None:
+        self._timer.stop()
+        self._queue.clear()
+        self._fallback.clear()
+        self._urgent.clear()
+        self._pending = []
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    @property
+    def active(self) -> bool:
+        return self._timer.isActive()
+
+    def _tick(self) -> None:
+        now = time.perf_counter()
+        late_ms = (now - self._last_tick) * 1000 - self._timer.interval()
+        self._last_tick = now
+        self._collect()
+        if late_ms > LATE_MS or self.busy():
+            self.deferred += 1
+            interval = BUSY_TICK_MS
+            if self._urgent:
+                # Decoding is off the GUI thread; only the waiting ring's icons go.
+                self._submit(urgent_only=True)
+                interval = TICK_MS
+            if self._timer.interval() != interval:
+                self._timer.setInterval(interval)
+            return
+        if self._timer.interval() != TICK_MS:
+            self._timer.setInterval(TICK_MS)
+
+        self._submit()
+        if self._fallback:
+            command = self._fallback.popleft()
+            if not self.cache.cached(command, self.size, self.dpr):
+                image = self.cache.load(command, self.size, self.dpr)
+                self.cache.put(command, self.size, self.dpr, image)
+                self.prefetched += 1
+        if not (self._queue or self._fallback or self._pending):
+            self._timer.stop()
+            log.debug("Icon prefetch done: %d icons, %d bytes", self.prefetched, self.cache.used_bytes)
+
+    def _collect(self) -> None:
+        pending = []
+        for command, future in self._pending:
+            if not future.done():
+                pending.append((command, future))
+                continue
+            try:
+                image = future.result()
+            except Exception as e:
+                log.debug("Icon prefetch failed for %s: %s", command, e)
+                image = None
+            if image is None:
+                # No icon file to read; the system icon provider is GUI-only,
+                # so a ring waiting on this one loads it itself.
+                self._fallback.append(command)
+            else:
+                self.cache.put(command, self.size, self.dpr, image)
+                self.prefetched += 1
+            self._urgent.discard(command)
+        self._pending = pending
+
+    def _has_room(self, in_flight: int) -> bool:
+        pixels = round(self.size * self.dpr)
+        expected = (in_flight + 1) * pixels * pixels * 4
+        return self.cache.used_bytes + expected <= self.cache.budget_bytes * BUDGET_SHARE
+
+    def _submit(self, urgent_only: bool = False) -> None:
+        while self._queue and len(self._pending) < IN_FLIGHT:
+            if urgent_only and self._queue[0] not in self._urgent:
+                return
+            if not self._has_room(len(self._pending)):
+                log.debug("Icon prefetch stopped at the cache budget, %d left", len(self._queue))
+                self.budget_stops += 1
+                self._queue.clear()
+                self._fallback.clear()
+                # Waiting rings load whatever is left themselves.
+                self._urgent.clear()
+                return
+            command = self._queue.popleft()
+            if self.cache.cached(command, self.size, self.dpr):
+                self._urgent.discard(command)
+                continue
+            future = self._executor.submit(decode_icon, command, self.size, self.dpr)
+            self._pending.append((command, future))
+
+    def stats(self) -> dict:
+        return {
+            "active": self.active,
+            "queued": len(self._queue) + len(self._fallback),
+            "in_flight": len(self._pending),
+            "prefetched": self.prefetched,
+            "deferred_ticks": self.deferred,
+            "budget_stops": self.budget_stops,
+            "workers": self.workers,
+        }
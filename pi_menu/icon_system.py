@@ -0,0 +1,279 @@
+"""
+アプリ名・バンドルIDからカテゴリ・アイコン・配色を決めるアイコンシステム
+"""
+
+import re
+
+try:
+    from .core.commands import app_bundle_from_command, read_info_plist
+except ImportError:
+    # 直接実行時（pi_menu/ が sys.path にある）
+    from core.commands import app_bundle_from_command, read_info_plist
+
+# カテゴリ定義: 表示名, 代表アイコン, (通常色, ホバー色)
+CATEGORIES = {
+    "development": ("開発", "👨‍💻", ("rgba(72, 149, 239, 0.8)", "rgba(72, 149, 239, 1.0)")),
+    "browser": ("ブラウザ", "🌐", ("rgba(52, 168, 83, 0.8)", "rgba(52, 168, 83, 1.0)")),
+    "communication": ("コミュニケーション", "💬", ("rgba(88, 101, 242, 0.8)", "rgba(88, 101, 242, 1.0)")),
+    "office": ("オフィス", "📄", ("rgba(230, 126, 34, 0.8)", "rgba(230, 126, 34, 1.0)")),
+    "notes": ("ノート", "📝", ("rgba(241, 196, 15, 0.8)", "rgba(241, 196, 15, 1.0)")),
+    "media": ("メディア", "🎬", ("rgba(231, 76, 60, 0.8)", "rgba(231, 76, 60, 1.0)")),
+    "cloud": ("クラウド", "☁️", ("rgba(26, 188, 156, 0.8)", "rgba(26, 188, 156, 1.0)")),
+    "ai": ("AI", "🤖", ("rgba(16, 163, 127, 0.8)", "rgba(16, 163, 127, 1.0)")),
+    "utility": ("ユーティリティ", "🔧", ("rgba(149, 165, 166, 0.8)", "rgba(149, 165, 166, 1.0)")),
+    "system": ("システム", "⚙️", ("rgba(127, 140, 141, 0.8)", "rgba(127, 140, 141, 1.0)")),
+    "default": ("その他", "📱", ("rgba(102, 126, 234, 0.8)", "rgba(118, 75, 162, 0.8)")),
+}
+
+# キーワード -> (カテゴリ, 個別アイコン or None)
+# 複数語のキーワードは空白区切りで書く（バイグラムとして照合）
+KEYWORDS = {
+    "code": ("development", None),
+    "vscode": ("development", None),
+    "visual studio": ("development", None),
+    "xcode": ("development", None),
+    "cursor": ("development", "⚡"),
+    "windsurf": ("development", "⚡"),
+    "zed": ("development", "⚡"),
+    "jetbrains": ("development", "🧰"),
+    "pycharm": ("development", None),
+    "intellij": ("development", None),
+    "github": ("development", "🐙"),
+    "git": ("development", "🐙"),
+    "docker": ("development", "🐳"),
+    "terminal": ("development", "⌨️"),
+    "iterm": ("development", "⌨️"),
+    "devtoys": ("development", "🔧"),
+    "pgadmin": ("development", "🗄️"),
+    "anaconda": ("development", "🐍"),
+    "python": ("development", "🐍"),
+    "postman": ("development", None),
+    "chrome": ("browser", None),
+    "safari": ("browser", "🧭"),
+    "firefox": ("browser", "🦊"),
+    "arc": ("browser", "🌈"),
+    "edge": ("browser", None),
+    "brave": ("browser", None),
+    "opera": ("browser", None),
+    "slack": ("communication", None),
+    "discord": ("communication", None),
+    "teams": ("communication", "👥"),
+    "zoom": ("communication", "📹"),
+    "outlook": ("communication", "📧"),
+    "mail": ("communication", "📧"),
+    "messages": ("communication", None),
+    "line": ("communication", None),
+    "word": ("office", "📄"),
+    "excel": ("office", "📊"),
+    "powerpoint": ("office", "🎯"),
+    "keynote": ("office", "📊"),
+    "numbers": ("office", "📈"),
+    "pages": ("office", "📝"),
+    "docs": ("office", "📝"),
+    "sheets": ("office", "📊"),
+    "slides": ("office", "🎯"),
+    "notion": ("notes", "📋"),
+    "obsidian": ("notes", "🧠"),
+    "onenote": ("notes", None),
+    "upnote": ("notes", None),
+    "evernote": ("notes", None),
+    "notes": ("notes", None),
+    "kindle": ("media", "📚"),
+    "books": ("media", "📚"),
+    "music": ("media", "🎵"),
+    "spotify": ("media", "🎵"),
+    "garageband": ("media", "🎵"),
+    "imovie": ("media", None),
+    "photos": ("media", "🖼️"),
+    "vlc": ("media", None),
+    "dropbox": ("cloud", "📦"),
+    "onedrive": ("cloud", None),
+    "drive": ("cloud", None),
+    "icloud": ("cloud", None),
+    "chatgpt": ("ai", None),
+    "claude": ("ai", None),
+    "perplexity": ("ai", "🔍"),
+    "raycast": ("utility", "🚀"),
+    "alfred": ("utility", "🚀"),
+    "commander": ("utility", "📁"),
+    "finder": ("utility", "📁"),
+    "karabiner": ("system", "⌨️"),
+    "hhkb": ("system", "⌨️"),
+    "logioptionsplus": ("system", "🖱️"),
+    "defender": ("system", "🛡️"),
+    "settings": ("system", None),
+    "preferences": ("system", None),
+}
+
+# バンドルID接頭辞 -> カテゴリ（最長一致）
+BUNDLE_PREFIXES = {
+    "com.microsoft.vscode": "development",
+    "com.jetbrains": "development",
+    "com.apple.dt": "development",
+    "com.docker": "development",
+    "com.googlecode.iterm2": "development",
+    "com.apple.terminal": "development",
+    "com.google.chrome": "browser",
+    "com.apple.safari": "browser",
+    "org.mozilla": "browser",
+    "company.thebrowser": "browser",
+    "com.tinyspeck.slackmacgap": "communication",
+    "com.hnc.discord": "communication",
+    "us.zoom": "communication",
+    "com.microsoft.teams": "communication",
+    "com.microsoft.outlook": "communication",
+    "com.microsoft.word": "office",
+    "com.microsoft.excel": "office",
+    "com.microsoft.powerpoint": "office",
+    "com.apple.iwork": "office",
+    "com.microsoft.onenote": "notes",
+    "notion.id": "notes",
+    "md.obsidian": "notes",
+    "com.apple.imovie": "media",
+    "com.apple.garageband": "media",
+    "com.spotify": "media",
+    "com.getdropbox": "cloud",
+    "com.microsoft.onedrive": "cloud",
+    "com.google.drivefs": "cloud",
+    "com.openai": "ai",
+    "com.anthropic": "ai",
+    "com.raycast": "utility",
+    "org.pqrs": "system",
+}
+
+# 表示名から落とすベンダー接頭辞
+VENDOR_PREFIXES = ("Microsoft ", "Google ", "Amazon ", "Adobe ", "Apple ")
+
+DISPLAY_NAME_LIMIT = 10
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def _compile_index():
+    """キーワード表を単語・バイグラム・部分一致の3段の索引に展開"""
+    words = {}
+    bigrams = {}
+    for keyword, entry in KEYWORDS.items():
+        parts = keyword.split()
+        if len(parts) == 1:
+            words[keyword] = entry
+        else:
+            bigrams[tuple(parts[:2])] = entry
+    # 部分一致は "vscode" や "pgadmin4" のような連結名の救済用。長いもの優先
+    single = sorted((k for k in KEYWORDS if " " not in k and len(k) >= 5), key=len, reverse=True)
+    substring = re.compile("|".join(re.escape(k) for k in single))
+    return words, bigrams, substring
+
+
+_WORDS, _BIGRAMS, _SUBSTRING = _compile_index()
+
+
+class IconSystem:
+    """アプリ情報（アイコン・表示名・カテゴリ・配色）を返す。結果はアプリ単位でメモ化"""
+
+    _cache = {}
+    # command -> CFBundleIdentifier（Info.plist はアプリごとに一度だけ読む）
+    _bundle_ids = {}
+
+    @staticmethod
+    def _display_name(app_name):
+        name = app_name.lstrip(".")
+        for prefix in VENDOR_PREFIXES:
+            if name.startswith(prefix) and len(name) > len(prefix):
+                name = name[len(prefix):]
+                break
+        if len(name) > DISPLAY_NAME_LIMIT:
+            name = name[: DISPLAY_NAME_LIMIT - 1] + "…"
+        return name
+
+    @staticmethod
+    def _category_for_bundle(bundle_id):
+        key = bundle_id.lower()
+        while key:
+            category = BUNDLE_PREFIXES.get(key)
+            if category:
+                return category
+            key = key.rpartition(".")[0]
+        return None
+
+    @staticmethod
+    def _match_keywords(app_name):
+        lowered = app_name.lower()
+        tokens = _TOKEN.findall(lowered)
+        for pair in zip(tokens, tokens[1:]):
+            entry = _BIGRAMS.get(pair)
+            if entry:
+                return entry
+        for token in tokens:
+            entry = _WORDS.get(token)
+            if entry:
+                return entry
+        match = _SUBSTRING.search(lowered)
+        if match:
+            return KEYWORDS[match.group(0)]
+        return None
+
+    @classmethod
+    def _classify(cls, app_name, bundle_id):
+        category = None
+        icon = None
+        if bundle_id:
+            category = cls._category_for_bundle(bundle_id)
+        entry = cls._match_keywords(app_name)
+        if entry:
+            keyword_category, icon = entry
+            category = category or keyword_category
+        category = category or "default"
+        _, category_icon, colors = CATEGORIES[category]
+        return {
+            "icon": icon or category_icon,
+            "display_name": cls._display_name(app_name),
+            "category": category,
+            "category_name": CATEGORIES[category][0],
+            "colors": colors,
+            "full_name": app_name,
+        }
+
+    @classmethod
+    def bundle_id_for_app(cls, app):
+        """config.json の項目のバンドルID。項目に無ければ .app の Info.plist から読む（リング上の数件向け）"""
+        if "bundle_id" in app:
+            return app["bundle_id"] or None
+        command = app.get("command", "")
+        if command not in cls._bundle_ids:
+            bundle = app_bundle_from_command(command)
+            plist = read_info_plist(bundle) if bundle is not None else None
+            cls._bundle_ids[command] = plist.get("CFBundleIdentifier") if plist else None
+        return cls._bundle_ids[command]
+
+    @classmethod
+    def get_app_info(cls, app_name, bundle_id=None):
+        """アプリ情報を返す。返り値の dict は共有されるので書き換えないこと"""
+        key = (app_name, bundle_id)
+        info = cls._cache.get(key)
+        if info is None:
+            info = cls._cache[key] = cls._classify(app_name, bundle_id)
+        return info
+
+    @classmethod
+    def classify_catalog(cls, apps):
+        """config.json の apps 配列をまとめて分類（1パス）
+
+        ファイルは読まない。バンドルIDは設定生成時に控えたものだけを使い、
+        控えの無い古い項目はキーワードだけで分類する。
+        """
+        cache = cls._cache
+        classify = cls._classify
+        infos = []
+        for app in apps:
+            key = (app.get("name", ""), app.get("bundle_id") or None)
+            info = cache.get(key)
+            if info is None:
+                info = cache[key] = classify(*key)
+            infos.append(info)
+        return infos
+
+    @classmethod
+    def clear_cache(cls):
+        cls._cache.clear()
+        cls._bundle_ids.clear()
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+import socket
+
+from .core.paths import socket_path
+
+# Kept free of PyQt6 so that `pi-menu --show` against a running instance
+# costs only the Python interpreter start.
+
+
+def send_message(method: str, params: dict | None = None, timeout: float = 0.5) -> bool:
+    # A JSON-RPC notification: no id, so the instance sends no response.
+    message = {"jsonrpc": "2.0", "method": method}
+    if params:
+        message["params"] = params
+    payload = (json.dumps(message, ensure_ascii=False) + "\n").encode()
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(socket_path()))
+            sock.sendall(payload)
+    except OSError:
+        # Missing socket file, stale socket (nobody listening) or a timeout:
+        # either way there is no instance to talk to.
+        return False
+    return True
+
+
+def instance_running(timeout: float = 0.2) -> bool:
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(socket_path()))
+    except OSError:
+        return False
+    return True
+
+
+class RpcError(Exception):
+    PARSE_ERROR = -32700
+    INVALID_REQUEST = -32600
+    METHOD_NOT_FOUND = -32601
+    INVALID_PARAMS = -32602
+    APP_ERROR = -32000
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def call(method: str, params: dict | None = None, timeout: float = 2.0):
+    """Send one JSON-RPC request to the running instance and return its result."""
+    request = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params or {}}
+    payload = (json.dumps(request, ensure_ascii=False) + "\n").encode()
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path()))
+        sock.sendall(payload)
+        with sock.makefile("rb") as reader:
+            line = reader.readline()
+
+    if not line:
+        raise RpcError(RpcError.APP_ERROR, "connection closed without a response")
+    response = json.loads(line)
+    error = response.get("error")
+    if error:
+        raise RpcError(error.get("code", RpcError.APP_ERROR), error.get("message", ""))
+    return response.get("result")
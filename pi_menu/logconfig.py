@@ -0,0 +1,93 @@
+"""Logging setup: callers only enqueue records, a listener thread does the I/O.
+
+Modules log through ``logging.getLogger(__name__)`` with %-style arguments, so
+a message below the configured level costs one level check and is never
+formatted. Records go to a rotating JSON-lines file under the support
+directory, and warnings and above also to stderr.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+from pathlib import Path
+
+try:
+    from .core.paths import logs_dir
+except ImportError:
+    # The legacy variants run as scripts, with pi_menu/ on sys.path.
+    from core.paths import logs_dir
+
+ENV_VAR = "PI_MENU_LOG_LEVEL"
+DEFAULT_LEVEL = "INFO"
+LOG_BYTES = 1024 * 1024
+LOG_BACKUPS = 3
+
+# Attributes every LogRecord has; anything else came in through extra=.
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+
+def log_file_path() -> Path:
+    return logs_dir() / "pi-menu.log"
+
+
+class JsonLinesFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def setup_logging(
+    path: Path | None = None, level: str | None = None, logger_name: str = "pi_menu"
+) -> logging.handlers.QueueListener:
+    """Route the pi_menu loggers through a queue; stop the returned listener on exit.
+
+    Scripts whose modules log as ``__main__`` pass ``logger_name=""`` for the root logger.
+    """
+    if path is None:
+        path = log_file_path()
+    if level is None:
+        level = os.environ.get(ENV_VAR, DEFAULT_LEVEL)
+
+    handlers: list[logging.Handler] = []
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=LOG_BYTES, backupCount=LOG_BACKUPS, encoding="utf-8"
+        )
+        file_handler.setFormatter(JsonLinesFormatter())
+        handlers.append(file_handler)
+    except OSError as e:
+        print(f"Failed to open log file {path}: {e}", file=sys.stderr)
+    console = logging.StreamHandler(sys.stderr)
+    console.setLevel(logging.WARNING)
+    console.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+    handlers.append(console)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+
+    numeric_level = logging.getLevelName(level.upper())
+    if not isinstance(numeric_level, int):
+        numeric_level = logging.INFO
+    logger = logging.getLogger(logger_name)
+    logger.setLevel(numeric_level)
+    logger.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    logger.propagate = False
+    return listener
@@ -1,118 +1,103 @@
-import json
+import logging
 import math
-import plistlib
-import shlex
 import subprocess
 import sys
-from pathlib import Path
+import time
+from collections import OrderedDict
 
-from PyQt6.QtCore import QFileInfo, QPoint, QPropertyAnimation, QSize, Qt, QTimer
+from PyQt6.QtCore import QEasingCurve, QEvent, QFileInfo, QPoint, QRect, QRectF, QSize, Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import (
     QBrush,
     QColor,
     QIcon,
+    QImage,
     QLinearGradient,
     QPainter,
     QPainterPath,
     QPen,
+    QPixmap,
     QRadialGradient,
+    QRegion,
 )
 from PyQt6.QtWidgets import (
     QApplication,
     QDialog,
     QFileIconProvider,
-    QGraphicsDropShadowEffect,
     QListWidget,
     QListWidgetItem,
     QPushButton,
-    QToolButton,
+    QToolTip,
     QVBoxLayout,
     QWidget,
 )
 
-
-def _config_file_path() -> Path:
-    return Path.home() / "Library" / "Application Support" / "PiMenu" / "config.json"
-
-
-def _theme_file_path() -> Path:
-    return Path.home() / "Library" / "Application Support" / "PiMenu" / "theme.json"
-
-
-def _load_theme() -> dict:
-    default_theme = {
-        "background_color": "rgba(30, 30, 40, 200)",
-        "ring_color": "rgba(100, 180, 255, 80)",
-        "ring_glow_color": "rgba(100, 180, 255, 40)",
-        "center_gradient_start": "#667eea",
-        "center_gradient_end": "#764ba2",
-        "center_border_color": "rgba(255, 255, 255, 100)",
-        "icon_bg": "rgba(40, 40, 50, 180)",
-        "icon_bg_hover": "rgba(60, 60, 80, 220)",
-        "icon_border": "rgba(100, 100, 120, 100)",
-        "icon_shadow_color": "rgba(0, 0, 0, 80)",
-    }
-
-    theme_path = _theme_file_path()
-    if not theme_path.exists():
-        return default_theme
-
-    try:
-        with open(theme_path, "r") as f:
-            user_theme = json.load(f)
-    except Exception:
-        return default_theme
-
-    return {**default_theme, **user_theme}
-
-
-def _app_bundle_from_command(command: str) -> Path | None:
-    if not command.startswith("open "):
-        return None
-    raw_path = command[5:].strip()
-    if (raw_path.startswith('"') and raw_path.endswith('"')) or (
-        raw_path.startswith("'") and raw_path.endswith("'")
-    ):
-        raw_path = raw_path[1:-1]
-    bundle = Path(raw_path)
-    if bundle.suffix != ".app":
-        return None
-    return bundle
-
-
-def _icon_path_for_app(command: str) -> Path | None:
-    bundle = _app_bundle_from_command(command)
-    if bundle is None:
-        return None
-    info_plist = bundle / "Contents" / "Info.plist"
-    resources_dir = bundle / "Contents" / "Resources"
-    if not info_plist.exists():
-        return None
-    try:
-        with open(info_plist, "rb") as f:
-            plist = plistlib.load(f)
-    except Exception:
-        return None
-    icon_name = plist.get("CFBundleIconFile")
-    if icon_name:
-        icon_path = resources_dir / icon_name
-        if icon_path.suffix == "":
-            icon_path = icon_path.with_suffix(".icns")
-        if icon_path.exists():
-            return icon_path
-    for candidate in resources_dir.glob("*.icns"):
-        return candidate
-    return None
+from .core.catalog import (
+    DEFAULT_PROFILE,
+    apply_favorites,
+    entry_key,
+    folder_apps,
+    is_folder,
+    load_config,
+    profile_apps,
+    profile_names,
+    write_config,
+)
+from .core.commands import app_bundle_from_command, icon_path_for_app, icon_stamp
+from .core.frecency import Frecency
+from .core.launch import launch_command
+from .core.layout import gesture_index, ring_angle, ring_index, ring_positions
+from .core.paths import (
+    cache_dir,
+    config_file_path,
+    frecency_file_path,
+    profiles_dir,
+    theme_file_path,
+)
+from .hud import FrameStats, HudOverlay
+from .icon_atlas import IconAtlas, atlas_signature
+from .icon_cache import IconCache
+from .icon_prefetch import TICK_MS, IconPrefetcher
+from .profiling import startup_profiler
+from .quality import QualityController
+from .snapshot import StartupSnapshot
+from .theme import DEFAULT_THEME, Theme, ThemeWatcher, load_theme
+from .tracing import tracer
+
+RING_RADIUS = 160
+GLOW_RING_RADIUS = 170
+GLOW_RING_WIDTH = 3
+ITEM_SIZE = 64
+ICON_SIZE = 48
+PLATE_SHADOW_OFFSET = 3
+HUB_RADIUS = 50
+# A press off the icons that travels this far is a marking gesture: the
+# sector in that direction is selected, wherever the pointer is released.
+GESTURE_THRESHOLD = 20
+SECTOR_CACHE_SIZE = 32
+# Child rings kept built after their folder is closed.
+FOLDER_CACHE_SIZE = 8
+# A folder's icon previews this many of its children.
+FOLDER_PREVIEW = 4
+# Profile rings kept built besides the one on screen.
+PROFILE_CACHE_SIZE = 4
+# Margin of the window mask past the background disc, for its antialiased edge.
+MASK_MARGIN = 1
+RING_TRANSITION_MS = 180
+
+log = logging.getLogger(__name__)
+
+# Qt 6.6+; older versions only get the mask refreshed on show and resize.
+_DPR_CHANGE = getattr(QEvent.Type, "DevicePixelRatioChange", None)
 
 
 def _qt_icon_for_app(command: str) -> QIcon | None:
-    icon_path = _icon_path_for_app(command)
+    icon_path = icon_path_for_app(command)
     if icon_path:
         icon = QIcon(str(icon_path))
         if not icon.isNull():
             return icon
 
-    bundle = _app_bundle_from_command(command)
+    bundle = app_bundle_from_command(command)
     if bundle:
         provider = QFileIconProvider()
         icon = provider.icon(QFileInfo(str(bundle)))
@@ -122,42 +107,21 @@ def _qt_icon_for_app(command: str) -> QIcon | None:
 
 
 class FavoriteSettings(QDialog):
-    def __init__(self, config_file, parent=None):
+    def __init__(
+        self,
+        config_file,
+        parent=None,
+        theme: Theme | None = None,
+        icon_cache: IconCache | None = None,
+    ):
         super().__init__(parent)
         self.config_file = config_file
+        self.icon_cache = icon_cache
         self.setWindowTitle("Favorite Apps Settings")
         self.setGeometry(200, 200, 400, 500)
-        self.setStyleSheet(
-            """
-            QDialog {
-                background-color: rgba(30, 30, 40, 240);
-                color: white;
-            }
-            QListWidget {
-                background-color: rgba(40, 40, 50, 200);
-                color: white;
-                border: 1px solid rgba(100, 100, 120, 100);
-                border-radius: 8px;
-            }
-            QListWidget::item {
-                padding: 8px;
-            }
-            QListWidget::item:hover {
-                background-color: rgba(60, 60, 80, 200);
-            }
-            QPushButton {
-                background-color: rgba(100, 180, 255, 180);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: rgba(100, 180, 255, 220);
-            }
-            """
-        )
+        if theme is None:
+            theme = load_theme(theme_file_path())
+        self.setStyleSheet(theme.dialog_stylesheet())
 
         layout = QVBoxLayout()
         self.app_list = QListWidget()
@@ -171,15 +135,21 @@ class FavoriteSettings(QDialog):
         self.setLayout(layout)
 
     def load_apps(self):
-        if not self.config_file.exists():
-            print(f"Config file not found: {self.config_file}")
+        data = load_config(self.config_file)
+        if data is None:
+            log.warning("Config file not found: %s", self.config_file)
             return
 
-        with open(self.config_file, "r") as file:
-            data = json.load(file)
-
+        # Icons only if the prefetcher has them ready; the list never waits on one.
+        dpr = self.devicePixelRatioF()
+        self.app_list.setIconSize(QSize(20, 20))
         for app in data["apps"]:
             item = QListWidgetItem(app["name"])
+            image = None
+            if self.icon_cache is not None and "command" in app:
+                image = self.icon_cache.peek(app["command"], ICON_SIZE, dpr)
+            if image is not None:
+                item.setIcon(QIcon(QPixmap.fromImage(image)))
             item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
             item.setCheckState(
                 Qt.CheckState.Checked
@@ -188,36 +158,129 @@ class FavoriteSettings(QDialog):
             )
             self.app_list.addItem(item)
 
+    @tracer.traced
     def save_favorites(self):
-        if not self.config_file.exists():
+        data = load_config(self.config_file)
+        if data is None:
             return
 
-        with open(self.config_file, "r") as file:
-            data = json.load(file)
-
+        checked = {}
         for i in range(self.app_list.count()):
             item = self.app_list.item(i)
-            for app in data["apps"]:
-                if app["name"] == item.text():
-                    app["favorite"] = item.checkState() == Qt.CheckState.Checked
+            checked[item.text()] = item.checkState() == Qt.CheckState.Checked
+        apply_favorites(data["apps"], checked)
 
-        self.config_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.config_file, "w") as file:
-            json.dump(data, file, indent=4, ensure_ascii=False)
+        write_config(self.config_file, data)
 
-        print("Favorites saved")
+        log.info("Favorites saved")
         self.accept()
 
 
+class RingItem:
+    __slots__ = (
+        "key", "app", "rect", "opacity",
+        "start_rect", "start_opacity", "target_rect", "target_opacity",
+    )
+
+    def __init__(self, app: dict, rect: QRectF):
+        self.key = entry_key(app)
+        self.app = app
+        self.rect = rect
+        self.opacity = 1.0
+        self.place(rect)
+
+    def place(self, rect: QRectF, opacity: float = 1.0):
+        self.rect = self.start_rect = self.target_rect = rect
+        self.opacity = self.start_opacity = self.target_opacity = opacity
+
+    def move_to(self, rect: QRectF, opacity: float = 1.0):
+        # Animate from wherever the item is drawn now, even mid-transition.
+        self.start_rect = self.rect
+        self.start_opacity = self.opacity
+        self.target_rect = rect
+        self.target_opacity = opacity
+
+    def step(self, t: float):
+        start, target = self.start_rect, self.target_rect
+        self.rect = QRectF(
+            start.x() + (target.x() - start.x()) * t,
+            start.y() + (target.y() - start.y()) * t,
+            target.width(),
+            target.height(),
+        )
+        self.opacity = self.start_opacity + (self.target_opacity - self.start_opacity) * t
+
+    def contains(self, pos) -> bool:
+        center = self.rect.center()
+        dx = pos.x() - center.x()
+        dy = pos.y() - center.y()
+        radius = self.rect.width() / 2
+        return dx * dx + dy * dy <= radius * radius
+
+
+class RingLevel:
+    """One ring's items and the atlases drawn from them: a profile or an open folder."""
+
+    __slots__ = ("key", "items", "signature", "atlases")
+
+    def __init__(self, key: str, items: list, signature: str | None, atlases: dict):
+        self.key = key
+        self.items = items
+        self.signature = signature
+        self.atlases = atlases
+
+
 class PiMenu(QWidget):
-    def __init__(self):
+    first_frame_shown = pyqtSignal()
+    visibility_changed = pyqtSignal(bool)
+
+    def __init__(self, use_snapshot: bool = True):
         super().__init__()
-        self.favorite_buttons = []
+        self.ring_items = []
+        self.retiring_items = []
+        # Icons of the fading-out items, cut from the atlas they were drawn from.
+        self._retiring_images = {}
         self.favorite_apps = []
-        self.config_file = _config_file_path()
-        self.theme = _load_theme()
+        self.catalog = []
+        self.config = {}
+        self.profile = DEFAULT_PROFILE
+        self.config_file = config_file_path()
+        self.theme = None
+        self.theme_watcher = None
+        self.use_snapshot = use_snapshot
+        self.snapshot_loaded = False
+        self._first_frame_done = False
+        self._static_layer = None
+        self._plates = {}
+        self._ring_regions = {}
+        self._sector_layers = {}
+        self._mask_key = None
+        self.icon_cache = IconCache(_qt_icon_for_app)
+        self.icon_prefetcher = IconPrefetcher(self.icon_cache, self.gui_busy, self)
+        self._frecency = None
+        self._atlases = {}
+        self._atlas_signature = None
+        # Built in memory for a switch; saved with the next snapshot.
+        self._unsaved_atlas = None
+        # Parents of the ring on screen while a folder is open; [0] is the root.
+        self.ring_stack = []
+        self._folder_rings = OrderedDict()
+        self._profile_rings = OrderedDict()
+        self._prefetches = OrderedDict()
+        # Set while a ring build is run to the end; it stops waiting on decodes.
+        self._finishing_build = False
+        self.hovered_item = None
+        self.pressed_item = None
         self.drag_position = None
+        self.gesture_origin = None
+        self.gesture_index = None
+        self._press_on_hub = False
+        self._press_time = 0.0
         self.ring_animation_angle = 0
+        self.frame_stats = FrameStats()
+        self.hud = None
+        self.quality = QualityController.from_env()
+        self.resident = False
         self.initUI()
 
     def initUI(self):
@@ -230,16 +293,58 @@ class PiMenu(QWidget):
             | Qt.WindowType.WindowStaysOnTopHint
         )
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setMouseTracking(True)
 
-        self.favorite_buttons = []
+        self._snapshot_timer = QTimer(self)
+        self._snapshot_timer.setSingleShot(True)
+        self._snapshot_timer.setInterval(1000)
+        self._snapshot_timer.timeout.connect(self.save_snapshot)
+
+        # Item transitions after the favorites change
+        self._transition_start = 0.0
+        self._transition_curve = QEasingCurve(QEasingCurve.Type.OutCubic)
+        self.transition_timer = QTimer(self)
+        self.transition_timer.setInterval(16)
+        self.transition_timer.timeout.connect(self.advance_transition)
+
+        self.ring_items = []
         self.favorite_apps = []
-        self.load_favorites()
-        self.create_circle_buttons()
+        snapshot = None
+        if self.use_snapshot:
+            with startup_profiler.phase("StartupSnapshot.load"):
+                snapshot = StartupSnapshot.load(
+                    cache_dir(), self.devicePixelRatioF(), (self.width(), self.height())
+                )
+        if snapshot is not None:
+            # Paint the last known state first; reconcile_live_state() catches
+            # up with config.json and theme.json right after the first frame.
+            self.restore_snapshot(snapshot)
+        else:
+            with startup_profiler.phase("load_theme"):
+                self.theme = load_theme(theme_file_path())
+            with startup_profiler.phase("load_favorites"):
+                self.load_favorites()
+            with startup_profiler.phase("create_circle_buttons"):
+                self.create_circle_buttons()
+        self.theme_watcher = ThemeWatcher(theme_file_path(), self.theme, self)
+        self.theme_watcher.theme_changed.connect(self.apply_theme)
 
         # Ring animation timer
         self.animation_timer = QTimer(self)
+        self.animation_timer.setInterval(50)
         self.animation_timer.timeout.connect(self.update_ring_animation)
-        self.animation_timer.start(50)
+
+        # Folder and profile rings are built ahead of time one icon per
+        # event-loop pass, once the prefetcher has decoded their icons.
+        self.prefetch_timer = QTimer(self)
+        self.prefetch_timer.setInterval(0)
+        self.prefetch_timer.timeout.connect(self.prefetch_step)
+
+        # With the animation dropped, an occasional paint tells whether the
+        # machine has room to step the quality back up.
+        self.quality_probe_timer = QTimer(self)
+        self.quality_probe_timer.setSingleShot(True)
+        self.quality_probe_timer.timeout.connect(self.probe_quality)
 
         # Center the window on screen
         self.center_on_screen()
@@ -251,88 +356,597 @@ class PiMenu(QWidget):
         self.move(x, y)
 
     def update_ring_animation(self):
+        if self.hud is not None:
+            self.frame_stats.record_tick(time.perf_counter(), self.animation_timer.interval())
         self.ring_animation_angle = (self.ring_animation_angle + 1) % 360
-        self.update()
+        # Only the glow band changes; the center and icons stay composited.
+        self.update(self.ring_region())
+        if self.hud is not None:
+            self.update(self.hud.rect())
+
+    def ring_region(self) -> QRegion:
+        glow_passes = len(self.theme.glow_colors)
+        key = (self.width(), self.height(), glow_passes)
+        region = self._ring_regions.get(key)
+        if region is None:
+            # Half the widest glow pen, plus a pixel either side for antialiasing.
+            half_width = (GLOW_RING_WIDTH + 2 * max(0, glow_passes - 1)) / 2 + 2
+            center = QPoint(self.width() // 2, self.height() // 2)
+
+            def disc(radius: float) -> QRegion:
+                r = int(radius + 0.5)
+                return QRegion(
+                    QRect(center.x() - r, center.y() - r, 2 * r, 2 * r),
+                    QRegion.RegionType.Ellipse,
+                )
+
+            region = disc(GLOW_RING_RADIUS + half_width).subtracted(
+                disc(GLOW_RING_RADIUS - half_width)
+            )
+            self._ring_regions = {key: region}
+        return region
 
+    def update_item(self, item: RingItem | None):
+        if item is not None:
+            self.update(
+                item.rect.toAlignedRect().adjusted(-1, -1, 1, PLATE_SHADOW_OFFSET + 1)
+            )
+
+    @tracer.traced
     def load_favorites(self):
         self.favorite_apps = []
-
-        if not self.config_file.exists():
-            print(f"Config file not found: {self.config_file}")
+        self.catalog = []
+        # Rings built from the previous catalog would launch its entries.
+        self._profile_rings.clear()
+        for key in [key for key in self._prefetches if key.startswith("profile:")]:
+            del self._prefetches[key]
+
+        data = load_config(self.config_file)
+        if data is None:
+            log.warning("Config file not found: %s", self.config_file)
+            self.config = {}
             return
 
-        with open(self.config_file, "r") as file:
-            data = json.load(file)
+        self.config = data
+        self.catalog = data["apps"]
+        self.profile = data.get("active_profile", DEFAULT_PROFILE)
+        if self.profile not in profile_names(data):
+            self.profile = DEFAULT_PROFILE
+        self.favorite_apps = profile_apps(data, self.profile)
+        if self._first_frame_done:
+            self.prewarm_profiles()
+            self.prefetch_icons()
+
+    @tracer.traced
+    def create_circle_buttons(self):
+        # The favorites are the root ring; come back to it from any folder.
+        self.close_folders()
+        signature = self.ring_signature(self.favorite_apps)
+        dpr = self.devicePixelRatioF()
+        old_atlas = self._atlases.get(dpr)
+        if signature != self._atlas_signature:
+            self._atlases.clear()
+            self._atlas_signature = signature
+            self._unsaved_atlas = None
+
+        positions = ring_positions(
+            len(self.favorite_apps),
+            self.width() // 2,
+            self.height() // 2,
+            RING_RADIUS,
+            ITEM_SIZE,
+        )
+        # Match items to the new favorites by command: kept items slide to
+        # their new slot, added ones fade in there, removed ones fade out.
+        # Only a visible ring animates; otherwise everything just snaps.
+        animate = self.isVisible() and bool(self.ring_items)
+        previous: dict[str, list[RingItem]] = {}
+        for item in self.ring_items:
+            previous.setdefault(item.key, []).append(item)
+
+        items = []
+        changed = len(self.ring_items) != len(self.favorite_apps)
+        for app, (x, y) in zip(self.favorite_apps, positions):
+            rect = QRectF(int(x), int(y), ITEM_SIZE, ITEM_SIZE)
+            matches = previous.get(entry_key(app))
+            if matches:
+                item = matches.pop(0)
+                changed = changed or item.app != app or item.target_rect != rect
+                item.app = app
+                if animate:
+                    item.move_to(rect)
+                else:
+                    item.place(rect)
+            else:
+                changed = True
+                item = RingItem(app, rect)
+                if animate:
+                    item.place(rect, opacity=0.0)
+                    item.move_to(rect)
+            items.append(item)
+
+        retired = [item for matches in previous.values() for item in matches]
+        self.ring_items = items
+        if self.hovered_item in retired:
+            self.hovered_item = None
+            self.unsetCursor()
+        if self.pressed_item in retired:
+            self.pressed_item = None
+
+        if animate:
+            for item in retired:
+                item.move_to(item.rect, opacity=0.0)
+            for item in self.retiring_items:
+                item.move_to(item.rect, opacity=0.0)
+            for item in retired:
+                self._retiring_images[item.key] = self.retiring_image(item, old_atlas, dpr)
+            self.retiring_items.extend(retired)
+            self._transition_start = time.perf_counter()
+            self.transition_timer.start()
+        else:
+            self.finish_transition()
+
+        self.update()
+        if changed:
+            self.schedule_snapshot()
+
+    def advance_transition(self):
+        elapsed = (time.perf_counter() - self._transition_start) * 1000
+        progress = min(1.0, elapsed / RING_TRANSITION_MS)
+        t = self._transition_curve.valueForProgress(progress)
+        for item in self.ring_items:
+            item.step(t)
+        for item in self.retiring_items:
+            item.step(t)
+        if progress >= 1.0:
+            self.transition_timer.stop()
+            self.retiring_items = []
+            self._retiring_images = {}
+        self.update()
 
-        self.favorite_apps = [
-            app for app in data["apps"] if app.get("favorite", False)
+    def finish_transition(self):
+        self.transition_timer.stop()
+        for item in self.ring_items:
+            item.place(item.target_rect, item.target_opacity)
+        self.retiring_items = []
+        self._retiring_images = {}
+
+    def retiring_image(self, item: RingItem, atlas: IconAtlas | None, dpr: float) -> QImage | None:
+        # The atlas holds exactly what was on screen, folder tiles included.
+        if atlas is not None and item.key in atlas.rects:
+            image = atlas.image.copy(atlas.rects[item.key])
+            image.setDevicePixelRatio(dpr)
+            return image
+        return self.entry_image(item.app, dpr)
+
+    def restore_snapshot(self, snapshot: StartupSnapshot):
+        dpr = snapshot.dpr
+        self.theme = Theme({**DEFAULT_THEME, **snapshot.theme_values})
+        self.favorite_apps = snapshot.favorites
+        self.ring_items = [
+            RingItem(app, QRectF(*rect))
+            for app, rect in zip(snapshot.favorites, snapshot.rects)
         ]
+        self._atlas_signature = snapshot.atlas_signature
+
+        static_layer = QPixmap.fromImage(snapshot.static_layer)
+        static_layer.setDevicePixelRatio(dpr)
+        self._static_layer = static_layer
+        for hovered, image in snapshot.plates.items():
+            plate = QPixmap.fromImage(image)
+            plate.setDevicePixelRatio(dpr)
+            self._plates[(hovered, True, dpr)] = plate
+        self.snapshot_loaded = True
+
+    def reconcile_live_state(self):
+        with startup_profiler.phase("reconcile_live_state"):
+            self.theme_watcher.reload()
+            self.load_favorites()
+            # Recomputes the atlas signature; an unchanged favorites set keeps
+            # the atlas that the snapshot frame was drawn from.
+            self.create_circle_buttons()
+        self.snapshot_loaded = False
 
-    def create_circle_buttons(self):
-        for btn in self.favorite_buttons:
-            btn.deleteLater()
-        self.favorite_buttons.clear()
+    def schedule_snapshot(self):
+        if self.use_snapshot:
+            self._snapshot_timer.start()
 
-        if not self.favorite_apps:
+    def save_snapshot(self):
+        if not self.use_snapshot or self.theme is None:
+            return
+        if self.ring_stack:
+            # The snapshot is of the favorites ring; retry once back on it.
+            self.schedule_snapshot()
             return
+        self._snapshot_timer.stop()
+        dpr = self.devicePixelRatioF()
+        if self.ring_items:
+            # Make sure the atlas the snapshot refers to is on disk.
+            atlas = self.icon_atlas()
+            if atlas is self._unsaved_atlas:
+                atlas.save(cache_dir())
+                self._unsaved_atlas = None
+        StartupSnapshot(
+            dpr,
+            (self.width(), self.height()),
+            self.theme.values,
+            self.favorite_apps,
+            [item.target_rect.getRect() for item in self.ring_items],
+            self._atlas_signature,
+            self.static_layer().toImage(),
+            {hovered: self.item_plate(hovered).toImage() for hovered in (False, True)},
+        ).save(cache_dir())
+
+    def icon_atlas(self) -> IconAtlas:
+        dpr = self.devicePixelRatioF()
+        atlas = self._atlases.get(dpr)
+        if atlas is not None:
+            return atlas
+
+        # Only the root ring's atlas is persisted; folder rings live in memory.
+        atlas = None
+        if not self.ring_stack:
+            with startup_profiler.phase("IconAtlas.load"):
+                atlas = IconAtlas.load(cache_dir(), self._atlas_signature, dpr)
+        if atlas is None:
+            with startup_profiler.phase("IconAtlas.build"), tracer.span("IconAtlas.build"):
+                atlas = IconAtlas.build(
+                    (self._atlas_entry(item, dpr) for item in self.ring_items),
+                    ICON_SIZE,
+                    dpr,
+                    self._atlas_signature,
+                )
+                if not self.ring_stack:
+                    atlas.save(cache_dir())
+        self._atlases[dpr] = atlas
+        return atlas
+
+    def _atlas_entry(self, item: RingItem, dpr: float):
+        with startup_profiler.phase("icon", app=item.app.get("name", item.key)):
+            return item.key, self.entry_image(item.app, dpr)
+
+    def entry_image(self, app: dict, dpr: float) -> QImage | None:
+        if is_folder(app):
+            return self.folder_image(app, dpr)
+        return self.icon_cache.image(app.get("command", ""), ICON_SIZE, dpr)
+
+    def folder_image(self, app: dict, dpr: float) -> QImage:
+        # A tile with the first few children's icons, like a Launchpad folder.
+        size = round(ICON_SIZE * dpr)
+        image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(255, 255, 255, 40))
+        painter.drawRoundedRect(QRectF(0, 0, size, size), size * 0.22, size * 0.22)
+        pad = size * 0.1
+        cell = (size - 3 * pad) / 2
+        for i, child in enumerate(folder_apps(app, self.catalog)[:FOLDER_PREVIEW]):
+            child_image = self.entry_image(child, dpr)
+            if child_image is not None:
+                x = pad + (i % 2) * (cell + pad)
+                y = pad + (i // 2) * (cell + pad)
+                painter.drawImage(QRectF(x, y, cell, cell), child_image)
+        painter.end()
+        return image
+
+    def entry_stamp(self, app: dict) -> str:
+        if is_folder(app):
+            children = folder_apps(app, self.catalog)[:FOLDER_PREVIEW]
+            return "\0".join([entry_key(app), *(self.entry_stamp(child) for child in children)])
+        return icon_stamp(app.get("command", ""))
+
+    def ring_signature(self, apps: list[dict]) -> str:
+        return atlas_signature((self.entry_stamp(app) for app in apps), ICON_SIZE)
+
+    def icon_commands(self, apps: list[dict]) -> list[str]:
+        # The icons a ring's entries are drawn from, folder previews included.
+        commands = []
+        for app in apps:
+            if is_folder(app):
+                commands += self.icon_commands(folder_apps(app, self.catalog)[:FOLDER_PREVIEW])
+            else:
+                commands.append(app.get("command", ""))
+        return commands
+
+    def build_ring(self, key: str, apps: list[dict], cache: OrderedDict, limit: int):
+        """Builds a ring into one of the level caches, yielding after each icon.
+
+        The icons are decoded by the prefetcher off the GUI thread; while it
+        still has some to go the build yields True, meaning it is only waiting.
+        """
+        signature = self.ring_signature(apps)
+        dpr = self.devicePixelRatioF()
+        commands = self.icon_commands(apps)
+        self.icon_prefetcher.prioritize(commands, ICON_SIZE, dpr)
+        for command in commands:
+            while not self._finishing_build and self.icon_prefetcher.pending(command):
+                yield True
+        positions = ring_positions(
+            len(apps), self.width() // 2, self.height() // 2, RING_RADIUS, ITEM_SIZE
+        )
+        items = [
+            RingItem(app, QRectF(int(x), int(y), ITEM_SIZE, ITEM_SIZE))
+            for app, (x, y) in zip(apps, positions)
+        ]
+        entries = []
+        for item in items:
+            entries.append(self._atlas_entry(item, dpr))
+            yield False
+        with tracer.span("IconAtlas.build", ring=key):
+            atlas = IconAtlas.build(entries, ICON_SIZE, dpr, signature)
+        cache[key] = RingLevel(key, items, signature, {dpr: atlas})
+        cache.move_to_end(key)
+        while len(cache) > limit:
+            cache.popitem(last=False)
+
+    def build_folder_ring(self, app: dict):
+        return self.build_ring(
+            entry_key(app), folder_apps(app, self.catalog), self._folder_rings, FOLDER_CACHE_SIZE
+        )
 
-        center_x = self.width() // 2
-        center_y = self.height() // 2
-        radius = 160
-        button_size = 64
-
-        for i, app in enumerate(self.favorite_apps):
-            angle = (2 * math.pi * i / len(self.favorite_apps)) - (math.pi / 2)
-            x = center_x + (radius * math.cos(angle)) - (button_size // 2)
-            y = center_y + (radius * math.sin(angle)) - (button_size // 2)
-
-            btn = QToolButton(self)
-            btn.setFixedSize(button_size, button_size)
-            btn.app_command = app["command"]
-            btn.app_name = app["name"]
-            btn.clicked.connect(self.handle_button_click)
-            btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonIconOnly)
-            btn.setCursor(Qt.CursorShape.PointingHandCursor)
-
-            btn.setStyleSheet(
-                f"""
-                QToolButton {{
-                    border-radius: {button_size // 2}px;
-                    background-color: {self.theme['icon_bg']};
-                    border: 1px solid {self.theme['icon_border']};
-                }}
-                QToolButton:hover {{
-                    background-color: {self.theme['icon_bg_hover']};
-                    border: 1px solid rgba(100, 180, 255, 150);
-                }}
-                """
+    def finish_build(self, task):
+        # The ring is needed now: icons still decoding are loaded right here.
+        self._finishing_build = True
+        try:
+            for _ in task:
+                pass
+        finally:
+            self._finishing_build = False
+
+    def folder_ring(self, app: dict) -> RingLevel:
+        # Built on first open, or finished now if a prefetch is under way;
+        # afterwards reused until the children or their icons change.
+        key = entry_key(app)
+        task = self._prefetches.pop(key, None)
+        if task is not None:
+            self.finish_build(task)
+        level = self._folder_rings.get(key)
+        if level is None or level.signature != self.ring_signature(folder_apps(app, self.catalog)):
+            with tracer.span("build_folder_ring", folder=key):
+                self.finish_build(self.build_folder_ring(app))
+            level = self._folder_rings[key]
+        self._folder_rings.move_to_end(key)
+        return level
+
+    def prefetch_folder(self, item: RingItem):
+        if item.key in self._prefetches or item.key in self._folder_rings:
+            return
+        self._prefetches[item.key] = self.build_folder_ring(item.app)
+        # The pointer is heading there; it goes ahead of profile prewarming.
+        self._prefetches.move_to_end(item.key, last=False)
+        self.prefetch_timer.start()
+
+    def prewarm_profiles(self):
+        # Every other profile is built in the background, so even the first
+        # switch to one only swaps in a finished ring.
+        for name in profile_names(self.config)[: PROFILE_CACHE_SIZE + 1]:
+            key = "profile:" + name
+            if name == self.profile or name in self._profile_rings or key in self._prefetches:
+                continue
+            self._prefetches[key] = self.build_ring(
+                name, profile_apps(self.config, name), self._profile_rings, PROFILE_CACHE_SIZE
+            )
+        if self._prefetches:
+            self.prefetch_timer.start()
+
+    def profile_ring(self, name: str, apps: list[dict]) -> RingLevel:
+        task = self._prefetches.pop("profile:" + name, None)
+        if task is not None:
+            self.finish_build(task)
+        level = self._profile_rings.pop(name, None)
+        if level is None or level.signature != self.ring_signature(apps):
+            with tracer.span("build_profile_ring", profile=name):
+                self.finish_build(
+                    self.build_ring(name, apps, self._profile_rings, PROFILE_CACHE_SIZE)
+                )
+            level = self._profile_rings.pop(name)
+        return level
+
+    def switch_profile(self, name: str) -> bool:
+        """Puts a profile's ring on screen; False when there is no such profile."""
+        if name not in profile_names(self.config):
+            return False
+        if name == self.profile:
+            return True
+        with tracer.span("switch_profile", profile=name):
+            self.close_folders()
+            apps = profile_apps(self.config, name)
+            level = self.profile_ring(name, apps)
+            # Park the ring on screen so switching back is just as quick.
+            self._profile_rings[self.profile] = RingLevel(
+                self.profile, self.ring_items, self._atlas_signature, self._atlases
             )
+            while len(self._profile_rings) > PROFILE_CACHE_SIZE:
+                self._profile_rings.popitem(last=False)
+            self.profile = name
+            self.favorite_apps = apps
+            self.enter_level(level, None, animate=False)
+            self._unsaved_atlas = self._atlases.get(self.devicePixelRatioF())
+        log.info("Switched to profile %s", name)
+        # The config write and the snapshot wait until the frame is out.
+        if self.config:
+            self.config["active_profile"] = name
+            QTimer.singleShot(0, self.save_config)
+        self.schedule_snapshot()
+        return True
+
+    def launch_history(self) -> Frecency:
+        if self._frecency is None:
+            self._frecency = Frecency.load(frecency_file_path())
+        return self._frecency
+
+    def save_launch_history(self):
+        try:
+            self.launch_history().save(frecency_file_path())
+        except OSError as e:
+            log.warning("Failed to save launch history: %s", e)
+
+    def icon_priority(self) -> list[str]:
+        # The ring on screen, then what one switch or click away shows, then
+        # the most frecent launches, then the rest of the catalog.
+        apps = list(self.favorite_apps)
+        for name in profile_names(self.config):
+            apps += profile_apps(self.config, name)
+        apps += [child for app in apps if is_folder(app) for child in folder_apps(app, self.catalog)]
+        apps += self.catalog
+        commands = [app.get("command", "") for app in apps if not is_folder(app)]
+        known = set(commands)
+        ranked = [command for command in self.launch_history().ranked() if command in known]
+        # Folders on the ring have no command of their own.
+        on_screen = sum(1 for app in self.favorite_apps if not is_folder(app))
+        return commands[:on_screen] + ranked + commands[on_screen:]
+
+    def prefetch_icons(self):
+        self.icon_prefetcher.start(self.icon_priority(), ICON_SIZE, self.devicePixelRatioF())
+
+    def gui_busy(self) -> bool:
+        # Pointer interaction and ring transitions keep the event loop to themselves.
+        return (
+            self.transition_timer.isActive()
+            or self.pressed_item is not None
+            or self.gesture_origin is not None
+            or self.drag_position is not None
+        )
 
-            # Add shadow effect
-            shadow = QGraphicsDropShadowEffect()
-            shadow.setBlurRadius(15)
-            shadow.setColor(QColor(0, 0, 0, 100))
-            shadow.setOffset(0, 3)
-            btn.setGraphicsEffect(shadow)
+    def save_config(self):
+        with tracer.span("save_config"):
+            write_config(self.config_file, self.config)
 
-            icon = _qt_icon_for_app(app.get("command", ""))
-            if icon:
-                btn.setIcon(icon)
-            btn.setIconSize(QSize(48, 48))
-            btn.move(int(x), int(y))
-            btn.setToolTip(app["name"])
-            btn.setParent(self)
-            btn.show()
+    def prefetch_step(self):
+        if not self._prefetches:
+            self.prefetch_timer.stop()
+            return
+        key, task = next(iter(self._prefetches.items()))
+        try:
+            waiting = next(task)
+        except StopIteration:
+            del self._prefetches[key]
+            waiting = False
+        # Nothing to do but poll while the prefetcher decodes the icons.
+        self.prefetch_timer.setInterval(TICK_MS if waiting else 0)
+
+    def hint_folder(self, pos):
+        # The pointer is in a folder's sector, on its way there: build it now.
+        if not self.ring_items:
+            return
+        dx = pos.x() - self.width() / 2
+        dy = pos.y() - self.height() / 2
+        if dx * dx + dy * dy < HUB_RADIUS * HUB_RADIUS:
+            return
+        item = self.ring_items[ring_index(dx, dy, len(self.ring_items))]
+        if is_folder(item.app):
+            self.prefetch_folder(item)
+
+    def open_folder(self, item: RingItem):
+        level = self.folder_ring(item.app)
+        self.ring_stack.append(
+            RingLevel(None, self.ring_items, self._atlas_signature, self._atlases)
+        )
+        self.enter_level(level, item.rect)
+
+    def close_folder(self) -> bool:
+        if not self.ring_stack:
+            return False
+        self.enter_level(self.ring_stack.pop(), None)
+        return True
+
+    def close_folders(self):
+        if self.ring_stack:
+            root = self.ring_stack[0]
+            self.ring_stack.clear()
+            self.enter_level(root, None, animate=False)
+
+    def enter_level(self, level: RingLevel, origin: QRectF | None, animate: bool = True):
+        # Children grow out of the folder they came from; a parent fades back in.
+        self.finish_transition()
+        self.ring_items = level.items
+        self._atlas_signature = level.signature
+        self._atlases = level.atlases
+        self.hovered_item = None
+        self.pressed_item = None
+        self.unsetCursor()
+        animate = animate and self.isVisible()
+        for item in self.ring_items:
+            target = item.target_rect
+            if animate:
+                item.place(QRectF(origin) if origin is not None else target, 0.0)
+                item.move_to(target)
+            else:
+                item.place(target)
+        if animate and self.ring_items:
+            self._transition_start = time.perf_counter()
+            self.transition_timer.start()
+        self.update()
 
-            self.favorite_buttons.append(btn)
+    def item_at(self, pos) -> RingItem | None:
+        for item in self.ring_items:
+            if item.contains(pos):
+                return item
+        return None
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
+    def apply_theme(self, theme: Theme, groups: set):
+        self.theme = theme
+        if "static" in groups:
+            self._static_layer = None
+        if "items" in groups:
+            self._plates.clear()
+            self._sector_layers.clear()
+        # "ring" needs no invalidation: the ring is drawn each frame from the
+        # theme's prebuilt stops, and "dialog" is read when the dialog opens.
+        self.update()
+        self.schedule_snapshot()
+
+    def _layer_pixmap(self) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        return pixmap
+
+    def disc_radius(self) -> int:
+        return min(self.width(), self.height()) // 2 - 10
+
+    def update_mask(self):
+        # Outside the disc the window is transparent; masking it off keeps the
+        # window server from compositing the corners and lets clicks there
+        # reach the windows underneath. The HUD sits in a corner, so it joins
+        # the mask while it is shown.
+        hud_rect = self.hud.rect() if self.hud is not None else QRect()
+        key = (self.width(), self.height(), self.devicePixelRatioF(), hud_rect.getRect())
+        if key == self._mask_key:
+            return
+        radius = self.disc_radius() + MASK_MARGIN
+        region = QRegion(
+            QRect(self.width() // 2 - radius, self.height() // 2 - radius, 2 * radius, 2 * radius),
+            QRegion.RegionType.Ellipse,
+        )
+        if not hud_rect.isEmpty():
+            region = region.united(QRegion(hud_rect))
+        self.setMask(region)
+        self._mask_key = key
+
+    def static_layer(self) -> QPixmap:
+        # Background disc and center badge never change between frames.
+        dpr = self.devicePixelRatioF()
+        layer = self._static_layer
+        if (
+            layer is not None
+            and layer.devicePixelRatio() == dpr
+            and layer.deviceIndependentSize().toSize() == self.size()
+        ):
+            return layer
+
+        layer = self._layer_pixmap()
+        painter = QPainter(layer)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        theme = self.theme
 
         center_x = self.width() // 2
         center_y = self.height() // 2
-        window_radius = min(self.width(), self.height()) // 2 - 10
+        window_radius = self.disc_radius()
 
         # Draw circular background
         bg_path = QPainterPath()
@@ -342,54 +956,15 @@ class PiMenu(QWidget):
             window_radius * 2,
             window_radius * 2,
         )
-        painter.fillPath(bg_path, QColor(30, 30, 40, 200))
-
-        # Draw outer glow ring
-        ring_radius = 170
-        ring_width = 3
-
-        # Animated gradient for the ring
-        gradient = QLinearGradient(
-            center_x - ring_radius,
-            center_y - ring_radius,
-            center_x + ring_radius,
-            center_y + ring_radius,
-        )
-
-        angle_offset = self.ring_animation_angle / 360.0
-        gradient.setColorAt((0 + angle_offset) % 1.0, QColor(100, 180, 255, 120))
-        gradient.setColorAt((0.25 + angle_offset) % 1.0, QColor(130, 100, 255, 80))
-        gradient.setColorAt((0.5 + angle_offset) % 1.0, QColor(100, 180, 255, 120))
-        gradient.setColorAt((0.75 + angle_offset) % 1.0, QColor(180, 100, 255, 80))
-
-        pen = QPen(QBrush(gradient), ring_width)
-        painter.setPen(pen)
-        painter.drawEllipse(
-            int(center_x - ring_radius),
-            int(center_y - ring_radius),
-            int(ring_radius * 2),
-            int(ring_radius * 2),
-        )
-
-        # Draw outer glow effect
-        for i in range(5):
-            glow_pen = QPen(QColor(100, 180, 255, 30 - i * 5), ring_width + i * 2)
-            painter.setPen(glow_pen)
-            painter.drawEllipse(
-                int(center_x - ring_radius),
-                int(center_y - ring_radius),
-                int(ring_radius * 2),
-                int(ring_radius * 2),
-            )
+        painter.fillPath(bg_path, theme.background_brush)
 
         # Draw center circle with gradient
         center_radius = 50
         center_gradient = QRadialGradient(center_x, center_y, center_radius)
-        center_gradient.setColorAt(0, QColor(102, 126, 234, 255))
-        center_gradient.setColorAt(0.7, QColor(118, 75, 162, 255))
-        center_gradient.setColorAt(1, QColor(90, 60, 140, 255))
+        for stop, color in theme.center_stops:
+            center_gradient.setColorAt(stop, color)
 
-        painter.setPen(QPen(QColor(255, 255, 255, 100), 2))
+        painter.setPen(theme.center_pen)
         painter.setBrush(QBrush(center_gradient))
         painter.drawEllipse(
             center_x - center_radius,
@@ -399,7 +974,7 @@ class PiMenu(QWidget):
         )
 
         # Draw "P" text with pi symbol
-        painter.setPen(QColor(255, 255, 255, 230))
+        painter.setPen(theme.center_text)
         font = painter.font()
         font.setPointSize(32)
         font.setBold(True)
@@ -417,7 +992,7 @@ class PiMenu(QWidget):
         font.setPointSize(14)
         font.setBold(False)
         painter.setFont(font)
-        painter.setPen(QColor(255, 255, 255, 180))
+        painter.setPen(theme.center_symbol)
         painter.drawText(
             center_x + 8,
             center_y + 20,
@@ -425,17 +1000,222 @@ class PiMenu(QWidget):
         )
 
         painter.end()
+        self._static_layer = layer
+        return layer
+
+    def item_plate(self, hovered: bool, shadow: bool = True) -> QPixmap:
+        # Shadow + disc + border for one ring item, shared by every item.
+        dpr = self.devicePixelRatioF()
+        key = (hovered, shadow, dpr)
+        plate = self._plates.get(key)
+        if plate is not None:
+            return plate
+
+        theme = self.theme
+        plate = QPixmap(int(ITEM_SIZE * dpr), int((ITEM_SIZE + PLATE_SHADOW_OFFSET) * dpr))
+        plate.setDevicePixelRatio(dpr)
+        plate.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(plate)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = QRectF(0, 0, ITEM_SIZE, ITEM_SIZE)
+
+        if shadow:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(theme.icon_shadow)
+            painter.drawEllipse(rect.translated(0, PLATE_SHADOW_OFFSET))
+
+        painter.setPen(theme.icon_pen_hover if hovered else theme.icon_pen)
+        painter.setBrush(theme.icon_bg_hover if hovered else theme.icon_bg)
+        painter.drawEllipse(rect.adjusted(0.5, 0.5, -0.5, -0.5))
+        painter.end()
+
+        self._plates[key] = plate
+        return plate
+
+    def sector_layer(self, index: int) -> tuple[QPixmap, QRect]:
+        # The highlighted wedge for one item, between the hub and the disc edge.
+        count = len(self.ring_items)
+        dpr = self.devicePixelRatioF()
+        key = (count, index, dpr, self.width(), self.height())
+        layer = self._sector_layers.get(key)
+        if layer is not None:
+            return layer
+
+        center_x = self.width() / 2
+        center_y = self.height() / 2
+        outer = self.disc_radius()
+        inner = HUB_RADIUS + 4
+        # QPainterPath angles are degrees, counter-clockwise with y up.
+        middle = -math.degrees(ring_angle(index, count))
+        half = 180 / count
+        outer_rect = QRectF(center_x - outer, center_y - outer, outer * 2, outer * 2)
+        inner_rect = QRectF(center_x - inner, center_y - inner, inner * 2, inner * 2)
+        path = QPainterPath()
+        path.arcMoveTo(outer_rect, middle - half)
+        path.arcTo(outer_rect, middle - half, 2 * half)
+        path.arcTo(inner_rect, middle + half, -2 * half)
+        path.closeSubpath()
+
+        bounds = path.boundingRect().toAlignedRect().adjusted(-1, -1, 1, 1)
+        pixmap = QPixmap(bounds.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.translate(-bounds.x(), -bounds.y())
+        painter.fillPath(path, self.theme.sector_brush)
+        painter.end()
+
+        if len(self._sector_layers) >= SECTOR_CACHE_SIZE:
+            self._sector_layers.clear()
+        layer = (pixmap, bounds)
+        self._sector_layers[key] = layer
+        return layer
+
+    def update_sector(self, index: int | None):
+        if index is not None and index < len(self.ring_items):
+            self.update(self.sector_layer(index)[1])
+
+    def draw_ring_items(self, painter: QPainter):
+        if not self.ring_items and not self.retiring_items:
+            return
+
+        atlas = self.icon_atlas()
+        icon_offset = (ITEM_SIZE - ICON_SIZE) / 2
+        shadow = self.quality.shadows
+
+        for item in self.ring_items:
+            if item.opacity < 1.0:
+                painter.setOpacity(item.opacity)
+            plate = self.item_plate(item is self.hovered_item, shadow)
+            painter.drawPixmap(item.rect.topLeft(), plate)
+            atlas.draw(
+                painter,
+                item.key,
+                item.rect.adjusted(icon_offset, icon_offset, -icon_offset, -icon_offset),
+            )
+            painter.setOpacity(1.0)
+
+        # Removed items are no longer in the atlas; their icons were cut out
+        # of the old one when they were retired.
+        for item in self.retiring_items:
+            painter.setOpacity(item.opacity)
+            painter.drawPixmap(item.rect.topLeft(), self.item_plate(False, shadow))
+            image = self._retiring_images.get(item.key)
+            if image is not None:
+                painter.drawImage(
+                    item.rect.adjusted(icon_offset, icon_offset, -icon_offset, -icon_offset),
+                    image,
+                )
+        painter.setOpacity(1.0)
+
+    def paintEvent(self, event):
+        if self._first_frame_done:
+            with tracer.span("paintEvent"):
+                start = time.perf_counter()
+                self.paint_frame()
+                end = time.perf_counter()
+                if self.quality.record((end - start) * 1000):
+                    self.apply_quality()
+                if self.hud is None:
+                    return
+                self.frame_stats.record_paint(start, end)
+                painter = QPainter(self)
+                self.hud.draw(painter, self.devicePixelRatioF())
+                painter.end()
+                # The HUD grows as its counters fill in.
+                self.update_mask()
+            return
+
+        with startup_profiler.phase("first paintEvent", snapshot=self.snapshot_loaded):
+            self.paint_frame()
+        self._first_frame_done = True
+        startup_profiler.mark("first frame")
+        self.first_frame_shown.emit()
+        if self.snapshot_loaded:
+            QTimer.singleShot(0, self.reconcile_live_state)
+        else:
+            QTimer.singleShot(0, self.prewarm_profiles)
+            QTimer.singleShot(0, self.prefetch_icons)
+
+    def paint_frame(self):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        theme = self.theme
+
+        center_x = self.width() // 2
+        center_y = self.height() // 2
+
+        painter.drawPixmap(0, 0, self.static_layer())
+
+        # Draw outer glow ring
+        ring_radius = GLOW_RING_RADIUS
+        ring_width = GLOW_RING_WIDTH
+        quality = self.quality
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, quality.antialias)
+
+        # Animated gradient for the ring
+        gradient = QLinearGradient(
+            center_x - ring_radius,
+            center_y - ring_radius,
+            center_x + ring_radius,
+            center_y + ring_radius,
+        )
+
+        angle_offset = self.ring_animation_angle / 360.0
+        for stop, color in theme.ring_stops:
+            gradient.setColorAt((stop + angle_offset) % 1.0, color)
+
+        pen = QPen(QBrush(gradient), ring_width)
+        painter.setPen(pen)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawEllipse(
+            int(center_x - ring_radius),
+            int(center_y - ring_radius),
+            int(ring_radius * 2),
+            int(ring_radius * 2),
+        )
+
+        # Draw outer glow effect
+        for i, color in enumerate(theme.glow_colors if quality.glow else ()):
+            glow_pen = QPen(color, ring_width + i * 2)
+            painter.setPen(glow_pen)
+            painter.drawEllipse(
+                int(center_x - ring_radius),
+                int(center_y - ring_radius),
+                int(ring_radius * 2),
+                int(ring_radius * 2),
+            )
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        if self.gesture_index is not None and self.gesture_index < len(self.ring_items):
+            sector, bounds = self.sector_layer(self.gesture_index)
+            painter.drawPixmap(bounds.topLeft(), sector)
+
+        # Ring items: every icon comes from the one atlas texture
+        self.draw_ring_items(painter)
+
+        painter.end()
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
+            self._press_time = time.perf_counter()
+            pos = event.position()
             center = QPoint(self.width() // 2, self.height() // 2)
-            distance = (event.position().toPoint() - center).manhattanLength()
+            offset = pos.toPoint() - center
+            self._press_on_hub = offset.manhattanLength() < HUB_RADIUS
 
-            # Click on center opens settings
-            if distance < 50:
-                self.open_favorite_settings()
-            else:
+            self.pressed_item = self.item_at(pos)
+            outer = RING_RADIUS + ITEM_SIZE // 2
+            if self.pressed_item is None and offset.x() ** 2 + offset.y() ** 2 > outer * outer:
+                # The rim outside the ring moves the window.
                 self.drag_position = event.globalPosition().toPoint() - self.pos()
+                return
+            # A press on an icon is a click on it, even if the pointer slips;
+            # anywhere else, including the hub, it may become a gesture.
+            if self.pressed_item is None:
+                self.gesture_origin = pos
 
         elif event.button() == Qt.MouseButton.RightButton:
             self.close()
@@ -443,40 +1223,240 @@ class PiMenu(QWidget):
     def mouseMoveEvent(self, event):
         if self.drag_position and event.buttons() == Qt.MouseButton.LeftButton:
             self.move(event.globalPosition().toPoint() - self.drag_position)
+            return
+
+        if self.gesture_origin is not None and event.buttons() & Qt.MouseButton.LeftButton:
+            self.track_gesture(event.position())
+            return
+
+        self.hint_folder(event.position())
+        hovered = self.item_at(event.position())
+        if hovered is self.hovered_item:
+            return
+        self.update_item(self.hovered_item)
+        self.hovered_item = hovered
+        if hovered is None:
+            self.unsetCursor()
+            QToolTip.hideText()
+        else:
+            self.setCursor(Qt.CursorShape.PointingHandCursor)
+            QToolTip.showText(event.globalPosition().toPoint(), hovered.app["name"], self)
+        self.update_item(hovered)
+
+    def track_gesture(self, pos):
+        # Selection comes from the direction of travel alone, so a flick
+        # picks an item long before the pointer gets to its icon.
+        index = gesture_index(
+            pos.x() - self.gesture_origin.x(),
+            pos.y() - self.gesture_origin.y(),
+            len(self.ring_items),
+            GESTURE_THRESHOLD,
+        )
+        if index == self.gesture_index:
+            return
+        self.update_sector(self.gesture_index)
+        self.update_sector(index)
+        self.gesture_index = index
+        self.update_item(self.hovered_item)
+        self.hovered_item = self.ring_items[index] if index is not None else None
+        self.update_item(self.hovered_item)
+        if self.hovered_item is not None and is_folder(self.hovered_item.app):
+            self.prefetch_folder(self.hovered_item)
 
     def mouseReleaseEvent(self, event):
         self.drag_position = None
+        pressed, self.pressed_item = self.pressed_item, None
+        origin, self.gesture_origin = self.gesture_origin, None
+        index, self.gesture_index = self.gesture_index, None
+        self.update_sector(index)
+        if event.button() != Qt.MouseButton.LeftButton:
+            return
+
+        if index is not None and index < len(self.ring_items):
+            self.select_item(self.ring_items[index], "gesture")
+        elif pressed is not None and pressed.contains(event.position()):
+            self.select_item(pressed, "click")
+        elif origin is not None and self._press_on_hub:
+            # A press on the hub that never became a gesture goes back up
+            # out of a folder, or opens settings on the root ring.
+            if not self.close_folder():
+                self.open_favorite_settings()
+
+    def select_item(self, item: RingItem, kind: str):
+        # Opening a folder is not a launch; only launches count toward latency.
+        if not is_folder(item.app):
+            latency_ms = (time.perf_counter() - self._press_time) * 1000
+            self.frame_stats.record_selection(kind, latency_ms)
+            tracer.instant("select", kind=kind, latency_ms=round(latency_ms, 1))
+            log.debug("Selected %s by %s in %.0f ms", item.app.get("name", item.key), kind, latency_ms)
+        self.handle_item_click(item)
+
+    def leaveEvent(self, event):
+        if self.hovered_item is not None:
+            self.update_item(self.hovered_item)
+            self.hovered_item = None
+            self.unsetCursor()
+        super().leaveEvent(event)
 
     def open_favorite_settings(self):
-        settings = FavoriteSettings(self.config_file, self)
+        settings = FavoriteSettings(
+            self.config_file, self, theme=self.theme, icon_cache=self.icon_cache
+        )
         if settings.exec():
             self.load_favorites()
             self.create_circle_buttons()
 
-    def handle_button_click(self):
-        button = self.sender()
-        if not button:
+    def handle_item_click(self, item: RingItem):
+        if is_folder(item.app):
+            self.open_folder(item)
             return
-
-        if hasattr(button, "app_command") and button.app_command:
-            self.launch_app(button.app_command)
+        command = item.app.get("command")
+        if command:
+            self.launch_app(command)
 
     def launch_app(self, command):
-        try:
-            if command.startswith("open "):
-                command = f"open {shlex.quote(command[5:])}"
-                subprocess.run(command, shell=True, check=True, capture_output=True)
+        start = time.perf_counter()
+        with tracer.span("launch_app", command=command):
+            try:
+                with tracer.span("launch_command"):
+                    launch_command(command)
+            except subprocess.CalledProcessError as e:
+                tracer.instant("launch failed", returncode=e.returncode)
+                log.error("Failed to launch app: %s", e, extra={"command": command, "stderr": e.stderr})
+            except Exception as e:
+                tracer.instant("launch failed", error=str(e))
+                log.error("Failed to launch app: %s", e, extra={"command": command})
             else:
-                subprocess.run(command.split(), check=True, capture_output=True)
-
-        except subprocess.CalledProcessError as e:
-            print(f"Failed to launch app: {e}")
-        except Exception as e:
-            print(f"Failed to launch app: {e}")
+                self.launch_history().record(command)
+                QTimer.singleShot(0, self.save_launch_history)
+        self.frame_stats.last_launch_ms = (time.perf_counter() - start) * 1000
 
     def keyPressEvent(self, event):
         if event.key() == Qt.Key.Key_Escape:
-            self.close()
+            if not self.close_folder():
+                self.close()
+        elif (
+            Qt.Key.Key_1.value <= event.key() <= Qt.Key.Key_9.value
+            and event.modifiers() == Qt.KeyboardModifier.NoModifier
+        ):
+            # 1 is the favorites, then the named profiles in config order.
+            names = profile_names(self.config)
+            index = event.key() - Qt.Key.Key_1.value
+            if index < len(names):
+                self.switch_profile(names[index])
+        elif event.key() == Qt.Key.Key_T and event.modifiers() == (
+            Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.ShiftModifier
+        ):
+            self.toggle_tracing()
+        elif event.key() == Qt.Key.Key_H and event.modifiers() == (
+            Qt.KeyboardModifier.ControlModifier | Qt.KeyboardModifier.ShiftModifier
+        ):
+            self.toggle_hud()
+
+    def toggle_hud(self):
+        if self.hud is None:
+            # Counters only run while the HUD is up; start from a clean window.
+            self.frame_stats.reset()
+            self.hud = HudOverlay(self.frame_stats, self.icon_cache, self.quality)
+            self.hud.pixmap(self.devicePixelRatioF())
+        else:
+            self.hud = None
+        self.update_mask()
+        self.update()
+
+    def apply_quality(self):
+        quality = self.quality
+        tracer.instant("render quality", tier=quality.name)
+        if not quality.animation:
+            self.animation_timer.stop()
+            self.schedule_quality_probe()
+        elif self.isVisible() and not self.animation_timer.isActive():
+            self.animation_timer.start()
+        self.update()
+
+    def schedule_quality_probe(self):
+        if not self.quality_probe_timer.isActive():
+            self.quality_probe_timer.start(int(self.quality.probe_delay_s() * 1000) + 1)
+
+    def probe_quality(self):
+        if self.isVisible() and not self.quality.animation:
+            self.quality.probed()
+            self.update(self.ring_region())
+            self.schedule_quality_probe()
+
+    def toggle_tracing(self):
+        # First press starts recording, the next one writes the buffer out.
+        if not tracer.enabled:
+            tracer.start()
+            log.info("Tracing started")
+            return
+        tracer.stop()
+        try:
+            log.info("Trace written to %s", tracer.dump(profiles_dir()))
+        except OSError as e:
+            log.error("Failed to write trace: %s", e)
+        tracer.clear()
+
+    def warm_caches(self):
+        if self.snapshot_loaded:
+            # Hidden, there is no first frame to trigger the catch-up.
+            self.reconcile_live_state()
+        # Build everything the first frame needs while the window is hidden.
+        self.static_layer()
+        self.item_plate(False)
+        self.item_plate(True)
+        if self.ring_items:
+            self.icon_atlas()
+        self.prewarm_profiles()
+        self.prefetch_icons()
+
+    def show_menu(self):
+        self.show()
+        self.raise_()
+        self.activateWindow()
+
+    def toggle_menu(self):
+        if self.isVisible():
+            self.hide()
+        else:
+            self.show_menu()
+
+    def showEvent(self, event):
+        self.update_mask()
+        if self.quality.animation:
+            self.animation_timer.start()
+        else:
+            self.schedule_quality_probe()
+        self.visibility_changed.emit(True)
+        super().showEvent(event)
+
+    def resizeEvent(self, event):
+        self.update_mask()
+        super().resizeEvent(event)
+
+    def event(self, event):
+        if _DPR_CHANGE is not None and event.type() == _DPR_CHANGE:
+            self.update_mask()
+            if self._first_frame_done:
+                self.prefetch_icons()
+        return super().event(event)
+
+    def hideEvent(self, event):
+        self.frame_stats.reset_ticks()
+        self.animation_timer.stop()
+        self.quality_probe_timer.stop()
+        # The menu always reopens on the favorites.
+        self.close_folders()
+        self.visibility_changed.emit(False)
+        super().hideEvent(event)
+
+    def closeEvent(self, event):
+        if self.resident:
+            # Stay alive with warm caches; the next `pi-menu --show` is instant.
+            event.ignore()
+            self.hide()
+            return
+        super().closeEvent(event)
 
 
 if __name__ == "__main__":
@@ -1,26 +1,70 @@
 import json
+import logging
 import math
 import os
 import subprocess
 import sys
 import shlex
 
-from PyQt6.QtCore import QSize, Qt, QPropertyAnimation, QEasingCurve, QRect, pyqtProperty
-from PyQt6.QtGui import QIcon, QPainter, QPen, QBrush, QRadialGradient, QColor, QFont
+from PyQt6.QtCore import QSize, Qt, QPropertyAnimation, QEasingCurve, QEvent, QRect, QTimer, pyqtProperty
+from PyQt6.QtGui import QIcon, QPainter, QPen, QBrush, QRadialGradient, QColor, QFont, QPixmap, QRegion
 from PyQt6.QtWidgets import (QApplication, QPushButton, QVBoxLayout, QWidget, 
-                           QDialog, QListWidget, QListWidgetItem, QCheckBox, QGraphicsDropShadowEffect)
+                           QDialog, QListWidget, QListWidgetItem, QCheckBox, QGraphicsDropShadowEffect,
+                           QStyle, QStyleOptionButton)
+
+try:
+    from .core.layout import ring_positions
+except ImportError:
+    # 直接実行時の絶対インポート
+    from core.layout import ring_positions
+
+try:
+    from .logconfig import setup_logging
+except ImportError:
+    from logconfig import setup_logging
 
 CONFIG_FILE = "./config.json"
+BUTTON_SIZE = 80
+HOVER_SCALE = 1.1
+PRESS_SCALE = 1.0
+# 焼き込んだ影の余白（ぼかし 10px + 下方向オフセット 4px）
+SHADOW_MARGIN = 14
+SHADOW_OFFSET = 4
+# ウィジェット自体は拡大後の大きさで固定し、描画だけを拡大する
+BUTTON_SLOT = int(BUTTON_SIZE * HOVER_SCALE + 0.5) + 2 * SHADOW_MARGIN
+# リサイズ中はこの間隔だけ待ってからまとめて再配置する
+RELAYOUT_DELAY_MS = 50
+LAYOUT_CACHE_SIZE = 64
+
+log = logging.getLogger(__name__)
+
+
+def slot_mask_radius(ring_radius, count):
+    """隣のボタンと重ならない入力・描画範囲の半径（拡大したボタンの円は削らない）"""
+    if count < 2:
+        return BUTTON_SLOT / 2
+    half_spacing = ring_radius * math.sin(math.pi / count)
+    return max(BUTTON_SIZE * HOVER_SCALE / 2, min(BUTTON_SLOT / 2, half_spacing))
+
 
 class ModernButton(QPushButton):
-    """モダンなアニメーション付きボタン"""
+    """モダンなアニメーション付きボタン
+
+    ホバー・押下の拡大はペインタの変換で描くだけで、ジオメトリは変えない。
+    状態ごとの見た目（影込み）は一度だけピックスマップに描いて使い回す。
+    """
     
     def __init__(self, text, parent=None):
         super().__init__(text, parent)
         self._scale = 1.0
-        self.setFixedSize(80, 80)
+        self._hovered = False
+        self._pixmaps = {}
+        self._mask_radius = None
+        self.setFixedSize(BUTTON_SLOT, BUTTON_SLOT)
+        self.setMouseTracking(True)
         self.setup_animation()
-        self.setup_shadow()
+        self.pressed.connect(lambda: self.animate_to(PRESS_SCALE))
+        self.released.connect(lambda: self.animate_to(HOVER_SCALE if self._hovered else 1.0))
         
     def setup_animation(self):
         """ホバーアニメーションの設定"""
@@ -28,13 +72,12 @@ class ModernButton(QPushButton):
         self.animation.setDuration(200)
         self.animation.setEasingCurve(QEasingCurve.Type.OutCubic)
         
-    def setup_shadow(self):
-        """ドロップシャドウ効果"""
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(20)
-        shadow.setOffset(0, 4)
-        shadow.setColor(QColor(0, 0, 0, 80))
-        self.setGraphicsEffect(shadow)
+    def animate_to(self, value):
+        """現在の倍率から目標の倍率へアニメーション"""
+        self.animation.stop()
+        self.animation.setStartValue(self._scale)
+        self.animation.setEndValue(value)
+        self.animation.start()
         
     @pyqtProperty(float)
     def scale(self):
@@ -43,18 +86,102 @@ class ModernButton(QPushButton):
     @scale.setter
     def scale(self, value):
         self._scale = value
-        self.setFixedSize(int(80 * value), int(80 * value))
+        self.update()
         
-    def enterEvent(self, event):
-        self.animation.setStartValue(1.0)
-        self.animation.setEndValue(1.1)
-        self.animation.start()
-        super().enterEvent(event)
+    def state_pixmap(self):
+        """現在の状態の見た目（キャッシュ済み）"""
+        dpr = self.devicePixelRatioF()
+        key = (self.text(), self._hovered, self.isDown(), dpr)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            pixmap = self.render_state(self._hovered, self.isDown(), dpr)
+            self._pixmaps[key] = pixmap
+        return pixmap
+
+    def render_state(self, hovered, down, dpr):
+        """影とスタイルシートの描画を 1 枚のピックスマップに焼き込む"""
+        size = BUTTON_SIZE + 2 * SHADOW_MARGIN
+        pixmap = QPixmap(int(size * dpr), int(size * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # ドロップシャドウ（丸ボタンなので放射グラデーションで十分）
+        shadow_radius = BUTTON_SIZE / 2 + SHADOW_MARGIN - SHADOW_OFFSET
+        shadow = QRadialGradient(size / 2, size / 2 + SHADOW_OFFSET, shadow_radius)
+        shadow.setColorAt((BUTTON_SIZE / 2 - 10) / shadow_radius, QColor(0, 0, 0, 80))
+        shadow.setColorAt(1.0, QColor(0, 0, 0, 0))
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QBrush(shadow))
+        painter.drawEllipse(
+            int(size / 2 - shadow_radius), int(size / 2 + SHADOW_OFFSET - shadow_radius),
+            int(shadow_radius * 2), int(shadow_radius * 2)
+        )
+
+        option = QStyleOptionButton()
+        self.initStyleOption(option)
+        option.rect = QRect(SHADOW_MARGIN, SHADOW_MARGIN, BUTTON_SIZE, BUTTON_SIZE)
+        option.state &= ~(QStyle.StateFlag.State_MouseOver | QStyle.StateFlag.State_Sunken)
+        if hovered:
+            option.state |= QStyle.StateFlag.State_MouseOver
+        if down:
+            option.state |= QStyle.StateFlag.State_Sunken
+        self.style().drawControl(QStyle.ControlElement.CE_PushButton, option, painter, self)
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        pixmap = self.state_pixmap()
+        size = pixmap.deviceIndependentSize()
+        painter.translate(self.width() / 2, self.height() / 2)
+        painter.scale(self._scale, self._scale)
+        painter.drawPixmap(int(-size.width() / 2), int(-size.height() / 2), pixmap)
+        painter.end()
+
+    def changeEvent(self, event):
+        # スタイルシートやフォントが変わったら焼き直す
+        if event.type() in (QEvent.Type.StyleChange, QEvent.Type.FontChange,
+                            QEvent.Type.PaletteChange, QEvent.Type.EnabledChange):
+            self._pixmaps.clear()
+        super().changeEvent(event)
+
+    def set_mask_radius(self, radius):
+        """枠は隣と重なるので、重なる部分はクリックも描画も下のボタンに譲る"""
+        radius = int(radius)
+        if radius == self._mask_radius:
+            return
+        self._mask_radius = radius
+        if radius * 2 >= BUTTON_SLOT:
+            self.clearMask()
+        else:
+            center = BUTTON_SLOT // 2
+            self.setMask(QRegion(center - radius, center - radius, radius * 2, radius * 2,
+                                 QRegion.RegionType.Ellipse))
+
+    def hitButton(self, pos):
+        """円の内側だけをボタンとして扱う"""
+        radius = BUTTON_SIZE / 2 * self._scale
+        dx = pos.x() - self.width() / 2
+        dy = pos.y() - self.height() / 2
+        return dx * dx + dy * dy <= radius * radius
+
+    def set_hovered(self, hovered):
+        if hovered == self._hovered:
+            return
+        self._hovered = hovered
+        if not self.isDown():
+            self.animate_to(HOVER_SCALE if hovered else 1.0)
+        self.update()
+
+    def mouseMoveEvent(self, event):
+        self.set_hovered(self.hitButton(event.position().toPoint()))
+        super().mouseMoveEvent(event)
         
     def leaveEvent(self, event):
-        self.animation.setStartValue(1.1)
-        self.animation.setEndValue(1.0)
-        self.animation.start()
+        self.set_hovered(False)
         super().leaveEvent(event)
 
 class ModernFavoriteSettings(QDialog):
@@ -211,6 +338,13 @@ class ModernPiMenu(QWidget):
         super().__init__()
         self.favorite_buttons = []
         self.favorite_apps = []
+        # 現在のボタンがどのお気に入りから作られたか (name, command)
+        self.button_keys = None
+        self.layout_cache = {}
+        self.relayout_timer = QTimer(self)
+        self.relayout_timer.setSingleShot(True)
+        self.relayout_timer.setInterval(RELAYOUT_DELAY_MS)
+        self.relayout_timer.timeout.connect(self.layout_circle_buttons)
         self.init_ui()
 
     def init_ui(self):
@@ -286,30 +420,25 @@ class ModernPiMenu(QWidget):
         with open(CONFIG_FILE, "r") as file:
             data = json.load(file)
 
-        self.favorite_apps = [app for app in data["apps"] if app.get("favorite", False)]
+        # フォルダ項目（command なし）は main.py のリングだけが扱う
+        self.favorite_apps = [app for app in data["apps"] if app.get("favorite", False) and "command" in app]
 
     def create_circle_buttons(self):
-        """円形レイアウトでボタンを配置"""
+        """円形レイアウトでボタンを配置（お気に入りが変わったときだけ作り直す）"""
+        keys = [(app["name"], app["command"]) for app in self.favorite_apps]
+        if keys == self.button_keys:
+            self.layout_circle_buttons()
+            return
+
         for btn in self.favorite_buttons:
             btn.deleteLater()
         self.favorite_buttons.clear()
+        self.button_keys = keys
 
-        if not self.favorite_apps:
-            return
-
-        center_x = self.width() // 2
-        center_y = self.height() // 2
-        radius = min(self.width(), self.height()) // 3
-        
-        for i, app in enumerate(self.favorite_apps):
-            angle = (2 * math.pi * i / len(self.favorite_apps)) - (math.pi / 2)
-            x = center_x + (radius * math.cos(angle)) - 40
-            y = center_y + (radius * math.sin(angle)) - 40
-
+        for app in self.favorite_apps:
             btn = ModernButton(app["name"][:8], self)
             btn.app_command = app["command"]
             btn.clicked.connect(self.handle_button_click)
-            btn.move(int(x), int(y))
             
             # モダンなボタンスタイル
             btn.setStyleSheet("""
@@ -340,6 +469,37 @@ class ModernPiMenu(QWidget):
             btn.show()
             self.favorite_buttons.append(btn)
 
+        self.layout_circle_buttons()
+
+    def ring_layout(self):
+        """ウィンドウサイズとボタン数ごとにキャッシュした配置とマスク半径"""
+        key = (self.width(), self.height(), len(self.favorite_buttons))
+        positions = self.layout_cache.get(key)
+        if positions is None:
+            if len(self.layout_cache) >= LAYOUT_CACHE_SIZE:
+                self.layout_cache.clear()
+            radius = min(self.width(), self.height()) // 3
+            positions = [
+                (int(x), int(y))
+                for x, y in ring_positions(
+                    len(self.favorite_buttons),
+                    self.width() // 2,
+                    self.height() // 2,
+                    radius,
+                    BUTTON_SLOT,
+                )
+            ]
+            positions = (positions, slot_mask_radius(radius, len(self.favorite_buttons)))
+            self.layout_cache[key] = positions
+        return positions
+
+    def layout_circle_buttons(self):
+        """既存のボタンを動かすだけで再配置"""
+        positions, mask_radius = self.ring_layout()
+        for btn, (x, y) in zip(self.favorite_buttons, positions):
+            btn.move(x, y)
+            btn.set_mask_radius(mask_radius)
+
     def paintEvent(self, event):
         """モダンな背景描画"""
         painter = QPainter(self)
@@ -390,16 +550,16 @@ class ModernPiMenu(QWidget):
             else:
                 subprocess.run(command.split(), check=True)
         except subprocess.CalledProcessError as e:
-            print(f"アプリの起動に失敗しました: {e}")
+            log.error("アプリの起動に失敗しました: %s", e)
         except Exception as e:
-            print(f"アプリの起動に失敗しました: {e}")
+            log.error("アプリの起動に失敗しました: %s", e)
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
         # 設定ボタンの位置を調整
         self.settings_button.move(20, 20)
-        # アプリボタンを再配置
-        self.create_circle_buttons()
+        # アプリボタンの再配置はリサイズが落ち着いてから
+        self.relayout_timer.start()
 
     def mousePressEvent(self, event):
         """ウィンドウドラッグ機能"""
@@ -414,7 +574,13 @@ class ModernPiMenu(QWidget):
             event.accept()
 
 if __name__ == "__main__":
+    # app.py と同じく、ログはキュー経由でローテートするファイルへ。
+    # 直接実行ではロガー名が __main__ になるのでルートで受ける
+    listener = setup_logging(logger_name="")
     app = QApplication(sys.argv)
     ex = ModernPiMenu()
     ex.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    try:
+        sys.exit(app.exec())
+    finally:
+        listener.stop()
@@ -1,12 +1,12 @@
 import json
-import math
+import logging
 import os
 import subprocess
 import sys
 
 import shlex
 
-from PyQt6.QtCore import QSize
+from PyQt6.QtCore import QSize, QTimer
 from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtWidgets import QPushButton
@@ -15,7 +15,24 @@ from PyQt6.QtWidgets import QWidget
 from PyQt6.QtGui import QPainter
 
 
+try:
+    from .core.layout import ring_positions
+except ImportError:
+    # 直接実行時の絶対インポート
+    from core.layout import ring_positions
+
+try:
+    from .logconfig import setup_logging
+except ImportError:
+    from logconfig import setup_logging
+
 CONFIG_FILE = "./config.json"
+BUTTON_SIZE = 60
+# リサイズ中はこの間隔だけ待ってからまとめて再配置する
+RELAYOUT_DELAY_MS = 50
+LAYOUT_CACHE_SIZE = 64
+
+log = logging.getLogger(__name__)
 
 import json
 import os
@@ -43,7 +60,7 @@ class FavoriteSettings(QDialog):
     def load_apps(self):
         """config.json からアプリを読み込み、リストに表示"""
         if not os.path.exists(self.config_file):
-            print(f"⚠️ 設定ファイルが見つかりません: {self.config_file}")
+            log.warning("設定ファイルが見つかりません: %s", self.config_file)
             return
 
         with open(self.config_file, "r") as file:
@@ -79,7 +96,7 @@ class FavoriteSettings(QDialog):
         with open(self.config_file, "w") as file:
             json.dump(data, file, indent=4, ensure_ascii=False)
 
-        print("✅ お気に入りアプリを保存しました")
+        log.info("お気に入りアプリを保存しました")
         self.accept()
 
 class PiMenu(QWidget):
@@ -88,6 +105,13 @@ class PiMenu(QWidget):
         self.main_layout = QVBoxLayout(self)  # Define main_layout here
         self.favorite_buttons = []
         self.favorite_apps = []
+        # 現在のボタンがどのお気に入りから作られたか (name, command)
+        self.button_keys = None
+        self.layout_cache = {}
+        self.relayout_timer = QTimer(self)
+        self.relayout_timer.setSingleShot(True)
+        self.relayout_timer.setInterval(RELAYOUT_DELAY_MS)
+        self.relayout_timer.timeout.connect(self.layout_circle_buttons)
         self.initUI()
 
     def initUI(self):
@@ -189,42 +213,37 @@ class PiMenu(QWidget):
         self.favorite_apps = []
         
         if not os.path.exists(CONFIG_FILE):
-            print(f"⚠️ 設定ファイルが見つかりません: {CONFIG_FILE}")
+            log.warning("設定ファイルが見つかりません: %s", CONFIG_FILE)
             return
 
         with open(CONFIG_FILE, "r") as file:
             data = json.load(file)
 
-        self.favorite_apps = [app for app in data["apps"] if app.get("favorite", False)]
+        # フォルダ項目（command なし）は main.py のリングだけが扱う
+        self.favorite_apps = [app for app in data["apps"] if app.get("favorite", False) and "command" in app]
 
-        print(f"✅ お気に入りアプリを更新: {self.favorite_apps}")
+        log.debug("お気に入りアプリを更新: %s", self.favorite_apps)
     
     def create_circle_buttons(self):
-        """お気に入りアプリのボタンを円形レイアウトで作成"""
+        """お気に入りアプリのボタンを円形レイアウトで作成（お気に入りが変わったときだけ作り直す）"""
+        keys = [(app["name"], app["command"]) for app in self.favorite_apps]
+        if keys == self.button_keys:
+            self.layout_circle_buttons()
+            return
+
         # 既存のボタンを削除
         for btn in self.favorite_buttons:
             btn.deleteLater()
         self.favorite_buttons.clear()
+        self.button_keys = keys
 
         if not self.favorite_apps:
-            print("⚠️ お気に入りアプリがありません")
+            log.warning("お気に入りアプリがありません")
             return
 
-        # 円形レイアウトの中心と半径を計算
-        center_x = self.width() // 2
-        center_y = self.height() // 2
-        radius = min(self.width(), self.height()) // 2.5 - 80  # メインベゼルに合わせて調整
-        button_size = 60
-
-        for i, app in enumerate(self.favorite_apps):
-            angle = (2 * math.pi * i / len(self.favorite_apps)) - (math.pi / 2)
-            x = center_x + (radius * math.cos(angle)) - (button_size // 2)
-            y = center_y + (radius * math.sin(angle)) - (button_size // 2)
-
-            print(f"{app['name']} の位置: x={x}, y={y}")
-
+        for app in self.favorite_apps:
             btn = QPushButton(app["name"], self)
-            btn.setFixedSize(button_size, button_size)
+            btn.setFixedSize(BUTTON_SIZE, BUTTON_SIZE)
             btn.setIconSize(QSize(30, 30))
             btn.app_command = app["command"]
             btn.clicked.connect(self.handle_button_click)
@@ -260,12 +279,41 @@ class PiMenu(QWidget):
             """)
             btn.setIcon(QIcon(app.get("icon", "")))
             btn.setIconSize(QSize(40, 40))
-            btn.move(int(x), int(y))
             btn.setParent(self)
             btn.show()
 
             self.favorite_buttons.append(btn)
 
+        self.layout_circle_buttons()
+
+    def ring_layout(self):
+        """ウィンドウサイズとボタン数ごとにキャッシュした配置"""
+        key = (self.width(), self.height(), len(self.favorite_buttons))
+        positions = self.layout_cache.get(key)
+        if positions is None:
+            if len(self.layout_cache) >= LAYOUT_CACHE_SIZE:
+                self.layout_cache.clear()
+            # 円形レイアウトの中心と半径を計算
+            radius = min(self.width(), self.height()) // 2.5 - 80  # メインベゼルに合わせて調整
+            positions = [
+                (int(x), int(y))
+                for x, y in ring_positions(
+                    len(self.favorite_buttons),
+                    self.width() // 2,
+                    self.height() // 2,
+                    radius,
+                    BUTTON_SIZE,
+                )
+            ]
+            self.layout_cache[key] = positions
+        return positions
+
+    def layout_circle_buttons(self):
+        """既存のボタンを動かすだけで再配置"""
+        for btn, (x, y) in zip(self.favorite_buttons, self.ring_layout()):
+            log.debug("%s の位置: x=%s, y=%s", btn.text(), x, y)
+            btn.move(x, y)
+
 
     def paintEvent(self, _):
         painter = QPainter(self)
@@ -351,23 +399,20 @@ class PiMenu(QWidget):
         # 送信者のボタンからコマンドを取得
         button = self.sender()
         if not button:
-            print("⚠️ handle_button_click: クリックされたボタンが取得できませんでした")
+            log.warning("handle_button_click: クリックされたボタンが取得できませんでした")
             return
 
-        print(
-            f"クリックされたボタン: {button.text()}"
-        )  # クリックされたボタンのテキストを表示
+        log.debug("クリックされたボタン: %s", button.text())
 
         if hasattr(button, "app_command") and button.app_command:
-            print(f"実行するコマンド: {button.app_command}")  # 実行するコマンドを表示
             self.launch_app(button.app_command)
         else:
-            print("⚠️ ボタンにコマンドが設定されていません")
+            log.warning("ボタンにコマンドが設定されていません")
 
 
     def launch_app(self, command):
         try:
-            print(f"実行するコマンド: {command}")  # デバッグ出力
+            log.debug("実行するコマンド: %s", command)
 
             if command.startswith("open "):
                 # スペースを含むパスを適切に処理
@@ -376,21 +421,28 @@ class PiMenu(QWidget):
             else:
                 result = subprocess.run(command.split(), check=True, capture_output=True, text=True)
 
-            print(f"コマンド実行結果: {result.stdout}")  # 標準出力を表示
-            print(f"エラー出力: {result.stderr}")  # 標準エラーを表示
+            log.debug("コマンド実行結果: %s", result.stdout)
+            log.debug("エラー出力: %s", result.stderr)
 
         except subprocess.CalledProcessError as e:
-            print(f"アプリの起動に失敗しました: {e}\nコマンド: {command}")
+            log.error("アプリの起動に失敗しました: %s (コマンド: %s)", e, command)
         except Exception as e:
-            print(f"アプリの起動に失敗しました: {e}")
+            log.error("アプリの起動に失敗しました: %s", e)
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self.create_circle_buttons()  # ウィンドウサイズ変更時にボタンを再配置
+        # ボタンの再配置はリサイズが落ち着いてから
+        self.relayout_timer.start()
 
 
 if __name__ == "__main__":
+    # app.py と同じく、ログはキュー経由でローテートするファイルへ。
+    # 直接実行ではロガー名が __main__ になるのでルートで受ける
+    listener = setup_logging(logger_name="")
     app = QApplication(sys.argv)
     ex = PiMenu()
     ex.show()
-    sys.exit(app.exec())
+    try:
+        sys.exit(app.exec())
+    finally:
+        listener.stop()
@@ -5,18 +5,22 @@ Pi Menu - セーフモード版
 """
 
 import json
+import logging
 import math
 import os
 import subprocess
 import sys
 import shlex
 
+log = logging.getLogger(__name__)
+
 # PyQt6のインポートを安全に実行
 try:
-    from PyQt6.QtCore import QSize, Qt, QPropertyAnimation, QEasingCurve, QRect, pyqtProperty, QTimer
-    from PyQt6.QtGui import QIcon, QPainter, QPen, QBrush, QRadialGradient, QColor, QFont
+    from PyQt6.QtCore import QSize, Qt, QPropertyAnimation, QEasingCurve, QEvent, QRect, pyqtProperty, QTimer
+    from PyQt6.QtGui import QIcon, QPainter, QPen, QBrush, QRadialGradient, QColor, QFont, QPixmap, QRegion
     from PyQt6.QtWidgets import (QApplication, QPushButton, QVBoxLayout, QWidget, 
-                               QDialog, QListWidget, QListWidgetItem, QCheckBox, QGraphicsDropShadowEffect, QToolTip)
+                               QDialog, QListWidget, QListWidgetItem, QCheckBox, QToolTip,
+                               QStyle, QStyleOptionButton)
     PYQT6_AVAILABLE = True
 except ImportError as e:
     print(f"❌ PyQt6のインポートに失敗しました: {e}")
@@ -26,6 +30,13 @@ except ImportError as e:
     PYQT6_AVAILABLE = False
     sys.exit(1)
 
+# 円形配置の計算（core は PyQt6 に依存しない）
+try:
+    from .core.layout import ring_positions
+except ImportError:
+    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+    from core.layout import ring_positions
+
 # アイコンシステムのインポート
 try:
     try:
@@ -37,14 +48,13 @@ try:
         from icon_system import IconSystem
     ICON_SYSTEM_AVAILABLE = True
 except ImportError as e:
-    print(f"❌ アイコンシステムのインポートに失敗しました: {e}")
-    print("フォールバックモードで実行します...")
+    log.warning("アイコンシステムのインポートに失敗しました: %s (フォールバックモードで実行します)", e)
     ICON_SYSTEM_AVAILABLE = False
     
     # フォールバック用のダミーアイコンシステム
     class IconSystem:
         @staticmethod
-        def get_app_info(app_name):
+        def get_app_info(app_name, bundle_id=None):
             return {
                 'icon': '📱',
                 'display_name': app_name[:8],
@@ -53,6 +63,32 @@ except ImportError as e:
                 'full_name': app_name
             }
 
+        @staticmethod
+        def bundle_id_for_app(app):
+            return app.get('bundle_id')
+
+        @classmethod
+        def classify_catalog(cls, apps):
+            return [cls.get_app_info(app.get('name', '')) for app in apps]
+
+# アイコン画像からのボタン着色（パッケージとして実行した場合のみ）
+try:
+    from .icon_cache import IconCache
+    from .icon_colors import button_colors
+    from .main import _qt_icon_for_app
+    ICON_TINT_AVAILABLE = True
+except ImportError:
+    ICON_TINT_AVAILABLE = False
+
+# ログはキュー経由で書き出す
+try:
+    from .logconfig import setup_logging
+except ImportError:
+    try:
+        from logconfig import setup_logging
+    except ImportError:
+        setup_logging = None
+
 # 設定ファイルパスを動的に設定
 def get_config_path():
     if __name__ == "__main__":
@@ -63,23 +99,50 @@ def get_config_path():
         return "./config.json"
 
 CONFIG_FILE = get_config_path()
+BUTTON_SIZE = 90
+HOVER_SCALE = 1.1
+PRESS_SCALE = 1.0
+# 焼き込んだ影の余白（ぼかし 10px + 下方向オフセット 4px）
+SHADOW_MARGIN = 14
+SHADOW_OFFSET = 4
+# ウィジェット自体は拡大後の大きさで固定し、描画だけを拡大する
+BUTTON_SLOT = int(BUTTON_SIZE * HOVER_SCALE + 0.5) + 2 * SHADOW_MARGIN
+# リサイズ中はこの間隔だけ待ってからまとめて再配置する
+RELAYOUT_DELAY_MS = 50
+LAYOUT_CACHE_SIZE = 64
+
+
+def slot_mask_radius(ring_radius, count):
+    """隣のボタンと重ならない入力・描画範囲の半径（拡大したボタンの円は削らない）"""
+    if count < 2:
+        return BUTTON_SLOT / 2
+    half_spacing = ring_radius * math.sin(math.pi / count)
+    return max(BUTTON_SIZE * HOVER_SCALE / 2, min(BUTTON_SLOT / 2, half_spacing))
+
 
 class SafeModernButton(QPushButton):
-    """エラーハンドリング強化版モダンボタン"""
+    """エラーハンドリング強化版モダンボタン
+
+    ホバー・押下の拡大はペインタの変換で描くだけで、ジオメトリは変えない。
+    状態ごとの見た目（影込み）は一度だけピックスマップに描いて使い回す。
+    """
     
     def __init__(self, app_info, parent=None):
         super().__init__(parent)
         self.app_info = app_info
         self._scale = 1.0
-        self.setFixedSize(90, 90)
+        self._hovered = False
+        self._pixmaps = {}
+        self._mask_radius = None
+        self.setFixedSize(BUTTON_SLOT, BUTTON_SLOT)
+        self.setMouseTracking(True)
         
         try:
             self.setup_content()
             self.setup_animation()
-            self.setup_shadow()
             self.setup_tooltip()
         except Exception as e:
-            print(f"⚠️ ボタン初期化エラー: {e}")
+            log.warning("ボタン初期化エラー: %s", e)
             self.setText(self.app_info.get('display_name', 'App'))
         
     def setup_content(self):
@@ -94,26 +157,28 @@ class SafeModernButton(QPushButton):
             self.animation = QPropertyAnimation(self, b"scale")
             self.animation.setDuration(200)
             self.animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+            self.pressed.connect(lambda: self.animate_to(PRESS_SCALE))
+            self.released.connect(lambda: self.animate_to(HOVER_SCALE if self._hovered else 1.0))
         except Exception as e:
-            print(f"⚠️ アニメーション設定エラー: {e}")
+            log.warning("アニメーション設定エラー: %s", e)
         
-    def setup_shadow(self):
-        """ドロップシャドウ効果"""
+    def animate_to(self, value):
+        """現在の倍率から目標の倍率へアニメーション"""
         try:
-            shadow = QGraphicsDropShadowEffect()
-            shadow.setBlurRadius(20)
-            shadow.setOffset(0, 4)
-            shadow.setColor(QColor(0, 0, 0, 80))
-            self.setGraphicsEffect(shadow)
+            if hasattr(self, 'animation'):
+                self.animation.stop()
+                self.animation.setStartValue(self._scale)
+                self.animation.setEndValue(value)
+                self.animation.start()
         except Exception as e:
-            print(f"⚠️ シャドウ設定エラー: {e}")
+            log.warning("アニメーションエラー: %s", e)
         
     def setup_tooltip(self):
         """ツールチップを設定"""
         try:
             self.setToolTip(self.app_info.get('full_name', 'アプリケーション'))
         except Exception as e:
-            print(f"⚠️ ツールチップ設定エラー: {e}")
+            log.warning("ツールチップ設定エラー: %s", e)
         
     def get_button_style(self):
         """カテゴリに応じたスタイルを生成"""
@@ -146,7 +211,7 @@ class SafeModernButton(QPushButton):
                 }}
             """
         except Exception as e:
-            print(f"⚠️ スタイル生成エラー: {e}")
+            log.warning("スタイル生成エラー: %s", e)
             return "SafeModernButton { background: blue; color: white; border-radius: 45px; }"
         
     @pyqtProperty(float)
@@ -156,29 +221,116 @@ class SafeModernButton(QPushButton):
     @scale.setter
     def scale(self, value):
         self._scale = value
+        self.update()
+
+    def state_pixmap(self):
+        """現在の状態の見た目（キャッシュ済み）"""
+        dpr = self.devicePixelRatioF()
+        key = (self.text(), self._hovered, self.isDown(), dpr)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            pixmap = self.render_state(self._hovered, self.isDown(), dpr)
+            self._pixmaps[key] = pixmap
+        return pixmap
+
+    def render_state(self, hovered, down, dpr):
+        """影とスタイルシートの描画を 1 枚のピックスマップに焼き込む"""
+        size = BUTTON_SIZE + 2 * SHADOW_MARGIN
+        pixmap = QPixmap(int(size * dpr), int(size * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
         try:
-            self.setFixedSize(int(90 * value), int(90 * value))
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+            # ドロップシャドウ（丸ボタンなので放射グラデーションで十分）
+            shadow_radius = BUTTON_SIZE / 2 + SHADOW_MARGIN - SHADOW_OFFSET
+            shadow = QRadialGradient(size / 2, size / 2 + SHADOW_OFFSET, shadow_radius)
+            shadow.setColorAt((BUTTON_SIZE / 2 - 10) / shadow_radius, QColor(0, 0, 0, 80))
+            shadow.setColorAt(1.0, QColor(0, 0, 0, 0))
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QBrush(shadow))
+            painter.drawEllipse(
+                int(size / 2 - shadow_radius), int(size / 2 + SHADOW_OFFSET - shadow_radius),
+                int(shadow_radius * 2), int(shadow_radius * 2)
+            )
+
+            option = QStyleOptionButton()
+            self.initStyleOption(option)
+            option.rect = QRect(SHADOW_MARGIN, SHADOW_MARGIN, BUTTON_SIZE, BUTTON_SIZE)
+            option.state &= ~(QStyle.StateFlag.State_MouseOver | QStyle.StateFlag.State_Sunken)
+            if hovered:
+                option.state |= QStyle.StateFlag.State_MouseOver
+            if down:
+                option.state |= QStyle.StateFlag.State_Sunken
+            self.style().drawControl(QStyle.ControlElement.CE_PushButton, option, painter, self)
         except Exception as e:
-            print(f"⚠️ スケール設定エラー: {e}")
+            log.warning("ボタン描画エラー: %s", e)
+        finally:
+            painter.end()
+        return pixmap
         
-    def enterEvent(self, event):
+    def paintEvent(self, event):
+        painter = QPainter(self)
         try:
-            if hasattr(self, 'animation'):
-                self.animation.setStartValue(1.0)
-                self.animation.setEndValue(1.1)
-                self.animation.start()
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+            pixmap = self.state_pixmap()
+            size = pixmap.deviceIndependentSize()
+            painter.translate(self.width() / 2, self.height() / 2)
+            painter.scale(self._scale, self._scale)
+            painter.drawPixmap(int(-size.width() / 2), int(-size.height() / 2), pixmap)
         except Exception as e:
-            print(f"⚠️ ホバーエラー: {e}")
-        super().enterEvent(event)
+            log.warning("ボタン描画エラー: %s", e)
+        finally:
+            painter.end()
+
+    def changeEvent(self, event):
+        # スタイルやフォントが変わったら焼き直す
+        if event.type() in (QEvent.Type.StyleChange, QEvent.Type.FontChange,
+                            QEvent.Type.PaletteChange, QEvent.Type.EnabledChange):
+            self._pixmaps.clear()
+        super().changeEvent(event)
+
+    def set_mask_radius(self, radius):
+        """枠は隣と重なるので、重なる部分はクリックも描画も下のボタンに譲る"""
+        radius = int(radius)
+        if radius == self._mask_radius:
+            return
+        self._mask_radius = radius
+        if radius * 2 >= BUTTON_SLOT:
+            self.clearMask()
+        else:
+            center = BUTTON_SLOT // 2
+            self.setMask(QRegion(center - radius, center - radius, radius * 2, radius * 2,
+                                 QRegion.RegionType.Ellipse))
+
+    def hitButton(self, pos):
+        """円の内側だけをボタンとして扱う"""
+        radius = BUTTON_SIZE / 2 * self._scale
+        dx = pos.x() - self.width() / 2
+        dy = pos.y() - self.height() / 2
+        return dx * dx + dy * dy <= radius * radius
+
+    def set_hovered(self, hovered):
+        if hovered == self._hovered:
+            return
+        self._hovered = hovered
+        if not self.isDown():
+            self.animate_to(HOVER_SCALE if hovered else 1.0)
+        self.update()
+
+    def mouseMoveEvent(self, event):
+        try:
+            self.set_hovered(self.hitButton(event.position().toPoint()))
+        except Exception as e:
+            log.warning("ホバーエラー: %s", e)
+        super().mouseMoveEvent(event)
         
     def leaveEvent(self, event):
         try:
-            if hasattr(self, 'animation'):
-                self.animation.setStartValue(1.1)
-                self.animation.setEndValue(1.0)
-                self.animation.start()
+            self.set_hovered(False)
         except Exception as e:
-            print(f"⚠️ ホバー終了エラー: {e}")
+            log.warning("ホバー終了エラー: %s", e)
         super().leaveEvent(event)
 
 class SafeFavoriteSettings(QDialog):
@@ -194,7 +346,7 @@ class SafeFavoriteSettings(QDialog):
             self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
             self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         except Exception as e:
-            print(f"⚠️ ウィンドウ設定エラー: {e}")
+            log.warning("ウィンドウ設定エラー: %s", e)
         
         self.setup_ui()
         self.apply_modern_style()
@@ -231,7 +383,7 @@ class SafeFavoriteSettings(QDialog):
             layout.addWidget(close_button)
             
         except Exception as e:
-            print(f"⚠️ UI設定エラー: {e}")
+            log.warning("UI設定エラー: %s", e)
 
     def apply_modern_style(self):
         """モダンなスタイルを適用"""
@@ -301,21 +453,23 @@ class SafeFavoriteSettings(QDialog):
                 }
             """)
         except Exception as e:
-            print(f"⚠️ スタイル適用エラー: {e}")
+            log.warning("スタイル適用エラー: %s", e)
 
     def load_apps(self):
         """アプリリストを読み込み"""
         try:
             if not os.path.exists(self.config_file):
-                print(f"⚠️ 設定ファイルが見つかりません: {self.config_file}")
+                log.warning("設定ファイルが見つかりません: %s", self.config_file)
                 return
 
             with open(self.config_file, "r", encoding='utf-8') as file:
                 data = json.load(file)
 
-            for app in data["apps"]:
+            # カタログ全体を1パスで分類（結果はメモ化される）
+            app_infos = IconSystem.classify_catalog(data["apps"])
+
+            for app, app_info in zip(data["apps"], app_infos):
                 try:
-                    app_info = IconSystem.get_app_info(app['name'])
                     icon = app_info['icon']
                     display_name = app_info['display_name']
                     
@@ -331,10 +485,10 @@ class SafeFavoriteSettings(QDialog):
                     self.app_list.setItemWidget(item, checkbox)
                     
                 except Exception as e:
-                    print(f"⚠️ アプリ項目作成エラー ({app.get('name', 'Unknown')}): {e}")
+                    log.warning("アプリ項目作成エラー (%s): %s", app.get('name', 'Unknown'), e)
                     
         except Exception as e:
-            print(f"⚠️ アプリリスト読み込みエラー: {e}")
+            log.warning("アプリリスト読み込みエラー: %s", e)
 
     def toggle_favorite(self, item, state):
         """お気に入り状態を切り替え"""
@@ -342,15 +496,15 @@ class SafeFavoriteSettings(QDialog):
             app = item.data(Qt.ItemDataRole.UserRole)
             if app:
                 app["favorite"] = (state == 2)  # Qt.Checked = 2
-                print(f"🔄 {app['name']}: favorite = {app['favorite']}")
+                log.debug("%s: favorite = %s", app['name'], app['favorite'])
         except Exception as e:
-            print(f"⚠️ お気に入り切り替えエラー: {e}")
+            log.warning("お気に入り切り替えエラー: %s", e)
 
     def save_favorites(self):
         """お気に入り設定を保存"""
         try:
             if not os.path.exists(self.config_file):
-                print(f"⚠️ 設定ファイルが見つかりません: {self.config_file}")
+                log.warning("設定ファイルが見つかりません: %s", self.config_file)
                 return
 
             # 現在の設定ファイルを読み込み
@@ -369,21 +523,21 @@ class SafeFavoriteSettings(QDialog):
                         for app in data["apps"]:
                             if app["name"] == app_data["name"]:
                                 app["favorite"] = checkbox.isChecked()
-                                print(f"💾 保存: {app['name']} = {app['favorite']}")
+                                log.debug("保存: %s = %s", app['name'], app['favorite'])
                                 break
                                 
                 except Exception as e:
-                    print(f"⚠️ 個別アプリ保存エラー: {e}")
+                    log.warning("個別アプリ保存エラー: %s", e)
 
             # ファイルに書き込み
             with open(self.config_file, "w", encoding='utf-8') as file:
                 json.dump(data, file, indent=4, ensure_ascii=False)
 
-            print("✅ お気に入り設定を保存しました")
+            log.info("お気に入り設定を保存しました")
             self.accept()
             
         except Exception as e:
-            print(f"❌ 設定保存エラー: {e}")
+            log.error("設定保存エラー: %s", e)
 
 class SafePiMenu(QWidget):
     """エラーハンドリング強化版Pi Menu"""
@@ -392,11 +546,19 @@ class SafePiMenu(QWidget):
         super().__init__()
         self.favorite_buttons = []
         self.favorite_apps = []
+        self.icon_cache = IconCache(_qt_icon_for_app) if ICON_TINT_AVAILABLE else None
+        # 現在のボタンがどのお気に入りから作られたか (name, command)
+        self.button_keys = None
+        self.layout_cache = {}
+        self.relayout_timer = QTimer(self)
+        self.relayout_timer.setSingleShot(True)
+        self.relayout_timer.setInterval(RELAYOUT_DELAY_MS)
+        self.relayout_timer.timeout.connect(self.layout_circle_buttons)
         
         try:
             self.init_ui()
         except Exception as e:
-            print(f"❌ UI初期化エラー: {e}")
+            log.error("UI初期化エラー: %s", e)
             self.show_error_message()
 
     def show_error_message(self):
@@ -423,7 +585,7 @@ class SafePiMenu(QWidget):
             self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
             self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         except Exception as e:
-            print(f"⚠️ ウィンドウ設定エラー: {e}")
+            log.warning("ウィンドウ設定エラー: %s", e)
         
         self.apply_modern_style()
         self.load_favorites()
@@ -441,7 +603,7 @@ class SafePiMenu(QWidget):
                 }
             """)
         except Exception as e:
-            print(f"⚠️ スタイル適用エラー: {e}")
+            log.warning("スタイル適用エラー: %s", e)
 
     def create_settings_button(self):
         """設定ボタンの作成"""
@@ -464,7 +626,7 @@ class SafePiMenu(QWidget):
                 }
             """)
         except Exception as e:
-            print(f"⚠️ 設定ボタン作成エラー: {e}")
+            log.warning("設定ボタン作成エラー: %s", e)
 
     def open_favorite_settings(self):
         """お気に入りアプリの設定ウィンドウを開く"""
@@ -474,7 +636,7 @@ class SafePiMenu(QWidget):
                 self.load_favorites()
                 self.create_circle_buttons()
         except Exception as e:
-            print(f"⚠️ 設定ダイアログエラー: {e}")
+            log.warning("設定ダイアログエラー: %s", e)
 
     def load_favorites(self):
         """お気に入りアプリを読み込み"""
@@ -482,62 +644,108 @@ class SafePiMenu(QWidget):
         
         try:
             if not os.path.exists(CONFIG_FILE):
-                print(f"⚠️ 設定ファイルが見つかりません: {CONFIG_FILE}")
+                log.warning("設定ファイルが見つかりません: %s", CONFIG_FILE)
                 return
 
             with open(CONFIG_FILE, "r", encoding='utf-8') as file:
                 data = json.load(file)
 
-            self.favorite_apps = [app for app in data["apps"] if app.get("favorite", False)]
-            print(f"✅ お気に入りアプリを読み込み: {len(self.favorite_apps)} 件")
+            # フォルダ項目（command なし）は main.py のリングだけが扱う
+            self.favorite_apps = [app for app in data["apps"] if app.get("favorite", False) and "command" in app]
+            log.info("お気に入りアプリを読み込み: %s 件", len(self.favorite_apps))
             
         except Exception as e:
-            print(f"⚠️ お気に入り読み込みエラー: {e}")
+            log.warning("お気に入り読み込みエラー: %s", e)
 
     def create_circle_buttons(self):
-        """円形レイアウトでボタンを配置"""
+        """円形レイアウトでボタンを配置（お気に入りが変わったときだけ作り直す）"""
         try:
+            keys = [(app["name"], app["command"]) for app in self.favorite_apps]
+            if keys == self.button_keys:
+                self.layout_circle_buttons()
+                return
+
             for btn in self.favorite_buttons:
                 btn.deleteLater()
             self.favorite_buttons.clear()
+            self.button_keys = keys
 
             if not self.favorite_apps:
-                print("⚠️ お気に入りアプリがありません")
+                log.warning("お気に入りアプリがありません")
                 return
 
-            center_x = self.width() // 2
-            center_y = self.height() // 2
-            radius = min(self.width(), self.height()) // 3
-            
-            for i, app in enumerate(self.favorite_apps):
-                angle = (2 * math.pi * i / len(self.favorite_apps)) - (math.pi / 2)
-                x = center_x + (radius * math.cos(angle)) - 45
-                y = center_y + (radius * math.sin(angle)) - 45
-
+            for app in self.favorite_apps:
                 try:
-                    app_info = IconSystem.get_app_info(app["name"])
+                    app_info = IconSystem.get_app_info(app["name"], IconSystem.bundle_id_for_app(app))
+                    app_info = self.tinted_app_info(app, app_info)
                     btn = SafeModernButton(app_info, self)
                     btn.app_command = app["command"]
                     btn.clicked.connect(self.handle_button_click)
-                    btn.move(int(x), int(y))
                     btn.setStyleSheet(btn.get_button_style())
                     btn.show()
                     self.favorite_buttons.append(btn)
                 except Exception as e:
-                    print(f"⚠️ ボタン作成エラー ({app['name']}): {e}")
+                    log.warning("ボタン作成エラー (%s): %s", app['name'], e)
+
+            self.layout_circle_buttons()
                     
         except Exception as e:
-            print(f"⚠️ 円形ボタン作成エラー: {e}")
+            log.warning("円形ボタン作成エラー: %s", e)
+
+    def ring_layout(self):
+        """ウィンドウサイズとボタン数ごとにキャッシュした配置とマスク半径"""
+        key = (self.width(), self.height(), len(self.favorite_buttons))
+        positions = self.layout_cache.get(key)
+        if positions is None:
+            if len(self.layout_cache) >= LAYOUT_CACHE_SIZE:
+                self.layout_cache.clear()
+            radius = min(self.width(), self.height()) // 3
+            positions = [
+                (int(x), int(y))
+                for x, y in ring_positions(
+                    len(self.favorite_buttons),
+                    self.width() // 2,
+                    self.height() // 2,
+                    radius,
+                    BUTTON_SLOT,
+                )
+            ]
+            positions = (positions, slot_mask_radius(radius, len(self.favorite_buttons)))
+            self.layout_cache[key] = positions
+        return positions
+
+    def layout_circle_buttons(self):
+        """既存のボタンを動かすだけで再配置"""
+        try:
+            positions, mask_radius = self.ring_layout()
+            for btn, (x, y) in zip(self.favorite_buttons, positions):
+                btn.move(x, y)
+                btn.set_mask_radius(mask_radius)
+        except Exception as e:
+            log.warning("再配置エラー: %s", e)
+
+    def tinted_app_info(self, app, app_info):
+        """アイコンの主要色・アクセント色でカテゴリ配色を置き換える"""
+        if self.icon_cache is None:
+            return app_info
+        try:
+            tint = self.icon_cache.tint(app.get("command", ""))
+        except Exception as e:
+            log.warning("配色抽出エラー (%s): %s", app.get('name', 'Unknown'), e)
+            return app_info
+        if tint is None:
+            return app_info
+        return {**app_info, "colors": button_colors(tint)}
 
     def handle_button_click(self):
         """ボタンクリック処理"""
         try:
             button = self.sender()
             if hasattr(button, "app_command") and button.app_command:
-                print(f"🚀 アプリ起動: {button.app_info['full_name']}")
+                log.info("アプリ起動: %s", button.app_info['full_name'])
                 self.launch_app(button.app_command)
         except Exception as e:
-            print(f"⚠️ ボタンクリックエラー: {e}")
+            log.warning("ボタンクリックエラー: %s", e)
 
     def launch_app(self, command):
         """アプリケーション起動"""
@@ -547,11 +755,11 @@ class SafePiMenu(QWidget):
                 subprocess.run(command, shell=True, check=True)
             else:
                 subprocess.run(command.split(), check=True)
-            print(f"✅ アプリ起動成功")
+            log.info("アプリ起動成功")
         except subprocess.CalledProcessError as e:
-            print(f"❌ アプリの起動に失敗しました: {e}")
+            log.error("アプリの起動に失敗しました: %s", e)
         except Exception as e:
-            print(f"❌ アプリ起動エラー: {e}")
+            log.error("アプリ起動エラー: %s", e)
 
     def paintEvent(self, event):
         """モダンな背景描画"""
@@ -592,7 +800,7 @@ class SafePiMenu(QWidget):
             painter.drawEllipse(int(center_x - 4), int(center_y - 4), 8, 8)
             
         except Exception as e:
-            print(f"⚠️ 描画エラー: {e}")
+            log.warning("描画エラー: %s", e)
 
     def resizeEvent(self, event):
         """リサイズイベント"""
@@ -600,9 +808,10 @@ class SafePiMenu(QWidget):
             super().resizeEvent(event)
             if hasattr(self, 'settings_button'):
                 self.settings_button.move(20, 20)
-            self.create_circle_buttons()
+            # ボタンの再配置はリサイズが落ち着いてから
+            self.relayout_timer.start()
         except Exception as e:
-            print(f"⚠️ リサイズエラー: {e}")
+            log.warning("リサイズエラー: %s", e)
 
     def mousePressEvent(self, event):
         """ウィンドウドラッグ機能"""
@@ -611,7 +820,7 @@ class SafePiMenu(QWidget):
                 self.drag_position = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
                 event.accept()
         except Exception as e:
-            print(f"⚠️ マウスプレスエラー: {e}")
+            log.warning("マウスプレスエラー: %s", e)
 
     def mouseMoveEvent(self, event):
         """ウィンドウドラッグ機能"""
@@ -620,10 +829,16 @@ class SafePiMenu(QWidget):
                 self.move(event.globalPosition().toPoint() - self.drag_position)
                 event.accept()
         except Exception as e:
-            print(f"⚠️ マウスムーブエラー: {e}")
+            log.warning("マウスムーブエラー: %s", e)
 
 def main():
     """メイン実行関数"""
+    if setup_logging is not None:
+        # 直接実行ではロガー名が __main__ になるのでルートで受ける
+        listener = setup_logging(logger_name="")
+    else:
+        listener = None
+        logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
     try:
         if not PYQT6_AVAILABLE:
             print("❌ PyQt6が利用できません。終了します。")
@@ -637,13 +852,14 @@ def main():
         menu = SafePiMenu()
         menu.show()
         
-        print("✅ Pi Menu が起動しました")
+        log.info("Pi Menu が起動しました")
         sys.exit(app.exec())
         
     except Exception as e:
-        print(f"❌ 起動エラー: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception("起動エラー: %s", e)
+    finally:
+        if listener is not None:
+            listener.stop()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
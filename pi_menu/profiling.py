@@ -0,0 +1,169 @@
+"""Startup phase timeline.
+
+Enabled with ``pi-menu --profile-startup`` or ``PI_MENU_PROFILE_STARTUP=1``.
+Phases are written as a Chrome trace-event file (open in chrome://tracing or
+https://ui.perfetto.dev) plus a text summary. Two runs can be compared with
+
+    python -m pi_menu.profiling compare old.json new.json
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+ENV_VAR = "PI_MENU_PROFILE_STARTUP"
+
+
+def app_version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("pi-menu")
+    except Exception:
+        return "unknown"
+
+
+def trace_event(name: str, ts_us: float, dur_us: float | None, tid: int, cat: str, args=None) -> dict:
+    event = {
+        "name": name,
+        "cat": cat,
+        "ph": "X" if dur_us is not None else "i",
+        "ts": round(ts_us, 3),
+        "pid": os.getpid(),
+        "tid": tid,
+    }
+    if dur_us is not None:
+        event["dur"] = round(dur_us, 3)
+    else:
+        event["s"] = "p"
+    if args:
+        event["args"] = args
+    return event
+
+
+def write_trace(path: Path, events: list[dict], metadata: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(
+            {"traceEvents": events, "displayTimeUnit": "ms", "metadata": metadata},
+            f,
+            ensure_ascii=False,
+        )
+
+
+class StartupProfiler:
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.enabled = os.environ.get(ENV_VAR, "") not in ("", "0")
+        self.phases: list[tuple[str, float, float | None, int, dict | None]] = []
+        self._depth = 0
+        self._written = False
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def now_us(self) -> float:
+        return (time.perf_counter() - self.origin) * 1e6
+
+    @contextmanager
+    def phase(self, name: str, **args):
+        if not self.enabled:
+            yield
+            return
+        start = self.now_us()
+        depth = self._depth
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.phases.append((name, start, self.now_us() - start, depth, args or None))
+
+    def mark(self, name: str, **args) -> None:
+        if self.enabled:
+            self.phases.append((name, self.now_us(), None, self._depth, args or None))
+
+    def trace_events(self) -> list[dict]:
+        tid = threading.main_thread().ident or 0
+        return [
+            trace_event(name, start, dur, tid, "startup", args)
+            for name, start, dur, _depth, args in sorted(self.phases, key=lambda p: p[1])
+        ]
+
+    def summary(self) -> str:
+        lines = [f"pi-menu {app_version()} startup ({platform.system()}, Python {platform.python_version()})"]
+        for name, start, dur, depth, args in sorted(self.phases, key=lambda p: (p[1], p[3])):
+            label = "  " * depth + name
+            if args and "app" in args:
+                label += f" [{args['app']}]"
+            if dur is None:
+                lines.append(f"{start / 1000:9.1f} ms  {'':>9}  {label}")
+            else:
+                lines.append(f"{start / 1000:9.1f} ms  {dur / 1000:7.1f} ms  {label}")
+        return "\n".join(lines)
+
+    def write(self, directory: Path) -> Path | None:
+        if not self.enabled or self._written:
+            return None
+        self._written = True
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        trace_path = directory / f"startup-{stamp}.json"
+        metadata = {
+            "version": app_version(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        }
+        summary = self.summary()
+        try:
+            write_trace(trace_path, self.trace_events(), metadata)
+            trace_path.with_suffix(".txt").write_text(summary + "\n")
+        except OSError as e:
+            print(f"Failed to write startup profile: {e}", file=sys.stderr)
+            return None
+        print(summary, file=sys.stderr)
+        print(f"trace: {trace_path}", file=sys.stderr)
+        return trace_path
+
+
+startup_profiler = StartupProfiler()
+
+
+def _phase_totals(path: Path) -> dict[str, float]:
+    with open(path) as f:
+        events = json.load(f)["traceEvents"]
+    totals: dict[str, float] = {}
+    for event in events:
+        if event.get("ph") == "X":
+            totals[event["name"]] = totals.get(event["name"], 0.0) + event["dur"] / 1000
+        elif event.get("ph") == "i":
+            totals[event["name"]] = event["ts"] / 1000
+    return totals
+
+
+def compare(old: Path, new: Path) -> str:
+    before, after = _phase_totals(old), _phase_totals(new)
+    lines = [f"{'phase':32} {'old ms':>9} {'new ms':>9} {'delta':>9}"]
+    for name in list(dict.fromkeys([*before, *after])):
+        a, b = before.get(name), after.get(name)
+        if a is None or b is None:
+            old_ms = "-" if a is None else f"{a:.1f}"
+            new_ms = "-" if b is None else f"{b:.1f}"
+            lines.append(f"{name:32} {old_ms:>9} {new_ms:>9}")
+            continue
+        lines.append(f"{name:32} {a:9.1f} {b:9.1f} {b - a:+9.1f}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "compare":
+        print(compare(Path(sys.argv[2]), Path(sys.argv[3])))
+    else:
+        print("usage: python -m pi_menu.profiling compare OLD.json NEW.json", file=sys.stderr)
+        raise SystemExit(2)
@@ -0,0 +1,132 @@
+"""Adaptive render quality: step paint work down when frames miss the budget.
+
+Each tier drops one more feature on top of the previous one -- the glow
+passes, then the item shadows, then antialiasing on the ring, then the ring
+animation itself. A tier is left downwards when half of the recent paints
+miss the budget, and upwards only after a cooldown with every recent paint
+well inside it. Falling straight back after stepping up doubles the cooldown,
+so a tier that does not fit is not retried every few seconds. Without the
+animation nothing repaints on its own, so probe paints are spaced a cooldown
+apart, counted from the tier change or the previous probe.
+
+``PI_MENU_QUALITY=<tier>`` pins a tier and turns adaptation off.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections import deque
+from itertools import islice
+
+ENV_VAR = "PI_MENU_QUALITY"
+TIERS = ("full", "no-glow", "no-shadows", "no-antialias", "static")
+# One 60 Hz frame; the window server still needs its share after paintEvent.
+FRAME_BUDGET_MS = 16.0
+DOWN_WINDOW = 8
+DOWN_MISSES = 4
+UP_SAMPLES = 60
+HEADROOM = 0.5
+COOLDOWN_S = 2.0
+MAX_COOLDOWN_S = 60.0
+
+log = logging.getLogger(__name__)
+
+
+class QualityController:
+    """Picks a render tier from recent paint times, with hysteresis between tiers."""
+
+    def __init__(self, budget_ms: float = FRAME_BUDGET_MS, pinned: str | None = None):
+        self.budget_ms = budget_ms
+        self.pinned = pinned
+        self.tier = TIERS.index(pinned) if pinned is not None else 0
+        self.changes = 0
+        self.cooldown_s = COOLDOWN_S
+        self._samples: deque[float] = deque(maxlen=UP_SAMPLES)
+        self._changed_at = time.monotonic()
+        self._probed_at = float("-inf")
+        self._stepped_up = False
+
+    @classmethod
+    def from_env(cls) -> QualityController:
+        value = os.environ.get(ENV_VAR, "").strip().lower()
+        if value and value not in TIERS:
+            log.warning("Ignoring %s=%s; expected one of %s", ENV_VAR, value, ", ".join(TIERS))
+            value = ""
+        return cls(pinned=value or None)
+
+    @property
+    def name(self) -> str:
+        return TIERS[self.tier]
+
+    @property
+    def glow(self) -> bool:
+        return self.tier < 1
+
+    @property
+    def shadows(self) -> bool:
+        return self.tier < 2
+
+    @property
+    def antialias(self) -> bool:
+        return self.tier < 3
+
+    @property
+    def animation(self) -> bool:
+        return self.tier < 4
+
+    def record(self, paint_ms: float, now: float | None = None) -> bool:
+        """Feed one paint time; returns True when the tier changed."""
+        if self.pinned is not None:
+            return False
+        now = time.monotonic() if now is None else now
+        self._samples.append(paint_ms)
+
+        recent = list(islice(reversed(self._samples), DOWN_WINDOW))
+        misses = sum(1 for ms in recent if ms > self.budget_ms)
+        if misses >= DOWN_MISSES and self.tier < len(TIERS) - 1:
+            if self._stepped_up and now - self._changed_at < self.cooldown_s:
+                self.cooldown_s = min(self.cooldown_s * 2, MAX_COOLDOWN_S)
+            self._set_tier(self.tier + 1, now, stepped_up=False)
+            return True
+
+        # Without animation only the occasional probe or hover paints.
+        needed = UP_SAMPLES if self.animation else 1
+        if (
+            self.tier > 0
+            and len(self._samples) >= needed
+            and now - self._changed_at >= self.cooldown_s
+            and max(islice(reversed(self._samples), needed)) < self.budget_ms * HEADROOM
+        ):
+            self._set_tier(self.tier - 1, now, stepped_up=True)
+            return True
+        return False
+
+    def _set_tier(self, tier: int, now: float, stepped_up: bool) -> None:
+        log.info("Render quality %s -> %s", TIERS[self.tier], TIERS[tier])
+        self.tier = tier
+        self.changes += 1
+        self._samples.clear()
+        self._changed_at = now
+        self._stepped_up = stepped_up
+
+    def probe_delay_s(self, now: float | None = None) -> float:
+        """Time until the next probe paint: a cooldown after the tier change or last probe."""
+        now = time.monotonic() if now is None else now
+        since = max(self._changed_at, self._probed_at)
+        return max(0.0, self.cooldown_s - (now - since))
+
+    def probed(self, now: float | None = None) -> None:
+        """Marks a probe paint as requested; the next one waits a full cooldown."""
+        self._probed_at = time.monotonic() if now is None else now
+
+    def stats(self) -> dict:
+        return {
+            "tier": self.name,
+            "level": self.tier,
+            "pinned": self.pinned is not None,
+            "budget_ms": self.budget_ms,
+            "changes": self.changes,
+            "cooldown_s": self.cooldown_s,
+        }
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import Callable
+
+from PyQt6.QtCore import QObject
+from PyQt6.QtNetwork import QAbstractSocket, QLocalServer, QLocalSocket
+
+from .ipc import RpcError, instance_running
+
+log = logging.getLogger(__name__)
+
+
+class ResidentServer(QObject):
+    """Line-delimited JSON-RPC 2.0 endpoint of the running instance.
+
+    Requests carrying an ``id`` get one response line back; notifications
+    (no ``id``, as sent by ``pi-menu --show``) are handled silently.
+    """
+
+    def __init__(self, path: Path, handler: Callable[[str, dict], object], parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.handler = handler
+        self._server = QLocalServer(self)
+        self._server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        self._server.newConnection.connect(self._accept)
+        self._buffers: dict[QLocalSocket, bytes] = {}
+
+    def listen(self) -> bool:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self._server.listen(str(self.path)):
+            return True
+        if self._server.serverError() != QAbstractSocket.SocketError.AddressInUseError:
+            log.error("Failed to listen on %s: %s", self.path, self._server.errorString())
+            return False
+        if instance_running():
+            return False
+
+        # The socket file outlived its process (crash, kill -9): reclaim it.
+        QLocalServer.removeServer(str(self.path))
+        if self._server.listen(str(self.path)):
+            return True
+        log.error("Failed to listen on %s: %s", self.path, self._server.errorString())
+        return False
+
+    def close(self) -> None:
+        self._server.close()
+
+    def _accept(self) -> None:
+        while self._server.hasPendingConnections():
+            conn = self._server.nextPendingConnection()
+            self._buffers[conn] = b""
+            conn.readyRead.connect(lambda conn=conn: self._read(conn))
+            conn.disconnected.connect(lambda conn=conn: self._drop(conn))
+
+    def _read(self, conn: QLocalSocket) -> None:
+        data = self._buffers.get(conn, b"") + bytes(conn.readAll())
+        *lines, rest = data.split(b"\n")
+        self._buffers[conn] = rest
+        for line in lines:
+            self._dispatch(conn, line)
+
+    def _drop(self, conn: QLocalSocket) -> None:
+        rest = self._buffers.pop(conn, b"")
+        if conn.bytesAvailable():
+            rest += bytes(conn.readAll())
+        for line in rest.split(b"\n"):
+            self._dispatch(None, line)
+        conn.deleteLater()
+
+    def _dispatch(self, conn: QLocalSocket | None, line: bytes) -> None:
+        if not line.strip():
+            return
+        try:
+            message = json.loads(line)
+        except ValueError:
+            self._respond(conn, None, error=RpcError(RpcError.PARSE_ERROR, "parse error"))
+            return
+        if not isinstance(message, dict) or not isinstance(message.get("method"), str):
+            self._respond(conn, None, error=RpcError(RpcError.INVALID_REQUEST, "invalid request"))
+            return
+
+        params = message.get("params") or {}
+        request_id = message.get("id")
+        if not isinstance(params, dict):
+            self._respond(conn, request_id, error=RpcError(RpcError.INVALID_PARAMS, "params must be an object"))
+            return
+
+        try:
+            result = self.handler(message["method"], params)
+        except RpcError as e:
+            if "id" in message:
+                self._respond(conn, request_id, error=e)
+            return
+        except Exception as e:
+            log.exception("IPC method %s failed", message["method"])
+            if "id" in message:
+                self._respond(conn, request_id, error=RpcError(RpcError.APP_ERROR, str(e)))
+            return
+        if "id" in message:
+            self._respond(conn, request_id, result=result)
+
+    def _respond(self, conn, request_id, result=None, error: RpcError | None = None) -> None:
+        if conn is None or conn.state() != QLocalSocket.LocalSocketState.ConnectedState:
+            return
+        response = {"jsonrpc": "2.0", "id": request_id}
+        if error is not None:
+            response["error"] = {"code": error.code, "message": error.message}
+        else:
+            response["result"] = result
+        conn.write((json.dumps(response, ensure_ascii=False) + "\n").encode())
+        conn.flush()
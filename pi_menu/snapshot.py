@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+from PyQt6.QtCore import QBuffer, QByteArray, QIODevice
+from PyQt6.QtGui import QImage
+
+SNAPSHOT_VERSION = 2
+
+log = logging.getLogger(__name__)
+
+
+class StartupSnapshot:
+    """Last rendered ring state, persisted so the next start can paint before loading anything."""
+
+    def __init__(
+        self,
+        dpr: float,
+        size: tuple[int, int],
+        theme_values: dict,
+        favorites: list[dict],
+        rects: list[tuple[float, float, float, float]],
+        atlas_signature: str | None,
+        static_layer: QImage,
+        plates: dict[bool, QImage],
+    ):
+        self.dpr = dpr
+        self.size = size
+        self.theme_values = theme_values
+        self.favorites = favorites
+        self.rects = rects
+        self.atlas_signature = atlas_signature
+        self.static_layer = static_layer
+        self.plates = plates
+
+    @staticmethod
+    def _paths(directory: Path, dpr: float) -> dict[str, Path]:
+        stem = f"snapshot@{dpr:g}x"
+        return {
+            "index": directory / f"{stem}.json",
+            "static": directory / f"{stem}-static.png",
+            "plate": directory / f"{stem}-plate.png",
+            "plate_hover": directory / f"{stem}-plate-hover.png",
+        }
+
+    def save(self, directory: Path) -> None:
+        paths = self._paths(directory, self.dpr)
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            images = {
+                "static": self.static_layer,
+                "plate": self.plates[False],
+                "plate_hover": self.plates[True],
+            }
+            digests = {}
+            for name, image in images.items():
+                data = _png_bytes(image)
+                if data is None:
+                    return
+                digests[name] = hashlib.sha1(data).hexdigest()
+                _write_atomic(paths[name], data)
+            index = {
+                "version": SNAPSHOT_VERSION,
+                "dpr": self.dpr,
+                "size": list(self.size),
+                "theme": self.theme_values,
+                "favorites": self.favorites,
+                "rects": [list(r) for r in self.rects],
+                "atlas_signature": self.atlas_signature,
+                "images": digests,
+            }
+            # Every file is replaced whole, but not all at once: the index
+            # names the digest of each image it was written with, so a save
+            # cut short anywhere leaves a snapshot that fails to load rather
+            # than one that pairs an index with another save's images.
+            _write_atomic(paths["index"], json.dumps(index, ensure_ascii=False).encode())
+        except OSError as e:
+            log.warning("Failed to save startup snapshot: %s", e)
+
+    @classmethod
+    def load(cls, directory: Path, dpr: float, size: tuple[int, int]) -> StartupSnapshot | None:
+        paths = cls._paths(directory, dpr)
+        try:
+            with open(paths["index"], "r") as f:
+                index = json.load(f)
+        except Exception:
+            return None
+        if (
+            index.get("version") != SNAPSHOT_VERSION
+            or index.get("dpr") != dpr
+            or tuple(index.get("size", ())) != tuple(size)
+            or len(index.get("favorites", [])) != len(index.get("rects", []))
+        ):
+            return None
+
+        images = {}
+        digests = index.get("images", {})
+        for name in ("static", "plate", "plate_hover"):
+            try:
+                data = paths[name].read_bytes()
+            except OSError:
+                return None
+            if hashlib.sha1(data).hexdigest() != digests.get(name):
+                return None
+            image = QImage.fromData(data, "PNG")
+            if image.isNull():
+                return None
+            images[name] = image
+
+        return cls(
+            dpr,
+            size,
+            index.get("theme", {}),
+            index["favorites"],
+            [tuple(r) for r in index["rects"]],
+            index.get("atlas_signature"),
+            images["static"],
+            {False: images["plate"], True: images["plate_hover"]},
+        )
+
+
+def _png_bytes(image: QImage) -> bytes | None:
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    if not image.save(buffer, "PNG"):
+        return None
+    return bytes(data)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+
+from PyQt6.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
+from PyQt6.QtGui import QBrush, QColor, QPen
+
+DEFAULT_THEME = {
+    "background_color": "rgba(30, 30, 40, 200)",
+    "ring_color": "rgba(100, 180, 255, 120)",
+    "ring_accent_color": "rgba(130, 100, 255, 80)",
+    "ring_accent_color_2": "rgba(180, 100, 255, 80)",
+    "ring_glow_color": "rgba(100, 180, 255, 30)",
+    "center_gradient_start": "#667eea",
+    "center_gradient_end": "#764ba2",
+    "center_gradient_edge": "#5a3c8c",
+    "center_border_color": "rgba(255, 255, 255, 100)",
+    "center_text_color": "rgba(255, 255, 255, 230)",
+    "center_symbol_color": "rgba(255, 255, 255, 180)",
+    "icon_bg": "rgba(40, 40, 50, 180)",
+    "icon_bg_hover": "rgba(60, 60, 80, 220)",
+    "icon_border": "rgba(100, 100, 120, 100)",
+    "icon_border_hover": "rgba(100, 180, 255, 150)",
+    "icon_shadow_color": "rgba(0, 0, 0, 80)",
+    "sector_highlight_color": "rgba(100, 180, 255, 40)",
+}
+
+# Render caches that depend on each theme key. A reload only drops the caches
+# whose keys actually changed.
+CACHE_GROUPS = {
+    "background_color": {"static", "dialog"},
+    "ring_color": {"ring", "dialog"},
+    "ring_accent_color": {"ring"},
+    "ring_accent_color_2": {"ring"},
+    "ring_glow_color": {"ring"},
+    "center_gradient_start": {"static"},
+    "center_gradient_end": {"static"},
+    "center_gradient_edge": {"static"},
+    "center_border_color": {"static"},
+    "center_text_color": {"static"},
+    "center_symbol_color": {"static"},
+    "icon_bg": {"items", "dialog"},
+    "icon_bg_hover": {"items", "dialog"},
+    "icon_border": {"items", "dialog"},
+    "icon_border_hover": {"items"},
+    "icon_shadow_color": {"items"},
+    "sector_highlight_color": {"items"},
+}
+
+GLOW_PASSES = 5
+
+_FUNC_COLOR = re.compile(r"rgba?\(\s*([^)]*)\)", re.IGNORECASE)
+
+
+def parse_color(value: str, fallback: str = "#000000") -> QColor:
+    match = _FUNC_COLOR.fullmatch(value.strip())
+    if match:
+        parts = [p.strip() for p in match.group(1).split(",")]
+        try:
+            r, g, b = (int(float(p)) for p in parts[:3])
+            alpha = 255
+            if len(parts) > 3:
+                a = float(parts[3])
+                # CSS-style 0..1 alpha and Qt-style 0..255 alpha are both accepted.
+                alpha = round(a * 255) if a <= 1 and "." in parts[3] else int(a)
+            return QColor(r, g, b, max(0, min(255, alpha)))
+        except ValueError:
+            return QColor(fallback)
+
+    color = QColor.fromString(value.strip())
+    return color if color.isValid() else QColor(fallback)
+
+
+def rgba(color: QColor, alpha: int | None = None) -> str:
+    a = color.alpha() if alpha is None else alpha
+    return f"rgba({color.red()}, {color.green()}, {color.blue()}, {a})"
+
+
+def load_theme_values(theme_path: Path) -> dict:
+    if not theme_path.exists():
+        return dict(DEFAULT_THEME)
+
+    try:
+        with open(theme_path, "r") as f:
+            user_theme = json.load(f)
+    except Exception:
+        return dict(DEFAULT_THEME)
+    if not isinstance(user_theme, dict):
+        return dict(DEFAULT_THEME)
+
+    return {**DEFAULT_THEME, **{k: v for k, v in user_theme.items() if isinstance(v, str)}}
+
+
+class Theme:
+    """theme.json compiled into ready-to-use Qt paint objects."""
+
+    def __init__(self, values: dict):
+        self.values = values
+
+        def color(key: str) -> QColor:
+            return parse_color(values[key], DEFAULT_THEME[key])
+
+        self.background = color("background_color")
+        self.background_brush = QBrush(self.background)
+
+        ring = color("ring_color")
+        accent = color("ring_accent_color")
+        accent_2 = color("ring_accent_color_2")
+        self.ring_stops = [(0.0, ring), (0.25, accent), (0.5, ring), (0.75, accent_2)]
+
+        glow = color("ring_glow_color")
+        step = glow.alpha() / (GLOW_PASSES + 1)
+        self.glow_colors = []
+        for i in range(GLOW_PASSES):
+            c = QColor(glow)
+            c.setAlpha(int(glow.alpha() - i * step))
+            self.glow_colors.append(c)
+
+        self.center_stops = [
+            (0.0, color("center_gradient_start")),
+            (0.7, color("center_gradient_end")),
+            (1.0, color("center_gradient_edge")),
+        ]
+        self.center_pen = QPen(color("center_border_color"), 2)
+        self.center_text = color("center_text_color")
+        self.center_symbol = color("center_symbol_color")
+
+        self.icon_bg = QBrush(color("icon_bg"))
+        self.icon_bg_hover = QBrush(color("icon_bg_hover"))
+        self.icon_pen = QPen(color("icon_border"), 1)
+        self.icon_pen_hover = QPen(color("icon_border_hover"), 1)
+        self.icon_shadow = QBrush(color("icon_shadow_color"))
+        self.sector_brush = QBrush(color("sector_highlight_color"))
+
+        self._dialog_stylesheet: str | None = None
+
+    def changed_groups(self, other: Theme) -> set[str]:
+        groups: set[str] = set()
+        for key, cache_groups in CACHE_GROUPS.items():
+            if self.values.get(key) != other.values.get(key):
+                groups |= cache_groups
+        return groups
+
+    def dialog_stylesheet(self) -> str:
+        if self._dialog_stylesheet is not None:
+            return self._dialog_stylesheet
+
+        background = self.background
+        list_bg = self.icon_bg.color()
+        border = self.icon_pen.color()
+        hover = self.icon_bg_hover.color()
+        accent = self.ring_stops[0][1]
+        self._dialog_stylesheet = f"""
+            QDialog {{
+                background-color: {rgba(background, 240)};
+                color: white;
+            }}
+            QListWidget {{
+                background-color: {rgba(list_bg, 200)};
+                color: white;
+                border: 1px solid {rgba(border)};
+                border-radius: 8px;
+            }}
+            QListWidget::item {{
+                padding: 8px;
+            }}
+            QListWidget::item:hover {{
+                background-color: {rgba(hover, 200)};
+            }}
+            QPushButton {{
+                background-color: {rgba(accent, 180)};
+                color: white;
+                border: none;
+                border-radius: 8px;
+                padding: 10px 20px;
+                font-weight: bold;
+            }}
+            QPushButton:hover {{
+                background-color: {rgba(accent, 220)};
+            }}
+            """
+        return self._dialog_stylesheet
+
+
+def load_theme(theme_path: Path) -> Theme:
+    return Theme(load_theme_values(theme_path))
+
+
+class ThemeWatcher(QObject):
+    """Recompiles the theme when theme.json changes and reports which caches went stale."""
+
+    theme_changed = pyqtSignal(object, object)  # (Theme, set of cache groups)
+
+    def __init__(self, theme_path: Path, theme: Theme, parent=None):
+        super().__init__(parent)
+        self.theme_path = theme_path
+        self.theme = theme
+        self._watcher = QFileSystemWatcher(self)
+        # Editors often replace the file atomically; watching the directory keeps
+        # the watch alive and also catches theme.json being created later.
+        self._watch_paths()
+        self._watcher.fileChanged.connect(self._schedule_reload)
+        self._watcher.directoryChanged.connect(self._schedule_reload)
+
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(150)
+        self._reload_timer.timeout.connect(self.reload)
+
+    def _watch_paths(self) -> None:
+        paths = [str(self.theme_path.parent)] if self.theme_path.parent.exists() else []
+        if self.theme_path.exists():
+            paths.append(str(self.theme_path))
+        watched = set(self._watcher.files()) | set(self._watcher.directories())
+        missing = [p for p in paths if p not in watched]
+        if missing:
+            self._watcher.addPaths(missing)
+
+    def _schedule_reload(self, _path: str) -> None:
+        self._reload_timer.start()
+
+    def reload(self) -> None:
+        self._watch_paths()
+        values = load_theme_values(self.theme_path)
+        if values == self.theme.values:
+            return
+        theme = Theme(values)
+        groups = theme.changed_groups(self.theme)
+        self.theme = theme
+        self.theme_changed.emit(theme, groups)
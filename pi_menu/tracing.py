@@ -0,0 +1,123 @@
+"""Runtime hot-path tracing.
+
+Spans are recorded into a fixed-size ring buffer only while tracing is on
+(``PI_MENU_TRACE=1``, ``pi-menu-ctl trace action=start`` or Ctrl+Shift+T in the
+menu); otherwise ``span()`` hands back a shared no-op context manager. The
+buffer is dumped on demand as a Chrome trace-event file, like the startup
+profile.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+from .profiling import app_version, trace_event, write_trace
+
+ENV_VAR = "PI_MENU_TRACE"
+DEFAULT_CAPACITY = 20000
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("events", "name", "args", "start")
+
+    def __init__(self, events: deque, name: str, args: dict | None):
+        self.events = events
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        # deque.append is atomic, so spans from worker threads need no lock.
+        self.events.append((self.name, self.start, end - self.start, threading.get_ident(), self.args))
+        return False
+
+
+class Tracer:
+    """Ring buffer of (name, start, duration, thread, args) spans in perf_counter seconds."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.origin = time.perf_counter()
+        self.enabled = os.environ.get(ENV_VAR, "") not in ("", "0")
+        self.capacity = capacity
+        self._events: deque = deque(maxlen=capacity)
+
+    def start(self) -> None:
+        self.enabled = True
+
+    def stop(self) -> None:
+        self.enabled = False
+
+    def clear(self) -> None:
+        self._events.clear()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def span(self, name: str, **args):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self._events, name, args or None)
+
+    def instant(self, name: str, **args) -> None:
+        if self.enabled:
+            self._events.append((name, time.perf_counter(), None, threading.get_ident(), args or None))
+
+    def traced(self, fn):
+        """Decorator: one span per call, named after the function's qualname."""
+        name = fn.__qualname__
+        events = self._events
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not self.enabled:
+                return fn(*args, **kwargs)
+            with _Span(events, name, None):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    def trace_events(self) -> list[dict]:
+        events = []
+        for name, start, dur, tid, args in list(self._events):
+            events.append(
+                trace_event(
+                    name,
+                    (start - self.origin) * 1e6,
+                    dur * 1e6 if dur is not None else None,
+                    tid,
+                    "runtime",
+                    args,
+                )
+            )
+        return events
+
+    def dump(self, directory: Path) -> Path:
+        path = directory / f"trace-{time.strftime('%Y%m%d-%H%M%S')}.json"
+        metadata = {"version": app_version(), "capacity": self.capacity}
+        write_trace(path, self.trace_events(), metadata)
+        return path
+
+
+tracer = Tracer()
@@ -0,0 +1,243 @@
+"""GUI-thread stall watchdog.
+
+A QTimer on the GUI thread stamps a heartbeat; a daemon thread notices when
+the stamp goes stale for longer than the threshold and samples the main
+thread's Python stack with ``sys._current_frames()`` while the stall lasts.
+Both sleep while the menu is hidden, so an idle resident process is not
+woken every few tens of milliseconds.
+Each stall is appended as one JSON line to a rotating log, summarised with
+
+    python -m pi_menu.watchdog report [--top 10]
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import logging.handlers
+import os
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+
+from .core.paths import logs_dir
+from .tracing import tracer
+
+ENV_VAR = "PI_MENU_WATCHDOG"
+HEARTBEAT_MS = 50
+STALL_THRESHOLD_MS = 100
+MAX_SAMPLES = 8
+# Gaps this long are a suspended machine, not a stalled loop.
+SUSPEND_S = 60.0
+LOG_BYTES = 512 * 1024
+LOG_BACKUPS = 3
+
+_PACKAGE_DIR = str(Path(__file__).resolve().parent)
+
+log = logging.getLogger(__name__)
+
+
+def stall_log_path() -> Path:
+    return logs_dir() / "stalls.log"
+
+
+def _format_frame(frame: traceback.FrameSummary) -> str:
+    filename = frame.filename
+    if filename.startswith(_PACKAGE_DIR):
+        filename = "pi_menu" + filename[len(_PACKAGE_DIR):]
+    return f"{filename}:{frame.lineno} in {frame.name}"
+
+
+def _location(stack: list[traceback.FrameSummary]) -> str:
+    # The innermost frame of our own code is what to fix, even when the time
+    # is spent inside Qt or the standard library below it.
+    for frame in reversed(stack):
+        if frame.filename.startswith(_PACKAGE_DIR):
+            return _format_frame(frame)
+    return _format_frame(stack[-1]) if stack else "<no Python frame>"
+
+
+class StallWatchdog:
+    """Records GUI-thread stalls longer than threshold_ms with their stacks."""
+
+    def __init__(
+        self,
+        log_path: Path,
+        threshold_ms: int = STALL_THRESHOLD_MS,
+        heartbeat_ms: int = HEARTBEAT_MS,
+    ):
+        self.log_path = log_path
+        self.threshold_s = threshold_ms / 1000
+        self.heartbeat_s = heartbeat_ms / 1000
+        self.count = 0
+        self.worst_ms = 0.0
+        self._last_beat = time.monotonic()
+        self._stop = threading.Event()
+        self._active = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._timer = None
+        self._logger: logging.Logger | None = None
+
+    @staticmethod
+    def enabled_by_env() -> bool:
+        return os.environ.get(ENV_VAR, "1") not in ("", "0")
+
+    def start(self, parent=None, active: bool = True) -> None:
+        from PyQt6.QtCore import Qt, QTimer
+
+        self._logger = self._open_log()
+        self._timer = QTimer(parent)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.setInterval(round(self.heartbeat_s * 1000))
+        self._timer.timeout.connect(self._beat)
+        self._thread = threading.Thread(target=self._run, name="pi-menu-watchdog", daemon=True)
+        self._thread.start()
+        self.set_active(active)
+
+    def set_active(self, active: bool) -> None:
+        """Watch only while there is a window to stall; call on show and hide."""
+        if self._timer is None or active == self._active.is_set():
+            return
+        if active:
+            self._beat()
+            self._timer.start()
+            self._active.set()
+        else:
+            # Cleared before the heartbeat stops, so the thread never reads
+            # the silence as a stall.
+            self._active.clear()
+            self._timer.stop()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._active.set()
+        if self._timer is not None:
+            self._timer.stop()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+        if self._logger is not None:
+            for handler in self._logger.handlers:
+                handler.close()
+
+    def _open_log(self) -> logging.Logger:
+        # A private logger: stall records are JSON lines, not application log text.
+        logger = logging.getLogger("pi_menu.watchdog.stalls")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        if not logger.handlers:
+            try:
+                self.log_path.parent.mkdir(parents=True, exist_ok=True)
+                handler = logging.handlers.RotatingFileHandler(
+                    self.log_path, maxBytes=LOG_BYTES, backupCount=LOG_BACKUPS, encoding="utf-8"
+                )
+            except OSError as e:
+                log.warning("Failed to open stall log: %s", e)
+                handler = logging.NullHandler()
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger.addHandler(handler)
+        return logger
+
+    def _beat(self) -> None:
+        self._last_beat = time.monotonic()
+
+    def _run(self) -> None:
+        main_id = threading.main_thread().ident
+        poll_s = self.threshold_s / 4
+        stalled_beat = None
+        samples: list[list[traceback.FrameSummary]] = []
+        last_sample = 0.0
+
+        while not self._stop.is_set():
+            if not self._active.is_set():
+                stalled_beat = None
+                self._active.wait()
+                continue
+            if self._stop.wait(poll_s) or not self._active.is_set():
+                continue
+            beat = self._last_beat
+            now = time.monotonic()
+            overdue = now - beat - self.heartbeat_s
+            if overdue >= self.threshold_s:
+                if stalled_beat != beat:
+                    stalled_beat = beat
+                    samples = []
+                    last_sample = 0.0
+                if len(samples) < MAX_SAMPLES and now - last_sample >= self.threshold_s:
+                    frame = sys._current_frames().get(main_id)
+                    if frame is not None:
+                        samples.append(traceback.extract_stack(frame))
+                        last_sample = now
+                    del frame
+            elif stalled_beat is not None:
+                duration = beat - stalled_beat - self.heartbeat_s
+                if duration < SUSPEND_S:
+                    self._record(duration, samples)
+                stalled_beat = None
+
+    def _record(self, duration_s: float, samples: list[list[traceback.FrameSummary]]) -> None:
+        duration_ms = round(duration_s * 1000, 1)
+        self.count += 1
+        self.worst_ms = max(self.worst_ms, duration_ms)
+        stack = samples[0] if samples else []
+        tracer.instant("GUI stall", duration_ms=duration_ms)
+        if self._logger is None:
+            return
+        entry = {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "duration_ms": duration_ms,
+            "location": _location(stack),
+            "stack": [_format_frame(frame) for frame in stack],
+            # Later samples show whether the stall moved on to other code.
+            "locations": list(dict.fromkeys(_location(sample) for sample in samples)),
+        }
+        self._logger.info(json.dumps(entry, ensure_ascii=False))
+
+
+def read_stalls(log_path: Path) -> list[dict]:
+    entries = []
+    paths = [log_path.with_name(f"{log_path.name}.{i}") for i in range(LOG_BACKUPS, 0, -1)]
+    for path in [*paths, log_path]:
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        continue
+        except OSError:
+            continue
+    return entries
+
+
+def report(entries: list[dict], top: int = 10) -> str:
+    if not entries:
+        return "No stalls recorded."
+    groups: dict[str, list[dict]] = {}
+    for entry in entries:
+        groups.setdefault(entry.get("location", "?"), []).append(entry)
+    ranked = sorted(groups.items(), key=lambda item: sum(e["duration_ms"] for e in item[1]), reverse=True)
+
+    total = sum(e["duration_ms"] for e in entries)
+    lines = [f"{len(entries)} stalls, {total / 1000:.2f} s blocked in total", ""]
+    lines.append(f"{'count':>5} {'total ms':>9} {'max ms':>8}  location")
+    for location, group in ranked[:top]:
+        durations = [e["duration_ms"] for e in group]
+        lines.append(f"{len(group):5} {sum(durations):9.0f} {max(durations):8.0f}  {location}")
+
+    worst = max(entries, key=lambda e: e["duration_ms"])
+    lines += ["", f"worst stall: {worst['duration_ms']:.0f} ms at {worst.get('time', '?')}"]
+    lines += [f"  {frame}" for frame in worst.get("stack", [])]
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m pi_menu.watchdog")
+    parser.add_argument("command", choices=["report"])
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--log", type=Path, default=None)
+    args = parser.parse_args()
+    print(report(read_stalls(args.log or stall_log_path()), args.top))
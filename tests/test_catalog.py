@@ -0,0 +1,50 @@
+from pi_menu.core.catalog import (
+    DEFAULT_PROFILE,
+    entry_key,
+    folder_apps,
+    profile_apps,
+    profile_names,
+)
+
+SAFARI = {"name": "Safari", "command": "open /Applications/Safari.app", "favorite": True}
+XCODE = {"name": "Xcode", "command": "open /Applications/Xcode.app"}
+TERMINAL = {"name": "Terminal", "command": "open -a Terminal", "favorite": True}
+DEV = {"name": "Dev", "folder": ["open /Applications/Xcode.app", {"name": "Logs", "command": "open -a Console"}]}
+
+
+def config(**extra):
+    return {"apps": [SAFARI, XCODE, TERMINAL, DEV], **extra}
+
+
+def test_entry_key():
+    assert entry_key(SAFARI) == "open /Applications/Safari.app"
+    assert entry_key(DEV) == "folder:Dev"
+
+
+def test_folder_apps_resolves_commands_and_keeps_inline_entries():
+    children = folder_apps(DEV, config()["apps"])
+    assert children == [XCODE, {"name": "Logs", "command": "open -a Console"}]
+
+
+def test_folder_apps_skips_unknown_commands():
+    folder = {"name": "F", "folder": ["open /Applications/Missing.app", 42]}
+    assert folder_apps(folder, config()["apps"]) == []
+
+
+def test_profile_names_start_with_the_default():
+    data = config(profiles={"ops": [], DEFAULT_PROFILE: [], "meet": []})
+    assert profile_names(data) == [DEFAULT_PROFILE, "ops", "meet"]
+    assert profile_names(config()) == [DEFAULT_PROFILE]
+
+
+def test_default_profile_is_the_favorites():
+    assert profile_apps(config(), DEFAULT_PROFILE) == [SAFARI, TERMINAL]
+
+
+def test_profile_apps_keeps_profile_order_and_matches_keys_or_names():
+    data = config(profiles={"ops": ["Terminal", "folder:Dev", "Nope", "open /Applications/Xcode.app"]})
+    assert profile_apps(data, "ops") == [TERMINAL, DEV, XCODE]
+
+
+def test_unknown_profile_falls_back_to_the_favorites():
+    assert profile_apps(config(), "missing") == [SAFARI, TERMINAL]
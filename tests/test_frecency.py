@@ -0,0 +1,56 @@
+import pytest
+
+from pi_menu.core.frecency import HALF_LIFE_S, MAX_ENTRIES, Frecency
+
+NOW = 1_700_000_000.0
+
+
+def test_score_halves_every_half_life():
+    frecency = Frecency()
+    frecency.record("a", now=NOW)
+    assert frecency.score("a", now=NOW) == pytest.approx(1.0)
+    assert frecency.score("a", now=NOW + HALF_LIFE_S) == pytest.approx(0.5)
+    assert frecency.score("missing", now=NOW) == 0.0
+
+
+def test_ranked_weighs_frequency_against_recency():
+    frecency = Frecency()
+    for _ in range(3):
+        frecency.record("often", now=NOW - 2 * HALF_LIFE_S)
+    frecency.record("recent", now=NOW)
+    frecency.record("old", now=NOW - 4 * HALF_LIFE_S)
+    # often: 3 / 4 = 0.75, recent: 1, old: 1 / 16
+    assert frecency.ranked(now=NOW) == ["recent", "often", "old"]
+    frecency.record("often", now=NOW)
+    assert frecency.ranked(now=NOW) == ["often", "recent", "old"]
+
+
+def test_record_drops_the_lowest_score_past_the_limit():
+    frecency = Frecency()
+    frecency.record("stale", now=NOW - 10 * HALF_LIFE_S)
+    for i in range(MAX_ENTRIES):
+        frecency.record(f"app{i}", now=NOW)
+    assert len(frecency) == MAX_ENTRIES
+    assert "stale" not in frecency.ranked(now=NOW)
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = tmp_path / "frecency.json"
+    frecency = Frecency()
+    frecency.record("a", now=NOW)
+    frecency.record("b", now=NOW)
+    frecency.record("b", now=NOW)
+    frecency.save(path)
+    loaded = Frecency.load(path)
+    assert loaded.ranked(now=NOW) == ["b", "a"]
+    assert loaded.score("b", now=NOW) == pytest.approx(2.0)
+
+
+def test_load_tolerates_missing_and_damaged_files(tmp_path):
+    assert len(Frecency.load(tmp_path / "missing.json")) == 0
+    damaged = tmp_path / "damaged.json"
+    damaged.write_text("{not json")
+    assert len(Frecency.load(damaged)) == 0
+    partial = tmp_path / "partial.json"
+    partial.write_text('{"launches": {"a": [1, 2], "b": "x", "c": [1]}}')
+    assert Frecency.load(partial).ranked(now=NOW) == ["a"]
@@ -0,0 +1,46 @@
+import plistlib
+
+import pytest
+
+from pi_menu import icon_system
+from pi_menu.generate_configfile import get_mac_apps
+from pi_menu.icon_system import IconSystem
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    IconSystem.clear_cache()
+    yield
+    IconSystem.clear_cache()
+
+
+def test_classify_catalog_uses_stored_bundle_ids_without_reading_files(monkeypatch):
+    def no_reads(bundle):
+        raise AssertionError(f"read {bundle}")
+
+    monkeypatch.setattr(icon_system, "read_info_plist", no_reads)
+    apps = [
+        {
+            "name": "Editor",
+            "command": "open /Applications/Editor.app",
+            "bundle_id": "com.jetbrains.foo",
+        },
+        {"name": "Slack", "command": "open /Applications/Slack.app"},
+        {"name": "Thing", "command": "open /Applications/Thing.app"},
+    ]
+    infos = IconSystem.classify_catalog(apps)
+    assert [info["category"] for info in infos] == ["development", "communication", "default"]
+
+
+def test_get_mac_apps_records_bundle_ids(tmp_path):
+    contents = tmp_path / "Browser.app" / "Contents"
+    contents.mkdir(parents=True)
+    with open(contents / "Info.plist", "wb") as f:
+        plistlib.dump({"CFBundleIdentifier": "org.mozilla.firefox"}, f)
+    (tmp_path / "Bare.app").mkdir()
+
+    apps = {app["name"]: app for app in get_mac_apps(tmp_path)}
+    assert apps["Browser"]["bundle_id"] == "org.mozilla.firefox"
+    assert apps["Bare"]["bundle_id"] == ""
+    assert IconSystem.bundle_id_for_app(apps["Bare"]) is None
+    assert IconSystem.classify_catalog([apps["Browser"]])[0]["category"] == "browser"
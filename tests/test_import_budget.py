@@ -0,0 +1,10 @@
+import pytest
+
+from benchmarks import import_budget
+
+
+@pytest.mark.parametrize("module", import_budget.QT_FREE_MODULES)
+def test_module_imports_without_qt_within_budget(module):
+    probe = import_budget.measure(module)
+    assert probe["qt"] == []
+    assert probe["ms"] < import_budget.BUDGET_MS
@@ -0,0 +1,44 @@
+import math
+
+import pytest
+
+from pi_menu.core.layout import gesture_index, ring_angle, ring_index, ring_positions
+
+
+def test_first_item_is_at_twelve_oclock():
+    assert ring_angle(0, 6) == pytest.approx(-math.pi / 2)
+
+
+@pytest.mark.parametrize("count", [1, 2, 5, 8, 12])
+def test_ring_index_inverts_ring_angle(count):
+    for index in range(count):
+        angle = ring_angle(index, count)
+        assert ring_index(math.cos(angle), math.sin(angle), count) == index
+
+
+def test_ring_index_picks_the_nearest_sector():
+    # Four items at 12, 3, 6 and 9 o'clock; y grows downwards.
+    assert ring_index(0.2, -1.0, 4) == 0
+    assert ring_index(1.0, 0.3, 4) == 1
+    assert ring_index(-0.1, 1.0, 4) == 2
+    assert ring_index(-1.0, -0.4, 4) == 3
+
+
+def test_gesture_selects_only_past_the_threshold():
+    assert gesture_index(0, -19, 4, 20) is None
+    assert gesture_index(0, -20, 4, 20) == 0
+    assert gesture_index(30, 5, 4, 20) == 1
+    assert gesture_index(30, 5, 0, 20) is None
+
+
+def test_ring_positions_are_top_left_corners_on_the_circle():
+    positions = ring_positions(4, 250, 250, 160, 64)
+    assert len(positions) == 4
+    for index, (x, y) in enumerate(positions):
+        angle = ring_angle(index, 4)
+        assert x + 32 == pytest.approx(250 + 160 * math.cos(angle))
+        assert y + 32 == pytest.approx(250 + 160 * math.sin(angle))
+
+
+def test_ring_positions_empty():
+    assert ring_positions(0, 250, 250, 160, 64) == []
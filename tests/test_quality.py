@@ -0,0 +1,50 @@
+import pytest
+
+from pi_menu.quality import COOLDOWN_S, DOWN_MISSES, FRAME_BUDGET_MS, TIERS, QualityController
+
+NOW = 1_000.0
+
+
+def drive_to(tier: str, now: float = NOW) -> QualityController:
+    quality = QualityController()
+    while quality.name != tier:
+        for _ in range(DOWN_MISSES):
+            quality.record(FRAME_BUDGET_MS * 2, now=now)
+    return quality
+
+
+def test_misses_step_down_one_tier_at_a_time():
+    quality = QualityController()
+    for _ in range(DOWN_MISSES - 1):
+        assert not quality.record(FRAME_BUDGET_MS * 2, now=NOW)
+    assert quality.record(FRAME_BUDGET_MS * 2, now=NOW)
+    assert quality.name == TIERS[1]
+    assert quality.changes == 1
+
+
+def test_static_steps_up_on_one_fast_probe_after_the_cooldown():
+    quality = drive_to("static")
+    assert not quality.animation
+    assert not quality.record(1.0, now=NOW + COOLDOWN_S / 2)
+    assert quality.record(1.0, now=NOW + COOLDOWN_S)
+    assert quality.name == TIERS[-2]
+
+
+def test_probes_are_spaced_a_cooldown_apart():
+    quality = drive_to("static")
+    assert quality.probe_delay_s(now=NOW) == pytest.approx(COOLDOWN_S)
+    # Long after the tier change, a slow probe must not bring the next one
+    # forward to "now".
+    later = NOW + 10 * COOLDOWN_S
+    assert quality.probe_delay_s(now=later) == 0.0
+    quality.probed(now=later)
+    quality.record(FRAME_BUDGET_MS * 2, now=later)
+    assert quality.probe_delay_s(now=later) == pytest.approx(COOLDOWN_S)
+    assert quality.probe_delay_s(now=later + COOLDOWN_S / 2) == pytest.approx(COOLDOWN_S / 2)
+
+
+def test_pinned_tier_never_changes():
+    quality = QualityController(pinned="no-shadows")
+    for _ in range(DOWN_MISSES * 2):
+        assert not quality.record(FRAME_BUDGET_MS * 2, now=NOW)
+    assert quality.name == "no-shadows"